@@ -1,13 +1,9 @@
 """Contains show related classes."""
 from functools import partial
-import tempfile
-import hashlib
-import os
-import pickle
-import errno
 import re
 
 from mpf.core.assets import Asset, AssetPool
+from mpf.core.config_processor import ConfigProcessor
 from mpf.core.file_manager import FileManager
 from mpf.core.utility_functions import Util
 from mpf.file_interfaces.yaml_interface import YamlInterface
@@ -110,6 +106,14 @@ class Show(Asset):
         self.show_steps = list()
 
         if not data and self.file:
+            show_steps = self.machine.show_controller.show_cache.get_steps(self.file)
+            if show_steps is not None:
+                # steps are already validated and shared. do not modify them.
+                self.show_steps = show_steps
+                self.total_steps = len(self.show_steps)
+                self._get_tokens()
+                return
+
             data = self.load_show_from_disk()
 
         # Pylint complains about the change from dict to list. This is intended and fine.
@@ -171,6 +175,9 @@ class Show(Asset):
         if self.total_steps == 0:   # pragma: no cover
             self._show_validation_error("Show is empty")
 
+        if self.file:
+            self.machine.show_controller.show_cache.put_steps(self.file, self.show_steps)
+
         self._get_tokens()
 
     def _show_validation_error(self, msg):  # pragma: no cover
@@ -389,18 +396,23 @@ class Show(Asset):
 
         return running_show
 
-    @staticmethod
-    def _get_mpfcache_file_name(file_name):
-        cache_dir = tempfile.gettempdir()
-        path_hash = str(hashlib.md5(bytes(file_name, 'UTF-8')).hexdigest())
-        result = os.path.join(cache_dir, path_hash)
-        return result + ".mpf_cache"
-
     def load_show_from_disk(self):
-        """Load show from disk."""
-        return self.machine.config_processor.load_config_files_with_cache(
-            [self.file], "show", load_from_cache=not self.machine.options['no_load_cache'],
-            store_to_cache=self.machine.options['create_config_cache'])
+        """Load show from disk.
+
+        Parsed shows are kept in the shared show cache of the show controller.
+        """
+        show_cache = self.machine.show_controller.show_cache
+        if not self.machine.options['no_load_cache']:
+            data = show_cache.get_parsed(self.file)
+            if data is not None:
+                return data
+
+        data = FileManager.load(self.file, ConfigProcessor.get_expected_version("show"), True)
+
+        if self.machine.options['create_config_cache'] and data:
+            show_cache.put_parsed(self.file, data)
+
+        return data
 
 
 # This class is more or less a container
@@ -0,0 +1 @@
+"""Micro benchmarks for MPF core components."""
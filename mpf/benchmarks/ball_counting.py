@@ -0,0 +1,120 @@
+"""Benchmark counting balls in a 6 ball trough while balls drain during multiball.
+
+Compares full recounts of all switches on every settle timer (like SwitchCounter used to do) with the incremental
+SwitchSettleTracker. Run with ``python -m mpf.benchmarks.ball_counting``.
+"""
+import heapq
+import random
+import sys
+import time
+
+from mpf.benchmarks.suite import benchmark
+from mpf.devices.ball_device.switch_counter import SwitchSettleTracker
+
+SWITCHES = ["s_trough{}".format(i) for i in range(6)]
+ENTRANCE_DELAY = .5
+EXIT_DELAY = .5
+
+
+def _create_drain_edges(drains):
+    """Return switch edges (time, switch, state) of balls draining into the trough with switch bounces."""
+    rand = random.Random(42)
+    edges = []
+    now = 0.0
+    for _ in range(drains):
+        # a ball rolls over all switches and bounces on each of them
+        for switch in SWITCHES:
+            for _ in range(3):
+                edges.append((now, switch, 1))
+                now += rand.uniform(.005, .03)
+                edges.append((now, switch, 0))
+                now += rand.uniform(.005, .03)
+        # it comes to rest on the last switch and gets ejected again
+        edges.append((now, SWITCHES[-1], 1))
+        now += rand.uniform(.1, 1)
+        edges.append((now, SWITCHES[-1], 0))
+        now += rand.uniform(.1, 1)
+    return edges
+
+
+class _SwitchStates(object):
+
+    """Switch states with the same timing checks as the switch controller."""
+
+    def __init__(self, now):
+        """Initialise all switches inactive since boot."""
+        self.now = now
+        self.states = {switch: (0, -100000) for switch in SWITCHES}
+
+    def is_state(self, switch_name, state, ms=0):
+        """Return true if switch is in state for at least ms."""
+        switch_state, change_time = self.states[switch_name]
+        return switch_state == state and ms <= round((self.now - change_time) * 1000.0, 0)
+
+
+def bench_full_recount(edges):
+    """Recount all switches whenever a timed switch handler fires. Return duration and number of counts."""
+    switches = _SwitchStates(0)
+    timers = []
+    pending = {}
+    counts = 0
+    start = time.perf_counter()
+    for edge_time, switch, state in edges:
+        while timers and timers[0][0] <= edge_time:
+            switches.now, timed_switch = heapq.heappop(timers)
+            if pending.get(timed_switch) != switches.now:
+                # timed handler was cancelled
+                continue
+            del pending[timed_switch]
+            # count all switches and give up if any of them is not stable
+            balls = []
+            for name in SWITCHES:
+                if switches.is_state(name, 1, int(ENTRANCE_DELAY * 1000)):
+                    balls.append(name)
+                elif not switches.is_state(name, 0, int(EXIT_DELAY * 1000)):
+                    break
+            else:
+                counts += 1
+        switches.now = edge_time
+        switches.states[switch] = (state, edge_time)
+        # changing the state cancels the timed handler of the other state
+        pending[switch] = edge_time + (ENTRANCE_DELAY if state else EXIT_DELAY)
+        heapq.heappush(timers, (pending[switch], switch))
+    return time.perf_counter() - start, counts
+
+
+def bench_settle_tracker(edges):
+    """Track switches incrementally and count once all settled. Return duration and number of counts."""
+    tracker = SwitchSettleTracker(SWITCHES, ENTRANCE_DELAY, EXIT_DELAY)
+    for switch in SWITCHES:
+        tracker.set_state(switch, 0, -100000)
+    counts = 0
+    start = time.perf_counter()
+    next_deadline = None
+    for edge_time, switch, state in edges:
+        while next_deadline is not None and next_deadline <= edge_time:
+            if tracker.settle(next_deadline) and tracker.is_stable:
+                counts += 1
+            next_deadline = tracker.next_deadline
+        tracker.set_state(switch, state, edge_time)
+        next_deadline = tracker.next_deadline
+    return time.perf_counter() - start, counts
+
+
+@benchmark("ball_counting.settle_tracker", 2000)
+def bench_suite_settle_tracker(drains):
+    """Count balls in a trough with the settle tracker. Reports switch edges per second."""
+    edges = _create_drain_edges(drains)
+    return bench_settle_tracker(edges)[0], len(edges)
+
+
+def main(drains=20000):
+    """Run benchmarks and print results."""
+    edges = _create_drain_edges(drains)
+    for name, bench in (("full recount", bench_full_recount), ("settle tracker", bench_settle_tracker)):
+        duration, _ = bench(edges)
+        print("{:<20} {:>10.0f} ops/s".format(name, len(edges) / duration))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,34 @@
+"""Benchmark encoding and decoding BCP commands.
+
+Run with ``python -m mpf.benchmarks.suite "bcp.*"``.
+"""
+import time
+
+from mpf.core.bcp.bcp_socket_client import encode_command_string, decode_command_string
+from mpf.benchmarks.suite import benchmark, main
+
+KWARGS = {"name": "score", "value": 123450, "prev_value": 12000, "change": 111450, "player_num": 1,
+          "text": "Hello World & more", "enabled": True}
+
+
+@benchmark("bcp.encode", 10000)
+def bench_encode(count):
+    """Encode a player_variable command with typed parameters."""
+    start = time.perf_counter()
+    for _ in range(count):
+        encode_command_string("player_variable", **KWARGS)
+    return time.perf_counter() - start
+
+
+@benchmark("bcp.decode", 10000)
+def bench_decode(count):
+    """Decode a player_variable command with typed parameters."""
+    bcp_string = encode_command_string("player_variable", **KWARGS)
+    start = time.perf_counter()
+    for _ in range(count):
+        decode_command_string(bcp_string)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main(["bcp.*"])
@@ -0,0 +1,52 @@
+"""Macro benchmarks which boot test machines and simulate games.
+
+Run with ``python -m mpf.benchmarks.suite macro``.
+"""
+import time
+
+from mpf.benchmarks.machine import boot_machine, shutdown_machine
+from mpf.benchmarks.suite import benchmark, main
+
+# machine folder and config file of machines to boot
+BOOT_MACHINES = [
+    ("auditor", "config.yaml"),
+    ("ball_device", "test_ball_device.yaml"),
+    ("event_players", "test_event_player.yaml"),
+    ("game", "config.yaml"),
+    ("light", "light.yaml"),
+    ("mode_tests", "test_modes.yaml"),
+    ("shows", "test_shows.yaml"),
+    ("switch_controller", "config.yaml"),
+]
+
+
+def _create_boot_benchmark(machine_name, config_file):
+    def _boot(count):
+        duration = 0.0
+        for _ in range(count):
+            start = time.perf_counter()
+            machine = boot_machine(machine_name, config_file)
+            duration += time.perf_counter() - start
+            shutdown_machine(machine)
+        return duration
+
+    _boot.__doc__ = "Boot {} with {} (using the config cache after the first boot).".format(machine_name, config_file)
+    return _boot
+
+
+for _machine_name, _config_file in BOOT_MACHINES:
+    benchmark("boot.{}".format(_machine_name), 3, group="macro")(_create_boot_benchmark(_machine_name, _config_file))
+
+
+@benchmark("game.simulated", 1, group="macro")
+def bench_simulated_game(count):
+    """Simulate ten minutes of random games on the auditor machine. Reports events per second."""
+    machine = boot_machine("auditor", simulator_config={"duration": 600 * count, "seed": 42})
+    start = time.perf_counter()
+    machine.run_simulation()
+    duration = time.perf_counter() - start
+    return duration, machine.simulator.stats["events"]
+
+
+if __name__ == "__main__":
+    main(["macro"])
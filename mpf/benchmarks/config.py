@@ -0,0 +1,48 @@
+"""Benchmark loading and validating config files.
+
+Run with ``python -m mpf.benchmarks.suite "config.*"``.
+"""
+import os
+import time
+
+from mpf.benchmarks.machine import boot_machine, shutdown_machine, MPF_PATH
+from mpf.benchmarks.suite import benchmark, main
+from mpf.file_interfaces.yaml_interface import YamlInterface
+
+
+@benchmark("config.yaml_load", 10)
+def bench_yaml_load(count):
+    """Parse mpfconfig.yaml with the MPF yaml loader."""
+    with open(os.path.join(MPF_PATH, "mpfconfig.yaml")) as f:
+        data = f.read()
+
+    start = time.perf_counter()
+    for _ in range(count):
+        YamlInterface.process(data)
+    return time.perf_counter() - start
+
+
+@benchmark("config.validate", 5000)
+def bench_validate(count):
+    """Validate switch configs against the config spec."""
+    machine = boot_machine("switch_controller")
+    try:
+        source = {
+            "number": "12",
+            "type": "NC",
+            "debounce": "quick",
+            "ignore_window_ms": "100ms",
+            "events_when_activated": "bench_active|100ms, bench_active2",
+            "events_when_deactivated": "bench_inactive",
+        }
+        validator = machine.config_validator
+        start = time.perf_counter()
+        for i in range(count):
+            validator.validate_config("switches", dict(source), "s_bench{}".format(i))
+        return time.perf_counter() - start
+    finally:
+        shutdown_machine(machine)
+
+
+if __name__ == "__main__":
+    main(["config.*"])
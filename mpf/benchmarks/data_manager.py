@@ -0,0 +1,38 @@
+"""Benchmark saving data like the writing thread of the DataManager does.
+
+Run with ``python -m mpf.benchmarks.suite "data_manager.*"``.
+"""
+import copy
+import os
+import tempfile
+import time
+
+from mpf.benchmarks.suite import benchmark, main
+from mpf.core.file_manager import FileManager
+
+
+def _create_audit_data():
+    """Return data which looks like the audits of a machine after a few games."""
+    return {
+        "switches": {"s_switch{}".format(i): i * 17 for i in range(100)},
+        "events": {"event{}".format(i): i * 3 for i in range(50)},
+        "player": {"score": {"top": [1000000 - i * 10000 for i in range(10)], "average": 123456.7, "total": 10}},
+        "missing_switches": ["s_switch{}".format(i) for i in range(0, 100, 10)],
+    }
+
+
+@benchmark("data_manager.save", 50)
+def bench_save(count):
+    """Copy audit data and write it to a yaml file."""
+    data = _create_audit_data()
+    with tempfile.TemporaryDirectory() as path:
+        filename = os.path.join(path, "audits.yaml")
+        start = time.perf_counter()
+        for i in range(count):
+            data["switches"]["s_switch{}".format(i % 100)] += 1
+            FileManager.save(filename, copy.deepcopy(data))
+        return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main(["data_manager.*"])
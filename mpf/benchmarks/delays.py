@@ -0,0 +1,98 @@
+"""Benchmark adding and cancelling delays on the timer wheel and on the asyncio loop.
+
+Run with ``python -m mpf.benchmarks.delays``.
+"""
+import asyncio
+import sys
+import time
+import uuid
+from functools import partial
+
+from mpf.benchmarks.suite import benchmark
+from mpf.core.clock import TimerWheel
+
+
+def _callback(*args, **kwargs):
+    del args
+    del kwargs
+
+
+def bench_loop_add_cancel(loop, count):
+    """Add and cancel delays like DelayManager used to (uuid names, partial and call_later)."""
+    delays = {}
+    start = time.perf_counter()
+    for i in range(count):
+        name = str(uuid.uuid4())
+        delays[name] = loop.call_later((i % 5000) / 1000.0, partial(_callback, name, _callback, test=i))
+    for name, handle in delays.items():
+        handle.cancel()
+    return time.perf_counter() - start
+
+
+def bench_wheel_add_cancel(wheel, count):
+    """Add and cancel delays on the timer wheel."""
+    delays = {}
+    start = time.perf_counter()
+    for i in range(count):
+        delays[i] = wheel.add((i % 5000) / 1000.0, _callback, i, _callback, {"test": i})
+    for handle in delays.values():
+        wheel.cancel(handle)
+    return time.perf_counter() - start
+
+
+def bench_expiry(loop, schedule, count):
+    """Schedule delays and run the loop until all of them expired."""
+    done = asyncio.Future(loop=loop)
+    remaining = [count]
+
+    def _expired():
+        remaining[0] -= 1
+        if not remaining[0]:
+            done.set_result(True)
+
+    start = time.perf_counter()
+    for i in range(count):
+        schedule((i % 100) / 1000.0, _expired)
+    loop.run_until_complete(done)
+    return time.perf_counter() - start
+
+
+@benchmark("delays.wheel_add_cancel", 100000)
+def bench_suite_wheel_add_cancel(count):
+    """Add and cancel delays on the timer wheel."""
+    loop = asyncio.new_event_loop()
+    try:
+        return bench_wheel_add_cancel(TimerWheel(loop), count)
+    finally:
+        loop.close()
+
+
+@benchmark("delays.wheel_expiry", 50000)
+def bench_suite_wheel_expiry(count):
+    """Schedule delays on the timer wheel and run the loop until all of them expired."""
+    loop = asyncio.new_event_loop()
+    try:
+        return bench_expiry(loop, TimerWheel(loop).add, count)
+    finally:
+        loop.close()
+
+
+def main(count=100000):
+    """Run benchmarks and print results."""
+    loop = asyncio.new_event_loop()
+    wheel = TimerWheel(loop)
+
+    results = [
+        ("add/cancel asyncio", bench_loop_add_cancel(loop, count)),
+        ("add/cancel wheel", bench_wheel_add_cancel(wheel, count)),
+        ("expiry asyncio", bench_expiry(loop, loop.call_later, count)),
+        ("expiry wheel", bench_expiry(loop, wheel.add, count)),
+    ]
+    loop.close()
+
+    for name, duration in results:
+        print("{:<20} {:>10.0f} ops/s".format(name, count / duration))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,66 @@
+"""Benchmark registering and removing event handlers with many registered handlers.
+
+Run with ``python -m mpf.benchmarks.event_handlers``.
+"""
+import sys
+import time
+from unittest.mock import MagicMock
+
+from mpf.benchmarks.suite import benchmark
+from mpf.core.events import EventManager
+
+
+class _Handler(object):
+
+    """Object with a handler method like a device."""
+
+    def handle(self, **kwargs):
+        """Handle event."""
+        del kwargs
+
+
+def _create_event_manager():
+    machine = MagicMock()
+    machine.machine_config = {"logging": {"console": {"event_manager": "none"}, "file": {"event_manager": "none"}}}
+    machine.options = {"production": True}
+    del machine.device_manager
+    return EventManager(machine)
+
+
+def bench_add_remove(count, events=100):
+    """Add count handlers, remove them by key and by callback. Return durations."""
+    event_manager = _create_event_manager()
+    handlers = [_Handler() for _ in range(count)]
+
+    start = time.perf_counter()
+    keys = [event_manager.add_handler("event{}".format(i % events), handler.handle, priority=i % 7)
+            for i, handler in enumerate(handlers)]
+    add_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in keys[::2]:
+        event_manager.remove_handler_by_key(key)
+    for handler in handlers[1::2]:
+        event_manager.remove_handler(handler.handle)
+    remove_time = time.perf_counter() - start
+
+    assert not event_manager.registered_handlers.get("event1")
+    return add_time, remove_time
+
+
+@benchmark("event_handlers.add_remove", 10000)
+def bench_suite_add_remove(count):
+    """Add handlers to 100 events and remove them by key and by callback."""
+    add_time, remove_time = bench_add_remove(count)
+    return add_time + remove_time, count * 2
+
+
+def main(count=20000):
+    """Run benchmarks and print results."""
+    add_time, remove_time = bench_add_remove(count)
+    print("{:<20} {:>10.0f} ops/s".format("add_handler", count / add_time))
+    print("{:<20} {:>10.0f} ops/s".format("remove", count / remove_time))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,51 @@
+"""Benchmark posting and dispatching events on a booted machine.
+
+Run with ``python -m mpf.benchmarks.suite "events.*"``.
+"""
+import time
+
+from mpf.benchmarks.machine import boot_machine, shutdown_machine
+from mpf.benchmarks.suite import benchmark, main
+
+EVENTS = ["bench_event{}".format(i) for i in range(10)]
+
+
+def _handler(**kwargs):
+    del kwargs
+
+
+@benchmark("events.post_dispatch", 20000)
+def bench_post_dispatch(count):
+    """Post events with five handlers each and process the event queue."""
+    machine = boot_machine("switch_controller")
+    try:
+        for event in EVENTS:
+            for priority in range(5):
+                machine.events.add_handler(event, _handler, priority=priority)
+
+        events = machine.events
+        start = time.perf_counter()
+        for i in range(count):
+            events.post(EVENTS[i % 10], value=i)
+            events.process_event_queue()
+        return time.perf_counter() - start
+    finally:
+        shutdown_machine(machine)
+
+
+@benchmark("events.post_unhandled", 50000)
+def bench_post_unhandled(count):
+    """Post events without any handlers."""
+    machine = boot_machine("switch_controller")
+    try:
+        events = machine.events
+        start = time.perf_counter()
+        for i in range(count):
+            events.post("bench_unhandled", value=i)
+        return time.perf_counter() - start
+    finally:
+        shutdown_machine(machine)
+
+
+if __name__ == "__main__":
+    main(["events.*"])
@@ -0,0 +1,32 @@
+"""Benchmark adding and removing entries on the stack of a light.
+
+Run with ``python -m mpf.benchmarks.suite "lights.*"``.
+"""
+import time
+
+from mpf.benchmarks.machine import boot_machine, shutdown_machine
+from mpf.benchmarks.suite import benchmark, main
+
+COLORS = ["red", "green", "blue", "white", "ff8000"]
+
+
+@benchmark("lights.stack", 20000)
+def bench_light_stack(count):
+    """Set colors with different keys and priorities on a RGB light and remove them again."""
+    machine = boot_machine("light", "light.yaml")
+    try:
+        light = machine.lights["led1"]
+        start = time.perf_counter()
+        for i in range(count):
+            key = "key{}".format(i % 5)
+            light.color(COLORS[i % 5], key=key, priority=i % 5)
+            if i % 5 == 4:
+                for j in range(5):
+                    light.remove_from_stack_by_key("key{}".format(j))
+        return time.perf_counter() - start
+    finally:
+        shutdown_machine(machine)
+
+
+if __name__ == "__main__":
+    main(["lights.*"])
@@ -0,0 +1,56 @@
+"""Boot machines from the test machine configs for benchmarks.
+
+Machines run on the smart_virtual platform under the virtual clock of the
+simulator and keep their data in memory.
+"""
+import asyncio
+import os
+
+import mpf.core
+from mpf.core.simulation import SimulationMachineController
+from mpf.tests.TestDataManager import TestDataManager
+
+MPF_PATH = os.path.abspath(os.path.join(mpf.core.__path__[0], os.pardir))
+MACHINE_FILES_PATH = os.path.join(MPF_PATH, "tests", "machine_files")
+
+
+class BenchmarkMachineController(SimulationMachineController):
+
+    """Simulated machine which does not write any data to disk."""
+
+    def create_data_manager(self, config_name):
+        """Return an in-memory data manager."""
+        return TestDataManager({})
+
+
+def boot_machine(machine_name, config_file="config.yaml", simulator_config=None) -> BenchmarkMachineController:
+    """Boot a machine from mpf/tests/machine_files and return it."""
+    options = {
+        'force_platform': 'smart_virtual',
+        'mpfconfigfile': os.path.join(MPF_PATH, "mpfconfig.yaml"),
+        'configfile': [config_file],
+        'no_load_cache': False,
+        'create_config_cache': True,
+        'bcp': False,
+        'text_ui': False,
+        'production': False,
+    }
+    machine = BenchmarkMachineController(MPF_PATH, os.path.join(MACHINE_FILES_PATH, machine_name), options,
+                                         simulator_config or {})
+    machine.initialise_mpf()
+    if machine.clock.loop.is_closed():
+        raise AssertionError("Failed to boot machine {} with {}".format(machine_name, config_file))
+    return machine
+
+
+def advance_time(machine, seconds=0.0):
+    """Run the machine for seconds of virtual time."""
+    loop = machine.clock.loop
+    loop.run_until_complete(asyncio.sleep(seconds, loop=loop))
+
+
+def shutdown_machine(machine):
+    """Cancel pending tasks, stop machine and close its loop."""
+    for task in asyncio.Task.all_tasks(machine.clock.loop):
+        task.cancel()
+    machine.shutdown()
@@ -0,0 +1,40 @@
+"""Benchmark evaluating placeholder templates.
+
+Run with ``python -m mpf.benchmarks.suite "placeholders.*"``.
+"""
+import time
+
+from mpf.benchmarks.machine import boot_machine, shutdown_machine
+from mpf.benchmarks.suite import benchmark, main
+
+
+@benchmark("placeholders.int_template", 50000)
+def bench_int_template(count):
+    """Evaluate an arithmetic int template with parameters."""
+    machine = boot_machine("switch_controller")
+    try:
+        template = machine.placeholder_manager.build_int_template("(value + 5) * 3 - offset")
+        start = time.perf_counter()
+        for i in range(count):
+            template.evaluate({"value": i, "offset": 7})
+        return time.perf_counter() - start
+    finally:
+        shutdown_machine(machine)
+
+
+@benchmark("placeholders.bool_template", 50000)
+def bench_bool_template(count):
+    """Evaluate a condition with comparisons and boolean operators."""
+    machine = boot_machine("switch_controller")
+    try:
+        template = machine.placeholder_manager.build_bool_template("value > 10 and name == 'test' or not enabled")
+        start = time.perf_counter()
+        for i in range(count):
+            template.evaluate({"value": i % 20, "name": "test", "enabled": True})
+        return time.perf_counter() - start
+    finally:
+        shutdown_machine(machine)
+
+
+if __name__ == "__main__":
+    main(["placeholders.*"])
@@ -0,0 +1,35 @@
+"""Benchmark stepping a looping light show.
+
+Run with ``python -m mpf.benchmarks.suite "shows.*"``.
+"""
+import time
+
+from mpf.benchmarks.machine import boot_machine, advance_time, shutdown_machine
+from mpf.benchmarks.suite import benchmark, main
+
+STEP_TIME = .01
+
+
+@benchmark("shows.step", 5000)
+def bench_show_step(count):
+    """Play a looping show on four lights and advance it count steps under the virtual clock."""
+    machine = boot_machine("shows", "test_shows.yaml")
+    try:
+        colors = ["red", "lime", "blue", "off"]
+        steps = [{"duration": STEP_TIME,
+                  "lights": {"led_0{}".format(light + 1): colors[(light + step) % 4] for light in range(4)}}
+                 for step in range(4)]
+        machine.show_controller.register_show("benchmark_show", steps)
+        running_show = machine.shows["benchmark_show"].play(loops=-1)
+
+        start = time.perf_counter()
+        advance_time(machine, count * STEP_TIME)
+        duration = time.perf_counter() - start
+        running_show.stop()
+        return duration
+    finally:
+        shutdown_machine(machine)
+
+
+if __name__ == "__main__":
+    main(["shows.*"])
@@ -0,0 +1,180 @@
+"""Registry and runner for the MPF benchmark suite.
+
+Benchmarks register themselves with the :func:`benchmark` decorator. A
+benchmark is called with an operation count, does its own setup and returns
+the duration of the timed section (or a tuple of duration and the number of
+operations it performed). Every benchmark runs ``repeat`` times with the
+garbage collector disabled and a fixed random seed and the best run is
+reported.
+
+Results are plain dicts which can be stored as JSON and compared against a
+stored baseline. Run with ``mpf benchmark`` or ``python -m mpf.benchmarks.suite``.
+"""
+import fnmatch
+import gc
+import platform
+import random
+import statistics
+import sys
+import time
+from collections import namedtuple, OrderedDict
+from importlib import import_module
+
+from mpf._version import version
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from typing import Callable, Dict, List, Optional
+
+Benchmark = namedtuple("Benchmark", ["name", "function", "count", "group", "description"])
+Comparison = namedtuple("Comparison", ["name", "baseline", "current", "change", "regression"])
+
+BENCHMARK_MODULES = [
+    "mpf.benchmarks.events",
+    "mpf.benchmarks.event_handlers",
+    "mpf.benchmarks.switches",
+    "mpf.benchmarks.ball_counting",
+    "mpf.benchmarks.delays",
+    "mpf.benchmarks.placeholders",
+    "mpf.benchmarks.lights",
+    "mpf.benchmarks.shows",
+    "mpf.benchmarks.bcp",
+    "mpf.benchmarks.config",
+    "mpf.benchmarks.data_manager",
+    "mpf.benchmarks.boot",
+]
+
+BENCHMARKS = OrderedDict()     # type: Dict[str, Benchmark]
+
+RESULTS_FORMAT = 1
+
+
+def benchmark(name: str, count: int, group: str = "micro"):
+    """Register a benchmark function.
+
+    Args:
+        name: Unique name of the benchmark. Dotted names group benchmarks.
+        count: Default number of operations per run.
+        group: "micro" or "macro".
+    """
+    def decorator(func):
+        description = (func.__doc__ or "").strip().splitlines()
+        BENCHMARKS[name] = Benchmark(name, func, count, group, description[0] if description else "")
+        return func
+    return decorator
+
+
+def load_benchmarks():
+    """Import all benchmark modules so that their benchmarks get registered."""
+    for module in BENCHMARK_MODULES:
+        import_module(module)
+
+
+def get_benchmarks(patterns=None) -> "List[Benchmark]":
+    """Return all benchmarks whose name or group match any of the shell style patterns."""
+    load_benchmarks()
+    if not patterns:
+        return list(BENCHMARKS.values())
+
+    return [bench for bench in BENCHMARKS.values()
+            if any(fnmatch.fnmatchcase(bench.name, pattern) or bench.group == pattern for pattern in patterns)]
+
+
+def run_benchmark(bench: Benchmark, repeat: int = 3, scale: float = 1.0) -> dict:
+    """Run a benchmark repeat times and return its result."""
+    count = max(1, int(bench.count * scale))
+    durations = []
+    ops = count
+    for _ in range(max(1, repeat)):
+        random.seed(0)
+        gc.collect()
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            result = bench.function(count)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        if isinstance(result, tuple):
+            duration, ops = result
+        else:
+            duration = result
+        durations.append(max(duration, 1e-9))
+
+    best = min(durations)
+    return {
+        "group": bench.group,
+        "count": ops,
+        "repeat": len(durations),
+        "best": best,
+        "median": statistics.median(durations),
+        "ops_per_sec": ops / best,
+    }
+
+
+def run_suite(benchmarks: "List[Benchmark]", repeat: int = 3, scale: float = 1.0,
+              callback: "Optional[Callable[[str, dict], None]]" = None) -> dict:
+    """Run benchmarks and return results with metadata about the environment."""
+    results = OrderedDict()
+    for bench in benchmarks:
+        results[bench.name] = run_benchmark(bench, repeat, scale)
+        if callback:
+            callback(bench.name, results[bench.name])
+
+    return {
+        "format": RESULTS_FORMAT,
+        "metadata": {
+            "mpf_version": version,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "timestamp": time.time(),
+            "repeat": repeat,
+            "scale": scale,
+        },
+        "results": results,
+    }
+
+
+def compare_results(results: dict, baseline: dict, threshold: float = 0.1) -> "List[Comparison]":
+    """Compare throughput of all benchmarks in results and baseline.
+
+    A benchmark regressed if its ops/s dropped by more than threshold (relative
+    to the baseline). Benchmarks which are only in one of both are skipped.
+    """
+    comparisons = []
+    baseline_results = baseline.get("results", {})
+    for name, result in results.get("results", {}).items():
+        if name not in baseline_results:
+            continue
+        before = baseline_results[name]["ops_per_sec"]
+        after = result["ops_per_sec"]
+        change = after / before - 1.0 if before else 0.0
+        comparisons.append(Comparison(name, before, after, change, change < -threshold))
+
+    return comparisons
+
+
+def format_result(name: str, result: dict) -> str:
+    """Return one line for the result of a benchmark."""
+    return "{:<36} {:>14.0f} ops/s {:>10.3f} ms".format(name, result["ops_per_sec"], result["best"] * 1000)
+
+
+def format_comparison(comparison: Comparison) -> str:
+    """Return one line for a comparison with the baseline."""
+    return "{:<36} {:>14.0f} {:>14.0f} {:>+8.1%}{}".format(
+        comparison.name, comparison.baseline, comparison.current, comparison.change,
+        "  REGRESSION" if comparison.regression else "")
+
+
+def main(patterns=None):
+    """Run all benchmarks matching patterns and print results."""
+    for bench in get_benchmarks(patterns):
+        print(format_result(bench.name, run_benchmark(bench)))
+
+
+if __name__ == "__main__":
+    # benchmark modules register with the imported module and not with __main__
+    import_module("mpf.benchmarks.suite").main(sys.argv[1:])
@@ -0,0 +1,34 @@
+"""Benchmark processing switch edges in the switch controller.
+
+Run with ``python -m mpf.benchmarks.suite "switches.*"``.
+"""
+import time
+
+from mpf.benchmarks.machine import boot_machine, shutdown_machine
+from mpf.benchmarks.suite import benchmark, main
+
+
+def _handler(**kwargs):
+    del kwargs
+
+
+@benchmark("switches.process_switch", 20000)
+def bench_process_switch(count):
+    """Toggle a switch with active and inactive handlers and a timed handler."""
+    machine = boot_machine("switch_controller")
+    try:
+        switch_controller = machine.switch_controller
+        switch_controller.add_switch_handler("s_test", _handler, state=1)
+        switch_controller.add_switch_handler("s_test", _handler, state=0)
+        switch_controller.add_switch_handler("s_test", _handler, state=1, ms=100)
+
+        start = time.perf_counter()
+        for i in range(count):
+            switch_controller.process_switch("s_test", state=(i + 1) % 2, logical=True)
+        return time.perf_counter() - start
+    finally:
+        shutdown_machine(machine)
+
+
+if __name__ == "__main__":
+    main(["switches.*"])
@@ -0,0 +1,168 @@
+"""Command to export the audits of a machine as CSV or JSON."""
+import argparse
+import csv
+import json
+import os
+import sys
+
+from mpf.file_interfaces.yaml_interface import YamlInterface
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from typing import Iterable, Iterator, Tuple
+
+
+def _parse_number(value: str):
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _unquote(key: str) -> str:
+    if len(key) > 1 and key[0] == key[-1] == "'":
+        return key[1:-1].replace("''", "'")
+    if len(key) > 1 and key[0] == key[-1] == '"':
+        return json.loads(key)
+    return key
+
+
+def scan_audits(lines: "Iterable[str]") -> "Iterator[Tuple[str, str, object]]":
+    """Yield category, name and value of all numeric audits in a block style yaml file.
+
+    This reads the file line by line without building the whole document.
+    Nested names (e.g. player audits) are joined with dots and lists are
+    skipped. Raises ValueError for yaml which is not block style.
+    """
+    path = []   # indent and key of all parents of the current line
+    for line in lines:
+        line = line.rstrip()
+        content = line.lstrip(' ')
+        if not content or content.startswith('#') or content in ('---', '...'):
+            continue
+        indent = len(line) - len(content)
+        while path and path[-1][0] >= indent:
+            path.pop()
+
+        if content.startswith('-'):
+            continue
+
+        if content.endswith(':'):
+            path.append((indent, _unquote(content[:-1])))
+            continue
+
+        if content[0] in '\'"':
+            # quoted keys may contain ": "
+            end = content.find(content[0] + ': ', 1) + 1
+            key, sep, value = (content[:end], ': ', content[end + 2:]) if end else (content, '', '')
+        else:
+            key, sep, value = content.partition(': ')
+        if not sep:
+            raise ValueError("Cannot parse line: {}".format(line))
+        value = value.strip()
+        if value in ('{}', '[]'):
+            if not path:
+                yield _unquote(key), None, None
+            continue
+        if value[0] in '{[&*!|>':
+            raise ValueError("Cannot parse line: {}".format(line))
+
+        number = _parse_number(value)
+        if number is None or not path:
+            continue
+
+        yield path[0][1], ".".join([name for _, name in path[1:]] + [_unquote(key)]), number
+
+
+def flatten_audits(data: dict, prefix=None) -> "Iterator[Tuple[str, str, object]]":
+    """Yield category, name and value of all numeric audits in loaded audit data."""
+    for key, value in data.items():
+        if prefix is None and isinstance(value, dict) and not value:
+            yield str(key), None, None
+        elif isinstance(value, dict):
+            yield from flatten_audits(value, prefix + [str(key)] if prefix else [str(key)])
+        elif prefix and isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield prefix[0], ".".join(prefix[1:] + [str(key)]), value
+
+
+def load_audits(filename: str) -> dict:
+    """Return all numeric audits in an audits file as dict of categories."""
+    audits = {}
+    try:
+        with open(filename) as f:
+            rows = list(scan_audits(f))
+    except ValueError:
+        # not written by MPF. parse the complete yaml
+        with open(filename) as f:
+            rows = list(flatten_audits(YamlInterface.process(f.read()) or {}))
+
+    for category, name, value in rows:
+        category_audits = audits.setdefault(category, {})
+        if name is not None:
+            category_audits[name] = value
+
+    return audits
+
+
+class Command(object):
+
+    """Exports audits."""
+
+    def __init__(self, mpf_path, machine_path, args):
+        """Export audits."""
+        del mpf_path
+        parser = argparse.ArgumentParser(description='Exports the audits of a machine as CSV or JSON')
+
+        parser.add_argument("-f", "--file",
+                            action="store", dest="file", default=os.path.join("data", "audits.yaml"),
+                            metavar='audits_file',
+                            help="Audits file relative to the machine folder. Default is data/audits.yaml")
+
+        parser.add_argument("--format",
+                            action="store", dest="format", choices=["csv", "json"], default="csv",
+                            help="Output format. Default is csv")
+
+        parser.add_argument("-c", "--category",
+                            action="append", dest="categories", default=None, metavar='category',
+                            help="Only export this category (e.g. switches). Can be used multiple times")
+
+        parser.add_argument("-o", "--output",
+                            action="store", dest="output", default=None, metavar='output_file',
+                            help="Write to this file instead of stdout")
+
+        args = parser.parse_args(args)
+
+        filename = os.path.join(machine_path, args.file)
+        if not os.path.isfile(filename):
+            print("Audits file {} does not exist".format(filename))
+            sys.exit(1)
+
+        audits = load_audits(filename)
+        if args.categories:
+            audits = {category: audits.get(category, {}) for category in args.categories}
+
+        if args.output:
+            with open(args.output, "w", newline="") as f:
+                self.write(audits, args.format, f)
+        else:
+            self.write(audits, args.format, sys.stdout)
+
+        sys.exit()
+
+    @staticmethod
+    def write(audits: dict, output_format: str, stream):
+        """Write audits as csv or json to stream."""
+        if output_format == "json":
+            json.dump(audits, stream, indent=4, sort_keys=True)
+            stream.write("\n")
+            return
+
+        writer = csv.writer(stream)
+        writer.writerow(["category", "name", "value"])
+        for category in sorted(audits):
+            for name in sorted(audits[category]):
+                writer.writerow([category, name, audits[category][name]])
@@ -0,0 +1,84 @@
+"""Command to run the benchmark suite and compare results with a baseline."""
+import argparse
+import json
+import logging
+import sys
+
+from mpf.benchmarks.suite import get_benchmarks, run_suite, compare_results, format_result, format_comparison
+from mpf.commands import MpfCommandLineParser
+
+subcommand = True
+
+
+class Command(MpfCommandLineParser):
+
+    """Run benchmarks from cli."""
+
+    def __init__(self, args, path):
+        """Parse args and run benchmarks."""
+        super().__init__(args, path)
+
+        parser = argparse.ArgumentParser(description='Runs the MPF benchmark suite')
+
+        parser.add_argument("benchmarks", nargs="*",
+                            help="Names or groups (micro or macro) of benchmarks to run. Shell style wildcards "
+                                 "are supported (e.g. \"events.*\"). Default is all benchmarks")
+        parser.add_argument("-l", "--list", action="store_true", dest="list", default=False,
+                            help="List benchmarks and exit")
+        parser.add_argument("-r", "--repeat", type=int, default=3, dest="repeat",
+                            help="Run every benchmark N times and report the best run. Default is 3")
+        parser.add_argument("--scale", type=float, default=1.0, dest="scale",
+                            help="Scale the number of operations of all benchmarks. Default is 1.0")
+        parser.add_argument("-o", "--output", action="store", dest="output", default=None, metavar='json_file',
+                            help="Write results as JSON to this file (use it as baseline later)")
+        parser.add_argument("-b", "--baseline", action="store", dest="baseline", default=None, metavar='json_file',
+                            help="Compare results with a stored baseline and exit with 1 on regressions")
+        parser.add_argument("-t", "--threshold", type=float, default=10.0, dest="threshold",
+                            help="Percent of ops/s a benchmark may drop below the baseline before it counts as "
+                                 "regression. Default is 10")
+        args = parser.parse_args(self.argv[1:])
+
+        # machines in macro benchmarks would spam the console
+        logging.basicConfig(level=logging.ERROR)
+
+        benchmarks = get_benchmarks(args.benchmarks)
+        if not benchmarks:
+            print("No benchmarks match {}".format(" ".join(args.benchmarks)))
+            sys.exit(1)
+
+        if args.list:
+            for bench in benchmarks:
+                print("{:<36} {:<6} {}".format(bench.name, bench.group, bench.description))
+            sys.exit()
+
+        baseline = None
+        if args.baseline:
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+
+        results = run_suite(benchmarks, args.repeat, args.scale,
+                            callback=lambda name, result: print(format_result(name, result), flush=True))
+
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(results, f, indent=4)
+
+        if baseline is None:
+            sys.exit()
+
+        sys.exit(not self.print_comparison(compare_results(results, baseline, args.threshold / 100.0)))
+
+    @staticmethod
+    def print_comparison(comparisons, stream=None) -> bool:
+        """Print comparisons with the baseline and return False if any benchmark regressed."""
+        stream = stream or sys.stdout
+        stream.write("\n{:<36} {:>14} {:>14} {:>8}\n".format("Benchmark", "Baseline", "Current", "Change"))
+        for comparison in comparisons:
+            stream.write(format_comparison(comparison) + "\n")
+
+        regressions = [comparison.name for comparison in comparisons if comparison.regression]
+        if regressions:
+            stream.write("\n{} regression(s): {}\n".format(len(regressions), ", ".join(regressions)))
+            return False
+        stream.write("\nNo regressions.\n")
+        return True
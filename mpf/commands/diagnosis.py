@@ -1,10 +1,13 @@
 """Command to show diagnosis information about mpf and mc."""
-
+import argparse
+import json
+import os
 import sys
 
 from serial.tools import list_ports
 
 from mpf._version import version as mpf_version
+from mpf.core.placeholder_manager import TEMPLATE_STATS_FILE
 
 
 class Command(object):
@@ -13,7 +16,22 @@ class Command(object):
 
     def __init__(self, mpf_path, machine_path, args):
         """Run mpf diagnosis."""
-        del args
+        parser = argparse.ArgumentParser(description='MPF Diagnosis')
+        parser.add_argument("-t", "--templates", type=int, nargs="?", const=20, default=None, dest="templates",
+                            help="Show the N most frequently evaluated templates and conditions from the last run "
+                                 "with template_stats enabled in the mpf section (default: 20)")
+        args = parser.parse_args(args)
+
+        if args.templates is not None:
+            self.print_template_stats(os.path.join(machine_path, "logs", TEMPLATE_STATS_FILE), args.templates)
+        else:
+            self.print_system_info(mpf_path, machine_path)
+
+        sys.exit()
+
+    @staticmethod
+    def print_system_info(mpf_path, machine_path):
+        """Print versions, paths and serial ports."""
         print("MPF version: {}".format(mpf_version))
         print("MPF install location: {}".format(mpf_path))
         print("Machine folder detected: {}".format(machine_path))
@@ -32,4 +50,23 @@ class Command(object):
             sys.stdout.write("    desc: {}\n".format(desc))
             sys.stdout.write("    hwid: {}\n".format(hwid))
 
-        sys.exit()
+    @staticmethod
+    def print_template_stats(stats_file, limit, stream=None):
+        """Print template cache counters and the most frequently evaluated templates."""
+        stream = stream or sys.stdout
+        if not os.path.isfile(stats_file):
+            stream.write("No template stats found in {}. Set template_stats: True in the mpf: section of your "
+                         "machine config and run your machine first.\n".format(stats_file))
+            return
+
+        with open(stats_file) as f:
+            stats = json.load(f)
+
+        cache = stats["cache"]
+        stream.write("Template cache: {} templates, {} hits, {} misses\n\n".format(
+            cache["size"], cache["hits"], cache["misses"]))
+        stream.write("{:>10} {:>12} {:>10}  {:6} {}\n".format("Count", "Total ms", "Avg us", "Type", "Template"))
+        for template in stats["templates"][:limit]:
+            stream.write("{:>10} {:>12.3f} {:>10.2f}  {:6} {}\n".format(
+                template["count"], template["time"] * 1000, template["time"] * 1000000 / template["count"],
+                template["type"].replace("Template", "").lower(), template["source"]))
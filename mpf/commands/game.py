@@ -6,13 +6,14 @@ import os
 import signal
 import socket
 import sys
+from collections import Counter
 from datetime import datetime
 import logging
-from logging.handlers import QueueHandler, SysLogHandler
-from queue import Queue
+from logging.handlers import SysLogHandler
 
 from asciimatics.screen import Screen
 
+from mpf.core.logging import create_queue_logging
 from mpf.core.machine import MachineController
 from mpf.core.utility_functions import Util
 
@@ -115,6 +116,14 @@ class Command(object):
                             help="Forces the virtual platform to be "
                                  "used for all devices")
 
+        parser.add_argument("--log_queue_size",
+                            action="store", dest="log_queue_size",
+                            type=int, default=10000, metavar='records',
+                            help="Maximum number of log records waiting to "
+                                 "be written. Records are dropped (and "
+                                 "counted) when the queue is full. 0 means "
+                                 "unlimited.")
+
         parser.add_argument("--syslog_address",
                             action="store", dest="syslog_address",
                             help="Log to the specified syslog address. This "
@@ -170,11 +179,8 @@ class Command(object):
             '%(levelname)s : %(name)s : %(message)s'))
 
         # initialise async handler for console
-        console_log_queue = Queue()
-        console_queue_handler = QueueHandler(console_log_queue)
-        self.console_queue_listener = logging.handlers.QueueListener(
-            console_log_queue, console_log)
-        self.console_queue_listener.start()
+        console_queue_handler, self.console_queue_listener = create_queue_logging(
+            console_log, self.args.log_queue_size)
 
         # initialise file log
         file_log = logging.FileHandler(full_logfile_path)
@@ -182,11 +188,9 @@ class Command(object):
             '%(asctime)s : %(levelname)s : %(name)s : %(message)s'))
 
         # initialise async handler for file log
-        file_log_queue = Queue()
-        file_queue_handler = QueueHandler(file_log_queue)
-        self.file_queue_listener = logging.handlers.QueueListener(
-            file_log_queue, file_log)
-        self.file_queue_listener.start()
+        file_queue_handler, self.file_queue_listener = create_queue_logging(
+            file_log, self.args.log_queue_size)
+        self.queue_handlers = [console_queue_handler, file_queue_handler]
 
         # add loggers
         logger = logging.getLogger()
@@ -234,10 +238,18 @@ class Command(object):
 
             logging.exception(exception)
 
-        logging.shutdown()
         self.console_queue_listener.stop()
         self.file_queue_listener.stop()
 
+        dropped_records = Counter()     # type: Counter
+        for handler in self.queue_handlers:
+            dropped_records.update(handler.dropped_records_by_level)
+        if dropped_records:
+            print("Dropped {} log records because the log queue was full: {}".format(
+                sum(dropped_records.values()), dict(dropped_records)))
+
+        logging.shutdown()
+
         if self.args.pause:
             input('Press ENTER to continue...')
 
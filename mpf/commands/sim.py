@@ -0,0 +1,143 @@
+"""Command to run a machine headless on the smart virtual platform as fast as possible."""
+import argparse
+import json
+import logging
+import os
+import sys
+
+from mpf.core.simulation import SimulationMachineController
+from mpf.file_interfaces.yaml_interface import YamlInterface
+
+
+class Command(object):
+
+    """Runs a headless simulation of the machine."""
+
+    def __init__(self, mpf_path, machine_path, args):
+        """Run simulation."""
+        parser = argparse.ArgumentParser(
+            description='Runs the machine on the smart virtual platform under a virtual clock as fast as possible')
+
+        parser.add_argument("-c",
+                            action="store", dest="configfile",
+                            default="config.yaml", metavar='config_file',
+                            help="The name of a config file to load. Default is config.yaml. Multiple files can be "
+                                 "used via a comma-separated list (no spaces between)")
+
+        parser.add_argument("-C",
+                            action="store", dest="mpfconfigfile",
+                            default=os.path.join(mpf_path, "mpfconfig.yaml"),
+                            metavar='config_file',
+                            help="The MPF framework default config file. Default is mpf/mpfconfig.yaml")
+
+        parser.add_argument("-a",
+                            action="store_true", dest="no_load_cache",
+                            help="Forces the config to be loaded from files and not cache")
+
+        parser.add_argument("-d", "--duration",
+                            action="store", dest="duration", type=float, default=3600,
+                            help="Virtual seconds to simulate. Default is 3600")
+
+        parser.add_argument("--seed",
+                            action="store", dest="seed", type=int, default=None,
+                            help="Seed for randomized switch activity")
+
+        parser.add_argument("--switch-rate",
+                            action="store", dest="switch_rate", type=float, default=5.0,
+                            help="Random playfield switch hits per virtual second. Default is 5")
+
+        parser.add_argument("--ball-time",
+                            action="store", dest="ball_time", type=float, default=30.0,
+                            help="Average virtual seconds until a ball drains. Default is 30")
+
+        parser.add_argument("--balls",
+                            action="store", dest="balls", type=int, default=None,
+                            help="Balls to put into the trough if the machine does not start with any balls. "
+                                 "Default is to fill the trough")
+
+        parser.add_argument("-s", "--script",
+                            action="store", dest="script", default=None, metavar='steps_file',
+                            help="Play switch steps from a yaml file instead of random activity. The file uses the "
+                                 "format of the switch_player plugin (a list of steps with time, switch and "
+                                 "action or a steps: section)")
+
+        parser.add_argument("--repeat",
+                            action="store_true", dest="repeat", default=False,
+                            help="Repeat the script until the duration passed")
+
+        parser.add_argument("-o", "--output",
+                            action="store", dest="output", default=None, metavar='json_file',
+                            help="Also write the report as JSON to this file")
+
+        parser.add_argument("-v",
+                            action="store_const", dest="loglevel", const=logging.DEBUG, default=logging.WARNING,
+                            help="Enables verbose logging to the console")
+
+        args = parser.parse_args(args)
+
+        logging.basicConfig(level=args.loglevel, format='%(levelname)s : %(name)s : %(message)s')
+
+        steps = self.load_steps(args.script) if args.script else None
+
+        options = {
+            'force_platform': 'smart_virtual',
+            'mpfconfigfile': args.mpfconfigfile,
+            'configfile': args.configfile.split(","),
+            'no_load_cache': args.no_load_cache,
+            'create_config_cache': True,
+            'bcp': False,
+            'text_ui': False,
+            'production': False,
+            'force_assets_load': False,
+        }
+        simulator_config = {
+            'duration': args.duration,
+            'seed': args.seed,
+            'steps': steps,
+            'repeat': args.repeat,
+            'switch_rate': args.switch_rate,
+            'ball_time': args.ball_time,
+            'balls': args.balls,
+        }
+
+        machine = SimulationMachineController(mpf_path, machine_path, options, simulator_config)
+        machine.run()
+
+        report = machine.simulator.get_report()
+        self.print_report(report)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(report, f, indent=4, sort_keys=True)
+
+        sys.exit()
+
+    @staticmethod
+    def load_steps(script):
+        """Load switch_player steps from a yaml file."""
+        with open(script) as f:
+            data = YamlInterface.process(f.read())
+
+        if isinstance(data, dict):
+            if "switch_player" in data:
+                data = data["switch_player"]
+            data = data.get("steps")
+
+        if not isinstance(data, list):
+            raise AssertionError("No steps found in {}".format(script))
+
+        return data
+
+    @staticmethod
+    def print_report(report, stream=None):
+        """Print the simulation report."""
+        stream = stream or sys.stdout
+        stream.write("Simulated {:.0f}s in {:.1f}s ({:.0f}x real time)\n".format(
+            report["virtual_time"], report["wall_time"], report["speedup"]))
+        stream.write("Games: {} ({:.1f} games/hour), balls: {}\n".format(
+            report["games"], report["games_per_hour"], report["balls"]))
+        stream.write("Events: {} ({:.0f} events/s), switch changes: {}\n".format(
+            report["events"], report["events_per_second"], report["switch_changes"]))
+        stream.write("Loop latency over {} iterations: p50 {:.3f}ms, p90 {:.3f}ms, p99 {:.3f}ms, "
+                     "max {:.3f}ms\n".format(
+                         report["loop_iterations"], report["latency_p50"] * 1000, report["latency_p90"] * 1000,
+                         report["latency_p99"] * 1000, report["latency_max"] * 1000))
@@ -4,31 +4,45 @@ import sys
 
 from mpf.commands import MpfCommandLineParser
 from mpf.tests.MpfDocTestCase import MpfDocTestCase
+from mpf.tests.parallel import ParallelTestRunner, UNIT_TEXT_TEST
 
 subcommand = True
 
 
 class Command(MpfCommandLineParser):
 
-    """Run a text unit test from cli."""
+    """Run text unit tests from cli."""
 
     def __init__(self, args, path):
         """Parse args."""
         super().__init__(args, path)
-        test_file = self.argv.pop(1)
 
         parser = argparse.ArgumentParser(description='MPF Command')
 
+        parser.add_argument("test_files", nargs="+",
+                            help="Text test files to run")
         parser.add_argument("-v", help="verbose",
                             default=False, action="store_true", dest="verbose")
+        parser.add_argument("-j", type=int, default=1, dest="jobs",
+                            help="Run tests in N worker processes (0 = one per CPU)")
+        parser.add_argument("--slowest", type=int, default=0,
+                            help="Report the N slowest tests")
         args = parser.parse_args(self.argv[1:])
 
+        if args.jobs == 1 and len(args.test_files) == 1 and not args.slowest:
+            sys.exit(not self._run_single(args.test_files[0], args.verbose))
+
+        runner = ParallelTestRunner(args.jobs, verbose=args.verbose, slowest=args.slowest)
+        runner.run((UNIT_TEXT_TEST, test_file) for test_file in args.test_files)
+        sys.exit(not runner.was_successful())
+
+    @staticmethod
+    def _run_single(test_file, verbose):
         with open(test_file) as f:
             test_string = f.read()
 
         test = MpfDocTestCase(config_string=test_string)
         suite = unittest.TestSuite()
         suite.addTest(test)
-        result = unittest.TextTestRunner(verbosity=1 if not args.verbose else 99).run(suite)
-
-        sys.exit(not result.wasSuccessful())
+        result = unittest.TextTestRunner(verbosity=1 if not verbose else 99).run(suite)
+        return result.wasSuccessful()
@@ -1,15 +1,20 @@
 """Contains AssetManager, AssetLoader, and Asset base classes."""
 import copy
+import heapq
+import itertools
 import os
 import random
 import threading
+import time
 from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import PurePath
 
 import asyncio
 
 from typing import Iterable, Optional, Set, Callable, Tuple
-from typing import List
+from typing import Dict, List
 
 from mpf.core.mode import Mode
 
@@ -77,6 +82,11 @@ class BaseAssetManager(MpfController, LogMixin):
         # prevent excessive loading_assets events
         self._last_asset_event_time = None
 
+        # wall time and number of loaded assets when the current batch of
+        # loads started. used to report throughput
+        self._loading_start_time = None
+        self._loading_start_count = 0
+
     def get_next_id(self) -> int:
         """Return the next free id."""
         self._next_id += 1
@@ -480,8 +490,9 @@ class BaseAssetManager(MpfController, LogMixin):
 
         Args:
             key_name: String of the load: key name.
+            priority: Priority of the mode which loads the assets. It is added
+                to the priority of every asset.
         """
-        del priority
         assets = set()
         # loop through all the registered assets of each class and look for
         # this key name
@@ -489,7 +500,7 @@ class BaseAssetManager(MpfController, LogMixin):
             asset_objects = getattr(self.machine, ac.attribute).values()
             for asset in [x for x in asset_objects if
                           x.config['load'] == key_name]:
-                asset.load()
+                asset.load(priority=asset.config.get('priority', 0) + priority)
                 assets.add(asset)
 
         return assets
@@ -509,6 +520,30 @@ class BaseAssetManager(MpfController, LogMixin):
         """Load an asset."""
         raise NotImplementedError("implement")
 
+    def cancel_load(self, asset: "Asset") -> bool:
+        """Cancel loading an asset.
+
+        Returns True if the asset was waiting to load or is loading.
+        """
+        del asset
+        return False
+
+    def _start_loading(self) -> None:
+        """Remember when loading started if no other assets are loading."""
+        if self.num_assets_loaded >= self.num_assets_to_load:
+            self._loading_start_time = time.monotonic()
+            self._loading_start_count = self.num_assets_loaded
+
+    @property
+    def loading_rate(self) -> float:
+        """Return assets loaded per second since loading started."""
+        if self._loading_start_time is None:
+            return 0.0
+        duration = time.monotonic() - self._loading_start_time
+        if duration <= 0:
+            return 0.0
+        return (self.num_assets_loaded - self._loading_start_count) / duration
+
     def _bcp_client_asset_load(self, total, remaining, **kwargs):
         # Callback for the BCP assets_to_load command which tracks asset
         # loading from a connected BCP client.
@@ -528,12 +563,14 @@ class BaseAssetManager(MpfController, LogMixin):
             return
 
         self._last_asset_event_time = self.machine.clock.get_time()
+        per_second = self.loading_rate
 
         self.machine.events.post(
             'loading_assets', total=total,
             loaded=self.num_assets_loaded + self.num_bcp_assets_loaded,
             remaining=remaining,
-            percent=self.loading_percent)
+            percent=self.loading_percent,
+            per_second=per_second)
         '''event: loading_assets
 
         desc: Posted when the number of assets waiting to be loaded changes.
@@ -556,10 +593,13 @@ class BaseAssetManager(MpfController, LogMixin):
         percent: The numerical percent completion of the assets loaded, express
             in the range of 0 to 100.
 
+        per_second: Assets loaded by MPF per second since loading started.
+
         '''
 
         if not remaining:
             self._last_asset_event_time = None
+            self._loading_start_time = None
             self.machine.events.post('asset_loading_complete')
             '''event: asset_loading_complete
             desc: Posted when the asset manager has loaded all the assets in
@@ -579,17 +619,140 @@ class BaseAssetManager(MpfController, LogMixin):
             MPF-based assets.
             '''
 
-        self.info_log('Loading assets: %s/%s (%s%%)',
+        self.info_log('Loading assets: %s/%s (%s%%, %.1f assets/s)',
                       self.num_assets_loaded + self.num_bcp_assets_loaded,
-                      total, self.loading_percent)
+                      total, self.loading_percent, per_second)
 
         if not remaining and not self.machine.is_init_done.is_set():
             self.machine.clear_boot_hold('assets')
 
 
+class AssetLoader(object):
+
+    """Loads assets in order of their priority.
+
+    Queued assets are kept in a heap. Up to ``num_workers`` assets load at the
+    same time in a thread pool. With zero workers one asset is loaded per loop
+    iteration in the loop thread. Load and done callbacks are called with the
+    asset. Done is called in the loop thread with the result of load.
+    """
+
+    def __init__(self, machine, num_workers: int, load: Callable[["Asset"], bool],
+                 done: Callable[["Asset", bool], None], cancelled: Callable[["Asset"], None]) -> None:
+        """Initialise asset loader."""
+        self.machine = machine
+        self._load = load
+        self._done = done
+        self._cancelled = cancelled
+        self._queue = []            # type: List[list]
+        self._entries = {}          # type: Dict[Asset, list]
+        self._running = set()       # type: Set[Asset]
+        self._cancelled_running = set()     # type: Set[Asset]
+        self._counter = itertools.count()
+        self._max_running = max(1, num_workers)
+        self._executor = ThreadPoolExecutor(max_workers=num_workers) if num_workers > 0 else None
+
+    def __len__(self):
+        """Return number of queued assets."""
+        return len(self._entries)
+
+    def add(self, asset: "Asset") -> None:
+        """Queue an asset for loading."""
+        if asset in self._running:
+            # still loading from an earlier request which got cancelled
+            self._cancelled_running.discard(asset)
+            return
+
+        if asset in self._entries:
+            return
+
+        # higher priority first. same priority in order of requests
+        entry = [-asset.priority, next(self._counter), asset]
+        self._entries[asset] = entry
+        heapq.heappush(self._queue, entry)
+        self._start_next()
+
+    def cancel(self, asset: "Asset") -> bool:
+        """Remove asset from the queue. Assets which are loading will be passed to cancelled when done.
+
+        Returns True if the asset was queued or loading.
+        """
+        entry = self._entries.pop(asset, None)
+        if entry:
+            entry[-1] = None
+            return True
+
+        if asset in self._running and asset not in self._cancelled_running:
+            self._cancelled_running.add(asset)
+            return True
+
+        return False
+
+    def stop(self) -> None:
+        """Drop all queued assets and stop the workers."""
+        self._queue = []
+        self._entries = {}
+        if self._executor:
+            self._executor.shutdown(wait=False)
+
+    def _pop(self) -> Optional["Asset"]:
+        while self._queue:
+            asset = heapq.heappop(self._queue)[-1]
+            if asset is not None:
+                del self._entries[asset]
+                return asset
+        return None
+
+    def _start_next(self) -> None:
+        while len(self._running) < self._max_running:
+            asset = self._pop()
+            if asset is None:
+                return
+
+            self._running.add(asset)
+            if self._executor:
+                future = self.machine.clock.loop.run_in_executor(self._executor, self._load, asset)
+                future.add_done_callback(partial(self._load_done, asset))
+            else:
+                self.machine.clock.loop.call_soon(self._load_in_loop, asset)
+
+    def _load_in_loop(self, asset):
+        future = asyncio.Future(loop=self.machine.clock.loop)
+        try:
+            future.set_result(self._load(asset))
+        except Exception as e:  # pylint: disable-msg=broad-except
+            future.set_exception(e)
+        self._load_done(asset, future)
+
+    def _load_done(self, asset, future):
+        self._running.discard(asset)
+        if asset in self._cancelled_running:
+            self._cancelled_running.remove(asset)
+            self._cancelled(asset)
+        elif not future.cancelled() and not future.exception():
+            self._done(asset, future.result())
+
+        self._start_next()
+
+        # raise exceptions from the load
+        future.result()
+
+
 class AsyncioSyncAssetManager(BaseAssetManager):
 
-    """AssetManager which uses asyncio to load assets."""
+    """AssetManager which loads assets with an :class:`AssetLoader`.
+
+    The number of worker threads is configured in asset_manager: num_workers.
+    """
+
+    def __init__(self, machine: MachineController) -> None:
+        """Initialise asset manager."""
+        super().__init__(machine)
+        config = self.machine.config_validator.validate_config(
+            "asset_manager", self.machine.config.get('asset_manager', {}))
+        self.loader = AssetLoader(self.machine, config['num_workers'], self._load_sync, self._asset_loaded,
+                                  self._asset_load_cancelled)
+        self.machine.events.add_handler('shutdown', self._stop)
 
     @staticmethod
     def _load_sync(asset):
@@ -599,28 +762,36 @@ class AsyncioSyncAssetManager(BaseAssetManager):
         else:
             return False
 
-    @asyncio.coroutine
-    def wait_for_asset_load(self, asset):
-        """Wait for an asset to load."""
-        result = self._load_sync(asset)
+    def _asset_loaded(self, asset, result):
         if result:
             asset.is_loaded()
         self.num_assets_loaded += 1
         self._post_loading_event()
 
+    @staticmethod
+    def _asset_load_cancelled(asset):
+        # unloaded while loading. release what do_load loaded
+        if not asset.loading:
+            asset.unload()
+
     def load_asset(self, asset):
-        """Load an asset."""
+        """Queue an asset for loading."""
+        self._start_loading()
         self.num_assets_to_load += 1
-        task = self.machine.clock.loop.create_task(self.wait_for_asset_load(asset))
-        task.add_done_callback(self._done)
+        self.loader.add(asset)
 
-    @staticmethod
-    def _done(future):
-        """Evaluate result of task.
+    def cancel_load(self, asset):
+        """Cancel loading an asset."""
+        if not self.loader.cancel(asset):
+            return False
 
-        Will raise exceptions from within task.
-        """
-        future.result()
+        self.num_assets_to_load -= 1
+        self._post_loading_event()
+        return True
+
+    def _stop(self, **kwargs):
+        del kwargs
+        self.loader.stop()
 
 
 class AssetPool(object):
@@ -956,6 +1127,9 @@ class Asset(object):
 
     def unload(self):
         """Handle that asset has been unloaded."""
+        if self.loading:
+            # do not finish loading (e.g. the mode which loads it stopped)
+            self.machine.asset_manager.cancel_load(self)
         self.unloading = True
         self.loaded = False
         self.loading = False
@@ -102,8 +102,7 @@ class BallSearch(MpfController):
                 callback, if it returns true
             name: string name which is used for debugging & the logs
         """
-        self.debug_log("Registering callback: {} (priority: {})".format(
-            name, priority))
+        self.debug_log("Registering callback: %s (priority: %s)", name, priority)
         self.callbacks.append(BallSearchCallback(priority, callback, name))
         # sort by priority
         self.callbacks = sorted(self.callbacks, key=lambda entry: entry.priority)
@@ -261,8 +260,8 @@ class BallSearch(MpfController):
                     'ball_search_wait_after_iteration']
 
             # if a callback returns True we wait for the next one
-            self.debug_log("Ball search: {} (phase: {}  iteration: {})".format(
-                element.name, self.phase, self.iteration))
+            self.debug_log("Ball search: %s (phase: %s  iteration: %s)",
+                           element.name, self.phase, self.iteration)
             if element.callback(self.phase, self.iteration):
                 self.delay.add(name='run', callback=self._run, ms=timeout)
                 return
@@ -1,7 +1,9 @@
 """RPC Interface for BCP clients."""
 import asyncio
 from copy import deepcopy
+from typing import List
 
+from mpf.core.bcp.monitor_filter import MonitorFilter
 from mpf.core.rgb_color import ColorException
 
 from mpf.core.events import PostedEvent
@@ -37,6 +39,16 @@ class BcpInterface(MpfController):
 
     config_name = "bcp_interface"
 
+    # transport handlers of the monitor categories which support filters
+    MONITOR_FILTER_HANDLERS = {
+        "events": "_monitor_events",
+        "devices": "_devices",
+        "switches": "_switches",
+        "machine_vars": "_machine_vars",
+        "player_vars": "_player_vars",
+        "modes": "_modes",
+    }
+
     def __init__(self, machine):
         """Initialise BCP."""
         super().__init__(machine)
@@ -65,6 +77,7 @@ class BcpInterface(MpfController):
             service=self._service,
         )
         self._shows = {}
+        self._monitor_filters = {}
 
         self.machine.events.add_handler('machine_reset_phase_1', self.bcp_reset)
 
@@ -230,11 +243,20 @@ class BcpInterface(MpfController):
 
         self.machine.bcp.transport.send_to_client(client, "light_color", error=False)
 
+    # pylint: disable-msg=too-many-arguments
     @asyncio.coroutine
-    def _bcp_receive_monitor_start(self, client, category):
-        """Start monitoring the specified category."""
+    def _bcp_receive_monitor_start(self, client, category, match=None, regex=None, rate=None, sample=None):
+        """Start monitoring the specified category.
+
+        Optionally, the subscription can be filtered by name (``match`` with
+        comma separated globs or ``regex``), sampled (``sample`` as fraction
+        of messages to send) or rate limited (``rate`` in messages per second).
+        """
         category = str.lower(category)
 
+        if not self._add_monitor_filter(client, category, match, regex, rate, sample):
+            return
+
         if category == "events":
             self._monitor_events(client)
         elif category == "devices":
@@ -264,6 +286,9 @@ class BcpInterface(MpfController):
         """Stop monitoring the specified category."""
         category = str.lower(category)
 
+        if category in self.MONITOR_FILTER_HANDLERS:
+            self._monitor_filters.get(self.MONITOR_FILTER_HANDLERS[category], {}).pop(client, None)
+
         if category == "events":
             self._monitor_events_stop(client)
         elif category == "devices":
@@ -288,6 +313,60 @@ class BcpInterface(MpfController):
                                                       cmd="monitor_stop?category={}".format(category),
                                                       error="Invalid category value")
 
+    # pylint: disable-msg=too-many-arguments
+    def _add_monitor_filter(self, client, category, match, regex, rate, sample) -> bool:
+        """Compile and store the filter for a monitor subscription.
+
+        Returns false (and sends an error to the client) if the filter is invalid.
+        """
+        handler = self.MONITOR_FILTER_HANDLERS.get(category)
+        if handler:
+            self._monitor_filters.get(handler, {}).pop(client, None)
+
+        if match is None and regex is None and rate is None and sample is None:
+            return True
+
+        error = None
+        if not handler:
+            error = "Filters are not supported for this category"
+        else:
+            try:
+                monitor_filter = MonitorFilter(match=match, regex=regex, rate=rate, sample=sample)
+            except ValueError as e:
+                error = str(e)
+
+        if error:
+            self.machine.bcp.transport.send_to_client(client,
+                                                      "error",
+                                                      cmd="monitor_start?category={}".format(category),
+                                                      error=error)
+            return False
+
+        if monitor_filter.is_active:
+            self._monitor_filters.setdefault(handler, {})[client] = monitor_filter
+        return True
+
+    def remove_monitor_filters(self, client):
+        """Remove the monitor filters of a client (e.g. when it disconnected)."""
+        for filters in self._monitor_filters.values():
+            filters.pop(client, None)
+
+    def _get_monitoring_clients(self, handler, name):
+        """Return all clients monitoring handler which accept a message for name."""
+        clients = self.machine.bcp.transport.get_transports_for_handler(handler)
+        filters = self._monitor_filters.get(handler)
+        if not filters or not clients:
+            return clients
+
+        now = self.machine.clock.get_time()
+        return [client for client in set(clients) if client not in filters or filters[client].accept(name, now)]
+
+    def _send_to_monitoring_clients(self, handler, filter_name, bcp_command, **kwargs):
+        """Send a monitor message to all clients which accept filter_name."""
+        clients = self._get_monitoring_clients(handler, filter_name)
+        if clients:
+            self.machine.bcp.transport.send_to_clients(clients, bcp_command, **kwargs)
+
     def _monitor_drivers(self, client):
         """Monitor all drivers."""
         self.machine.bcp.transport.add_handler_to_transport("_monitor_drivers", client)
@@ -310,8 +389,12 @@ class BcpInterface(MpfController):
 
     def monitor_posted_event(self, posted_event: PostedEvent):
         """Send monitored posted event to bcp clients."""
-        self.machine.bcp.transport.send_to_clients_with_handler(
-            handler="_monitor_events",
+        clients = self._get_monitoring_clients("_monitor_events", posted_event.event)
+        if not clients:
+            return
+
+        self.machine.bcp.transport.send_to_clients(
+            clients,
             bcp_command="monitored_event",
             event_name=posted_event.event,
             event_type=posted_event.type,
@@ -347,8 +430,12 @@ class BcpInterface(MpfController):
         if not self.configured:
             return
 
-        self.machine.bcp.transport.send_to_clients_with_handler(
-            handler="_devices",
+        clients = self._get_monitoring_clients("_devices", device.name)
+        if not clients:
+            return
+
+        self.machine.bcp.transport.send_to_clients(
+            clients,
             bcp_command='device',
             type=device.class_label,
             name=device.name,
@@ -357,7 +444,7 @@ class BcpInterface(MpfController):
 
     def _monitor_switches(self, client):
         """Register client to get notified of switch changes."""
-        self.machine.switch_controller.add_monitor(self._notify_switch_changes)
+        self.machine.switch_controller.add_batched_monitor(self._notify_switch_changes)
         self.machine.bcp.transport.add_handler_to_transport("_switches", client)
 
     def _monitor_switches_stop(self, client):
@@ -366,15 +453,16 @@ class BcpInterface(MpfController):
 
         # If there are no more clients monitoring switches, remove monitor
         if not self.machine.bcp.transport.get_transports_for_handler("_switches"):
-            self.machine.switch_controller.remove_monitor(self._notify_switch_changes)
+            self.machine.switch_controller.remove_batched_monitor(self._notify_switch_changes)
 
-    def _notify_switch_changes(self, change: MonitoredSwitchChange):
-        """Notify all listeners about switch change."""
-        self.machine.bcp.transport.send_to_clients_with_handler(
-            handler="_switches",
-            bcp_command='switch',
-            name=change.name,
-            state=change.state)
+    def _notify_switch_changes(self, changes: List[MonitoredSwitchChange]):
+        """Notify all listeners about switch changes."""
+        for change in changes:
+            self._send_to_monitoring_clients(
+                "_switches", change.name,
+                bcp_command='switch',
+                name=change.name,
+                state=change.state)
 
     def _monitor_player_vars(self, client):
         # Setup player variables to be monitored (if necessary)
@@ -420,8 +508,8 @@ class BcpInterface(MpfController):
 
     # pylint: disable-msg=too-many-arguments
     def _player_var_change(self, name, value, prev_value, change, player_num):
-        self.machine.bcp.transport.send_to_clients_with_handler(
-            handler="_player_vars",
+        self._send_to_monitoring_clients(
+            "_player_vars", name,
             bcp_command='player_variable',
             name=name,
             value=value,
@@ -430,8 +518,8 @@ class BcpInterface(MpfController):
             player_num=player_num)
 
     def _machine_var_change(self, name, value, prev_value, change):
-        self.machine.bcp.transport.send_to_clients_with_handler(
-            handler="_machine_vars",
+        self._send_to_monitoring_clients(
+            "_machine_vars", name,
             bcp_command='machine_variable',
             name=name,
             value=value,
@@ -461,8 +549,8 @@ class BcpInterface(MpfController):
         """Send 'mode_start' to the monitoring clients."""
         del config
         del kwargs
-        self.machine.bcp.transport.send_to_clients_with_handler(
-            handler="_modes",
+        self._send_to_monitoring_clients(
+            "_modes", mode.name,
             bcp_command="mode_start",
             name=mode.name,
             running_modes=sorted([(m.name, m.priority) for m in self.machine.modes if m.active or m == mode]),
@@ -474,8 +562,8 @@ class BcpInterface(MpfController):
     def _mode_stop(self, mode, **kwargs):
         """Send 'mode_stop' to the monitoring clients."""
         del kwargs
-        self.machine.bcp.transport.send_to_clients_with_handler(
-            handler="_modes",
+        self._send_to_monitoring_clients(
+            "_modes", mode,
             bcp_command="mode_stop",
             running_modes=sorted([(m.name, m.priority) for m in self.machine.modes if m.active]),
             name=mode)
@@ -76,6 +76,7 @@ class BcpTransportManager:
         for handler in self._handlers:
             if transport in self._handlers[handler]:
                 self._handlers[handler].remove(transport)
+        self._machine.bcp.interface.remove_monitor_filters(transport)
 
         if transport in self._readers:
             self._readers[transport].cancel()
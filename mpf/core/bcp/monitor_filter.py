@@ -0,0 +1,105 @@
+"""Server side filters for BCP monitor subscriptions."""
+import fnmatch
+import re
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from typing import Optional, Pattern
+
+
+class MonitorFilter(object):
+
+    """Filter, sample and rate limit the messages of one monitor subscription.
+
+    All parameters are parsed and compiled once when the subscription is
+    created so that checking a message is cheap.
+
+    Args:
+        match: Comma separated list of glob patterns (e.g. ``ball_*,mode_*``).
+        regex: Regular expression which is searched in the name.
+        rate: Maximum number of messages per second.
+        sample: Fraction of messages (0 < sample <= 1) which will be sent.
+
+    A name passes if it matches any glob or the regex. Without ``match`` and
+    ``regex`` all names pass. Sampling is deterministic (every n-th message
+    for a sample of 1/n) and rate limiting uses a token bucket which allows
+    bursts of up to one second worth of messages.
+    """
+
+    __slots__ = ["_pattern", "_regex", "_sample", "_sample_credit", "_rate", "_tokens", "_last_time", "dropped"]
+
+    def __init__(self, match=None, regex=None, rate=None, sample=None) -> None:
+        """Parse and compile filter.
+
+        Raises ValueError on invalid arguments.
+        """
+        self._pattern = None    # type: Optional[Pattern]
+        self._regex = None      # type: Optional[Pattern]
+        self._sample = None     # type: Optional[float]
+        self._sample_credit = 0.0
+        self._rate = None       # type: Optional[float]
+        self._tokens = 0.0
+        self._last_time = None  # type: Optional[float]
+        self.dropped = 0
+
+        if match:
+            globs = [fnmatch.translate(glob.strip()) for glob in str(match).split(",") if glob.strip()]
+            if globs:
+                self._pattern = re.compile("|".join("(?:{})".format(glob) for glob in globs), re.IGNORECASE)
+
+        if regex:
+            try:
+                self._regex = re.compile(str(regex))
+            except re.error as e:
+                raise ValueError("Invalid regex {}: {}".format(regex, e))
+
+        if sample is not None:
+            sample = float(sample)
+            if not 0 < sample <= 1:
+                raise ValueError("Sample has to be in (0, 1] but is {}".format(sample))
+            if sample < 1:
+                self._sample = sample
+                # let the first message pass
+                self._sample_credit = 1 - sample
+
+        if rate is not None:
+            rate = float(rate)
+            if rate <= 0:
+                raise ValueError("Rate has to be positive but is {}".format(rate))
+            self._rate = rate
+            self._tokens = max(rate, 1.0)
+
+    @property
+    def is_active(self) -> bool:
+        """Return true if this filter may drop any message."""
+        return bool(self._pattern or self._regex or self._sample or self._rate)
+
+    def match_name(self, name) -> bool:
+        """Return true if name passes the name filters."""
+        if not self._pattern and not self._regex:
+            return True
+        name = str(name)
+        return bool((self._pattern and self._pattern.match(name)) or (self._regex and self._regex.search(name)))
+
+    def accept(self, name, now: float) -> bool:
+        """Return true if the message for name should be sent at time now."""
+        if not self.match_name(name):
+            return False
+
+        if self._sample:
+            self._sample_credit += self._sample
+            if self._sample_credit < 1 - 1e-9:
+                self.dropped += 1
+                return False
+            self._sample_credit -= 1
+
+        if self._rate:
+            if self._last_time is not None:
+                self._tokens = min(max(self._rate, 1.0), self._tokens + (now - self._last_time) * self._rate)
+            self._last_time = now
+            if self._tokens < 1:
+                self.dropped += 1
+                return False
+            self._tokens -= 1
+
+        return True
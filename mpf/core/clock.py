@@ -1,46 +1,370 @@
 """MPF clock and main loop."""
 import asyncio
-from functools import partial
+from collections import OrderedDict
 
-from typing import Tuple, Generator
+from typing import Any, Dict, Tuple, Generator
 
 from serial_asyncio import create_serial_connection
 
 from mpf.core.logging import LogMixin
 
 
+class TimerWheel:
+
+    """Hierarchical timer wheel which schedules many timers with a single loop entry.
+
+    Timers are sorted into ``LEVELS`` wheels of ``SLOTS`` slots each. A slot on
+    level 0 covers one tick (one millisecond) and a slot on level n covers
+    ``SLOTS ** n`` ticks. Timers on higher levels are cascaded into lower levels
+    when the wheel reaches their slot. Inserting and cancelling a timer is O(1)
+    and all timers which are due are expired in one batch. Timers still fire at
+    their exact deadline because only the loop wakeup is derived from the wheel.
+
+    Only the next deadline (or cascade) is scheduled in the asyncio loop.
+    Timers are identified by integer handles.
+    """
+
+    TICKS_PER_SECOND = 1000
+    SLOT_BITS = 6
+    SLOTS = 1 << SLOT_BITS
+    SLOT_MASK = SLOTS - 1
+    LEVELS = 4
+
+    __slots__ = ["loop", "_wheels", "_counts", "_timers", "_current_tick", "_next_handle", "_loop_handle",
+                 "_wake_time", "_wake_tick"]
+
+    def __init__(self, loop):
+        """Initialise timer wheel."""
+        self.loop = loop
+        self._wheels = [[{} for _ in range(self.SLOTS)] for _ in range(self.LEVELS)]
+        self._counts = [0] * self.LEVELS
+        # handle -> [deadline, callback, args, slot, level]
+        self._timers = {}
+        self._current_tick = 0
+        self._next_handle = 1
+        self._loop_handle = None
+        self._wake_time = None
+        self._wake_tick = 0
+
+    def __len__(self):
+        """Return number of scheduled timers."""
+        return len(self._timers)
+
+    def add(self, delay: float, callback, *args) -> int:
+        """Call callback with args in delay seconds and return an integer handle."""
+        return self.add_at(self.loop.time() + delay, callback, *args)
+
+    def add_at(self, when: float, callback, *args) -> int:
+        """Call callback with args at loop time when and return an integer handle."""
+        handle = self._next_handle
+        self._next_handle += 1
+
+        if not self._timers:
+            self._current_tick = max(self._current_tick, int(self.loop.time() * self.TICKS_PER_SECOND))
+        elif self._loop_handle:
+            now_tick = int(self.loop.time() * self.TICKS_PER_SECOND)
+            if self._current_tick < now_tick < self._wake_tick:
+                # nothing happens until the next wakeup. skip ahead to place the timer in the right slot
+                self._current_tick = now_tick
+
+        entry = [when, callback, args, None, 0]
+        self._timers[handle] = entry
+        wake_tick, wake_time = self._place(handle, entry)
+
+        if self._wake_time is None or wake_time < self._wake_time:
+            self._schedule_wake(wake_time, wake_tick)
+
+        return handle
+
+    def cancel(self, handle: int) -> bool:
+        """Cancel a timer. Return true if the timer was still scheduled."""
+        entry = self._timers.pop(handle, None)
+        if entry is None:
+            return False
+
+        if entry[3] is not None:
+            del entry[3][handle]
+            self._counts[entry[4]] -= 1
+        return True
+
+    def pop(self, handle: int):
+        """Cancel a timer and return its callback and args (or None if it is not scheduled)."""
+        entry = self._timers.get(handle)
+        if entry is None or not self.cancel(handle):
+            return None
+        return entry[1], entry[2]
+
+    def get_deadline(self, handle: int):
+        """Return the deadline of a timer (or None if it is not scheduled)."""
+        entry = self._timers.get(handle)
+        return entry[0] if entry else None
+
+    def _place(self, handle, entry):
+        """Put a timer into the right slot and return the tick and time when the wheel has to wake for it."""
+        tick = int(entry[0] * self.TICKS_PER_SECOND)
+        delta = tick - self._current_tick
+        if delta < self.SLOTS:
+            if delta < 0:
+                tick = self._current_tick
+            level = 0
+            wake_tick = tick
+            wake_time = entry[0]
+        else:
+            level = 1
+            while level < self.LEVELS - 1 and delta >= 1 << (self.SLOT_BITS * (level + 1)):
+                level += 1
+            shift = self.SLOT_BITS * level
+            if delta >= 1 << (shift + self.SLOT_BITS):
+                # beyond the range of the wheel. cascade at the end of the range
+                tick = self._current_tick + (1 << (shift + self.SLOT_BITS)) - 1
+            wake_tick = (tick >> shift) << shift
+            wake_time = wake_tick / self.TICKS_PER_SECOND
+            tick >>= shift
+
+        slot = self._wheels[level][tick & self.SLOT_MASK]
+        slot[handle] = entry
+        entry[3] = slot
+        entry[4] = level
+        self._counts[level] += 1
+        return wake_tick, wake_time
+
+    def _schedule_wake(self, wake_time, wake_tick):
+        if self._loop_handle:
+            self._loop_handle.cancel()
+        self._wake_time = wake_time
+        self._wake_tick = wake_tick
+        self._loop_handle = self.loop.call_at(wake_time, self._run)
+
+    def _next_tick(self):
+        """Return the next tick after the current tick with a timer or a cascade and whether it is a cascade."""
+        current = self._current_tick
+        next_tick = None
+        is_cascade = False
+        if self._counts[0]:
+            wheel = self._wheels[0]
+            for i in range(1, self.SLOTS):
+                if wheel[(current + i) & self.SLOT_MASK]:
+                    next_tick = current + i
+                    break
+
+        for level in range(1, self.LEVELS):
+            if not self._counts[level]:
+                continue
+            shift = self.SLOT_BITS * level
+            base = current >> shift
+            wheel = self._wheels[level]
+            for i in range(1, self.SLOTS + 1):
+                if wheel[(base + i) & self.SLOT_MASK]:
+                    cascade_tick = (base + i) << shift
+                    if next_tick is None or cascade_tick <= next_tick:
+                        next_tick = cascade_tick
+                        is_cascade = True
+                    break
+
+        return next_tick, is_cascade
+
+    def _cascade(self):
+        """Move timers from higher levels to lower levels when reaching their slot."""
+        for level in range(1, self.LEVELS):
+            shift = self.SLOT_BITS * level
+            if self._current_tick & ((1 << shift) - 1):
+                return
+            slot = self._wheels[level][(self._current_tick >> shift) & self.SLOT_MASK]
+            if not slot:
+                continue
+            entries = list(slot.items())
+            slot.clear()
+            self._counts[level] -= len(entries)
+            for handle, entry in entries:
+                self._place(handle, entry)
+
+    def _collect(self, now, due, all_due):
+        slot = self._wheels[0][self._current_tick & self.SLOT_MASK]
+        if not slot:
+            return
+        for handle, entry in list(slot.items()):
+            if all_due or entry[0] <= now:
+                del slot[handle]
+                entry[3] = None
+                self._counts[0] -= 1
+                due.append((entry[0], handle))
+
+    def _run(self):
+        # the loop called us because our wakeup is due. never assume an earlier time than that.
+        now = max(self.loop.time(), self._wake_time)
+        target_tick = max(int(now * self.TICKS_PER_SECOND), self._wake_tick)
+        self._loop_handle = None
+        # timers added by callbacks do not schedule a wakeup. we do that at the end
+        self._wake_time = float("-inf")
+
+        due = []
+        while True:
+            self._collect(now, due, self._current_tick < target_tick)
+            if self._current_tick >= target_tick:
+                break
+            next_tick, _ = self._next_tick()
+            self._current_tick = target_tick if next_tick is None else min(next_tick, target_tick)
+            self._cascade()
+
+        # run in order of deadlines. timers with the same deadline run in the order they were added
+        due.sort()
+        for _, handle in due:
+            entry = self._timers.pop(handle, None)
+            if entry is None:
+                # cancelled by an earlier callback
+                continue
+            try:
+                entry[1](*entry[2])
+            except Exception as exc:    # pylint: disable-msg=broad-except
+                self.loop.call_exception_handler({
+                    'message': 'Exception in timer callback {}'.format(entry[1]),
+                    'exception': exc,
+                })
+
+        self._wake_time = None
+        if self._timers:
+            self._schedule_next_wake()
+
+    def _schedule_next_wake(self):
+        slot = self._wheels[0][self._current_tick & self.SLOT_MASK]
+        if slot:
+            self._schedule_wake(min(entry[0] for entry in slot.values()), self._current_tick)
+            return
+
+        next_tick, is_cascade = self._next_tick()
+        if next_tick is None:
+            return
+        if is_cascade:
+            self._schedule_wake(next_tick / self.TICKS_PER_SECOND, next_tick)
+        else:
+            slot = self._wheels[0][next_tick & self.SLOT_MASK]
+            self._schedule_wake(min(entry[0] for entry in slot.values()), next_tick)
+
+
 class PeriodicTask:
 
-    """A periodic asyncio task."""
+    """A periodic callback which is run by a :class:`TickGroup`."""
 
-    def __init__(self, interval, loop, callback):
+    __slots__ = ["_group", "_callback"]
+
+    def __init__(self, group: "TickGroup", callback):
         """Initialise periodic task."""
-        self._canceled = False
-        self._interval = interval
+        self._group = group
         self._callback = callback
-        self._loop = loop
-        self._last_call = self._loop.time()
-        self._schedule()
 
-    def _schedule(self):
-        if self._canceled:
-            return
-        self._loop.call_at(self._last_call + self._interval, self._run)
+    @property
+    def interval(self):
+        """Return interval of this task."""
+        return self._group.interval
 
     def get_next_call_time(self):
         """Return time of next call."""
-        return self._last_call + self._interval
-
-    def _run(self):
-        self._last_call = self._last_call + self._interval
-        if self._canceled:
-            return
-        self._callback()
-        self._schedule()
+        return self._group.get_next_call_time()
 
     def cancel(self):
         """Cancel periodic task."""
-        self._canceled = True
+        if self._group:
+            self._group.remove(self)
+            self._group = None
+
+
+class TickGroup:
+
+    """All periodic tasks with the same interval and phase which share one wakeup.
+
+    The group ticks at ``anchor + n * interval``. Tick times are computed from
+    the anchor and not by adding up intervals so the group never drifts. When
+    the loop falls behind, missed ticks are run back to back (one per loop
+    iteration) until the group is back on schedule. Tasks never lose a tick.
+    """
+
+    __slots__ = ["_scheduler", "_key", "interval", "_anchor", "_count", "_tasks", "_handle"]
+
+    def __init__(self, scheduler: "TickScheduler", key, interval, anchor):
+        """Initialise tick group."""
+        self._scheduler = scheduler
+        self._key = key
+        self.interval = interval
+        self._anchor = anchor
+        self._count = 0
+        self._tasks = OrderedDict()     # type: Dict[PeriodicTask, Any]
+        self._handle = None
+
+    def add(self, callback) -> PeriodicTask:
+        """Add a task to this group. It will run at the next tick of the group."""
+        task = PeriodicTask(self, callback)
+        self._tasks[task] = callback
+        if not self._handle:
+            self._schedule()
+        return task
+
+    def remove(self, task: PeriodicTask):
+        """Remove a task from this group."""
+        del self._tasks[task]
+        if not self._tasks:
+            self._scheduler.remove_group(self._key, self)
+            if self._handle:
+                self._scheduler.wheel.cancel(self._handle)
+                self._handle = None
+
+    def get_next_call_time(self):
+        """Return time of next tick."""
+        return self._anchor + (self._count + 1) * self.interval
+
+    def _schedule(self):
+        self._handle = self._scheduler.wheel.add_at(self.get_next_call_time(), self._tick)
+
+    def _tick(self):
+        self._handle = None
+        self._count += 1
+        # tasks added by callbacks will run at the next tick
+        for task, callback in list(self._tasks.items()):
+            if task._group is self:     # pylint: disable-msg=protected-access
+                callback()
+        if self._tasks and not self._handle:
+            self._schedule()
+
+
+class TickScheduler:
+
+    """Runs periodic tasks with the same interval in shared groups.
+
+    Every group wakes up once per interval and runs all its tasks in one batch.
+    Phase locked tasks join the existing group for their interval and first
+    run at its next tick (which may be earlier than one interval after they
+    were added). Other tasks only share a group with tasks of the same
+    interval which were added in the same tick of the timer wheel. Those
+    always first run one interval after they were added.
+    """
+
+    __slots__ = ["wheel", "_groups"]
+
+    def __init__(self, wheel: TimerWheel):
+        """Initialise tick scheduler."""
+        self.wheel = wheel
+        self._groups = {}   # type: Dict[Any, TickGroup]
+
+    def schedule(self, callback, interval, phase_locked=False) -> PeriodicTask:
+        """Run callback every interval seconds."""
+        now = self.wheel.loop.time()
+        if phase_locked:
+            key = (interval, None)
+        else:
+            key = (interval, int(now * self.wheel.TICKS_PER_SECOND))
+
+        group = self._groups.get(key)
+        if not group:
+            group = self._groups[key] = TickGroup(self, key, interval, now)
+        return group.add(callback)
+
+    def remove_group(self, key, group: TickGroup):
+        """Remove an empty group."""
+        if self._groups.get(key) is group:
+            del self._groups[key]
+
+    def __len__(self):
+        """Return number of groups."""
+        return len(self._groups)
 
 
 class ClockBase(LogMixin):
@@ -67,6 +391,9 @@ class ClockBase(LogMixin):
         else:
             self.loop = loop                        # type: asyncio.BaseEventLoop
 
+        self.timer_wheel = TimerWheel(self.loop)
+        self.tick_scheduler = TickScheduler(self.timer_wheel)
+
     # pylint: disable-msg=no-self-use
     def _create_event_loop(self):
         try:
@@ -170,12 +497,17 @@ class ClockBase(LogMixin):
 
         return event
 
-    def schedule_interval(self, callback, timeout):
+    def schedule_interval(self, callback, timeout, phase_locked=False):
         """Schedule an event to be called every <timeout> seconds.
 
+        Callbacks with the same interval share one wakeup. See
+        :class:`TickScheduler` for details.
+
         Args:
             callback: callback to call on timeout
             timeout: period to wait
+            phase_locked: Align this callback to other phase locked callbacks
+                with the same interval.
 
         Returns:
             A PeriodicTask object.
@@ -183,7 +515,7 @@ class ClockBase(LogMixin):
         if not callable(callback):
             raise AssertionError('callback must be a callable, got {}'.format(callback))
 
-        periodic_task = PeriodicTask(timeout, self.loop, callback)
+        periodic_task = self.tick_scheduler.schedule(callback, timeout, phase_locked)
 
         self.debug_log("Scheduled a recurring clock callback (callback=%s, timeout=%s)",
                        str(callback), timeout)
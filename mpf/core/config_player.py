@@ -3,6 +3,7 @@
 import abc
 from functools import partial
 
+from mpf.core.events import HandlerSpec
 from mpf.core.machine import MachineController
 from mpf.core.mode import Mode
 from mpf.core.logging import LogMixin
@@ -10,9 +11,8 @@ from mpf.exceptions.ConfigFileError import ConfigFileError
 
 MYPY = False
 if MYPY:   # pragma: no cover
-    from mpf.core.placeholder_manager import BoolTemplate
+    from mpf.core.placeholder_manager import BoolTemplate, TemplateSubscription
     from typing import Dict
-    import asyncio
 
 
 class ConfigPlayer(LogMixin, metaclass=abc.ABCMeta):
@@ -241,17 +241,9 @@ class ConfigPlayer(LogMixin, metaclass=abc.ABCMeta):
             context = "_global"
             actual_priority = priority
 
-        self._update_subscription(template, subscription_list, settings, actual_priority, context, None)
-
-    # pylint: disable-msg=too-many-arguments
-    def _update_subscription(self, template, subscription_list, settings, priority, context, future):
-        if future and future.cancelled():
-            return
-        value, subscription = template.evaluate_and_subscribe([])
-        subscription_list[template] = subscription
-        subscription.add_done_callback(
-            partial(self._update_subscription, template, subscription_list, settings, priority, context))
-        self.handle_subscription_change(value, settings, priority, context)
+        subscription_list[template] = self.machine.placeholder_manager.subscribe_template(
+            template, [], partial(self.handle_subscription_change, settings=settings, priority=actual_priority,
+                                  context=context))
 
     # pylint: disable-msg=no-self-use
     def handle_subscription_change(self, value, settings, priority, context):
@@ -265,8 +257,8 @@ class ConfigPlayer(LogMixin, metaclass=abc.ABCMeta):
     def register_player_events(self, config, mode: Mode = None, priority=0):
         """Register events for standalone player."""
         # config is localized
-        key_list = list()
-        subscription_list = dict()      # type: Dict[BoolTemplate, asyncio.Future]
+        handlers = list()
+        subscription_list = dict()      # type: Dict[BoolTemplate, TemplateSubscription]
 
         if config:
             for event, settings in config.items():
@@ -296,21 +288,18 @@ class ConfigPlayer(LogMixin, metaclass=abc.ABCMeta):
                             "\"mode_{0}_started:\"".format(
                                 mode.name, self.config_file_section, event))
 
-                    key_list.append(
-                        self.machine.events.add_handler(
-                            event=event,
-                            handler=self.config_play_callback,
-                            calling_context=event,
-                            priority=actual_priority,
-                            mode=mode,
-                            settings=settings))
+                    handlers.append(HandlerSpec(event, self.config_play_callback, actual_priority, None,
+                                                {"calling_context": event, "mode": mode, "settings": settings}))
+
+        # add all handlers at once with one merge per event
+        key_list = self.machine.events.add_handlers(handlers)
 
         return key_list, subscription_list
 
     def unload_player_events(self, key_list):
         """Remove event for standalone player."""
-        for future in key_list[1].values():
-            future.cancel()
+        for subscription in key_list[1].values():
+            subscription.cancel()
         self.machine.events.remove_handlers_by_keys(key_list[0])
 
     def config_play_callback(self, settings, calling_context, priority=0, mode=None, **kwargs):
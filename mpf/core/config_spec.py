@@ -65,6 +65,9 @@ achievements:
 
 animations:
     __valid_in__: machine, mode                 # todo add to validator
+asset_manager:
+    __valid_in__: machine
+    num_workers: single|int|2
 assets:
     __valid_in__: machine, mode
     common:
@@ -87,6 +90,7 @@ assets:
 auditor:
     __valid_in__: machine
     save_events: list|str|ball_ended
+    flush_interval: single|ms|1s
     audit: list|str|None
     events: list|str|None
     player: list|str|None
@@ -770,6 +774,10 @@ mpf:
     allow_invalid_config_sections: single|bool|false
     save_machine_vars_to_disk: single|bool|true
     default_show_sync_ms: single|int|0
+    show_cache_max_kb: single|int|32768
+    show_cache_max_shows: single|int|250
+    coalesce_player_var_events: single|bool|False
+    template_stats: single|bool|False
     default_platform_hz: single|float|1000
     core_modules: ignore
     config_players: ignore
@@ -1377,6 +1385,10 @@ system11:
     ac_relay_driver: single|machine(coils)|
 text_strings:
     __valid_in__: machine, mode                 # todo add to validator
+text_ui:
+    __valid_in__: machine
+    fps: single|float|10
+    threaded: single|bool|True
 tilt:
     __valid_in__: machine, mode
     tilt_slam_tilt_events: list|str|None
@@ -1406,6 +1418,7 @@ timers:
     direction: single|str|up
     max_value: single|int|None
     tick_interval: single|template_secs|1s
+    sync_ticks: single|bool|False
     start_running: single|bool|False
     control_events: list|subconfig(timer_control_events)|None
     restart_on_complete: single|bool|False
@@ -1418,6 +1431,15 @@ timer_control_events:  # subconfig for mode timers
 reset_tick_interval)|
     event: single|str|
     value: single|int|None
+trace_recorder:
+    __valid_in__: machine
+    buffer_size: single|int|100000
+    file: single|str|logs/trace.mpftrace
+    dump_events: list|str|trace_recorder_dump
+    dump_on_crash: single|bool|True
+    record_events: single|bool|True
+    record_switches: single|bool|True
+    record_drivers: single|bool|True
 track_player:
     __valid_in__: machine, mode, show
     action: single|enum(play,stop,pause,set_volume,stop_all_sounds)|
@@ -127,4 +127,4 @@ class DataManager(MpfController):
 
         # if dirty write data one last time during shutdown
         if self._dirty.is_set():
-            FileManager.save(self.filename, data)
+            FileManager.save(self.filename, copy.deepcopy(self.data))
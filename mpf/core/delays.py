@@ -1,9 +1,8 @@
 """Contains the DelayManager and DelayManagerRegistry base classes."""
 
-import uuid
-from functools import partial
+from itertools import count
 
-from typing import Any, Callable, Dict, Set
+from typing import Any, Callable, Dict, Set, Union
 
 from mpf.core.mpf_controller import MpfController
 
@@ -51,13 +50,19 @@ class DelayManager(MpfController):
 
     def __init__(self, registry: DelayManagerRegistry) -> None:
         """Initialise delay manager."""
-        self.delays = {}        # type: Dict[str, Any]
+        self.delays = {}        # type: Dict[Any, int]
         super().__init__(registry.machine)
         self.registry = registry
         self.registry.add_delay_manager(self)
+        self._unnamed_delays = count(1)
+
+    @property
+    def _timer_wheel(self):
+        # the clock may not exist yet when the delay manager is created
+        return self.machine.clock.timer_wheel
 
     def add(self, ms: int, callback: Callable[..., None], name: str = None,
-            **kwargs) -> str:
+            **kwargs) -> Union[str, int]:
         """Add a delay.
 
         Args:
@@ -65,50 +70,45 @@ class DelayManager(MpfController):
             callback: The method that is called when this delay ends.
             name: String name of this delay. This name is arbitrary and only
                 used to identify the delay later if you want to remove or
-                change it. If you don't provide it, a UUID4 name will be
-                created.
+                change it. If you don't provide it, a unique integer name
+                will be created.
             **kwargs: Any other (optional) kwarg pairs you pass will be
                 passed along as kwargs to the callback method.
 
         Returns:
-            String name or UUID4 of the delay which you can use to remove it
-            later.
+            Name of the delay which you can use to remove it later. This is
+            an integer for delays added without a name.
         """
         if not name:
-            name = str(uuid.uuid4())
+            name = next(self._unnamed_delays)
         self.debug_log("Adding delay. Name: '%s' ms: %s, callback: %s, "
                        "kwargs: %s", name, ms, callback, kwargs)
 
-        if name in self.delays:
-            self.machine.clock.unschedule(self.delays[name])
-            del self.delays[name]
+        handle = self.delays.pop(name, None)
+        if handle is not None:
+            self._timer_wheel.cancel(handle)
 
-        self.delays[name] = self.machine.clock.schedule_once(
-            partial(self._process_delay_callback, name, callback, **kwargs),
-            ms / 1000.0)
+        self.delays[name] = self._timer_wheel.add(ms / 1000.0, self._process_delay_callback, name, callback, kwargs)
 
         return name
 
-    def remove(self, name: str):
+    def remove(self, name: Union[str, int]):
         """Remove a delay by name.
 
         Removing a delay prevents the callback from being called and cancels
         the delay.
 
         Args:
-            name: String name of the delay you want to remove. If there is no
+            name: Name of the delay you want to remove. If there is no
                 delay with this name, that's ok. Nothing happens.
         """
         self.debug_log("Removing delay: '%s'", name)
-        if name in self.delays:
-            self.machine.clock.unschedule(self.delays[name])
-            try:
-                del self.delays[name]
-            except KeyError:
-                pass
+        handle = self.delays.pop(name, None)
+        if handle is not None:
+            self._timer_wheel.cancel(handle)
 
     def add_if_doesnt_exist(self, ms: int, callback: Callable[..., None],
-                            name: str, **kwargs) -> str:
+                            name: Union[str, int], **kwargs) -> Union[str, int]:
         """Add a delay only if a delay with that name doesn't exist already.
 
         Args:
@@ -122,26 +122,26 @@ class DelayManager(MpfController):
                 passed along as kwargs to the callback method.
 
         Returns:
-            String name of the delay which you can use to remove it later.
+            Name of the delay which you can use to remove it later.
         """
         if not self.check(name):
             return self.add(ms, callback, name, **kwargs)
         else:
             return name
 
-    def check(self, delay: str) -> bool:
+    def check(self, delay: Union[str, int]) -> bool:
         """Check to see if a delay exists.
 
         Args:
-            delay: A string of the delay you're checking for.
+            delay: Name of the delay you're checking for.
 
         Returns:
             True if the delay exists. False otherwise.
         """
         return delay in self.delays
 
-    def reset(self, ms: int, callback: Callable[..., None], name: str,
-              **kwargs) -> str:
+    def reset(self, ms: int, callback: Callable[..., None], name: Union[str, int],
+              **kwargs) -> Union[str, int]:
         """Reset a delay.
 
         Resetting will first delete the existing delay (if it exists) and then
@@ -154,29 +154,24 @@ class DelayManager(MpfController):
             callback: The method that is called when this delay ends.
             name: String name of this delay. This name is arbitrary and only
                 used to identify the delay later if you want to remove or
-                change it. If you don't provide it, a UUID4 name will be
-                created.
+                change it. If you don't provide it, a unique integer name
+                will be created.
             **kwargs: Any other (optional) kwarg pairs you pass will be
                 passed along as kwargs to the callback method.
 
         Returns:
-            String name or UUID4 of the delay which you can use to remove it
-            later.
+            Name of the delay which you can use to remove it later.
         """
-        if name in self.delays:
-            self.remove(name)
-
         return self.add(ms, callback, name, **kwargs)
 
     def clear(self) -> None:
         """Remove (clear) all the delays associated with this DelayManager."""
-        for name in list(self.delays.keys()):
-            self.machine.clock.unschedule(self.delays[name])
-            self.remove(name)
+        for handle in self.delays.values():
+            self._timer_wheel.cancel(handle)
 
         self.delays = {}
 
-    def run_now(self, name: str):
+    def run_now(self, name: Union[str, int]):
         """Run a delay callback now instead of waiting until its time comes.
 
         This will cancel the future running of the delay callback.
@@ -185,24 +180,20 @@ class DelayManager(MpfController):
             name: Name of the delay to run. If this name is not an active
                 delay, that's fine. Nothing happens.
         """
-        if name in self.delays:
-            try:
-                # have to save the callback ref first, since if the callback
-                # schedules a new delay with the same name, then the removal
-                # will remove it
-                # pylint: disable-msg=protected-access
-                cb = self.delays[name]._callback
-                self.remove(name)
-                cb()
-            except KeyError:
-                pass
-
-    def _process_delay_callback(self, name: str, callback: Callable[..., None], **kwargs):
+        handle = self.delays.pop(name, None)
+        if handle is None:
+            return
+
+        # have to remove the delay first, since the callback may schedule a
+        # new delay with the same name
+        delay = self._timer_wheel.pop(handle)
+        if delay:
+            callback, args = delay
+            callback(*args)
+
+    def _process_delay_callback(self, name, callback: Callable[..., None], kwargs):
         # Process the delay callback and run the event queue afterwards
         self.debug_log("---Processing delay: %s", name)
-        try:
-            del self.delays[name]
-        except KeyError:
-            pass
+        self.delays.pop(name, None)
         callback(**kwargs)
         self.machine.events.process_event_queue()
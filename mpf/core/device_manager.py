@@ -62,6 +62,7 @@ class DeviceManager(MpfController):
 
         """
         self.machine.bcp.interface.notify_device_changes(device, notify, old, value)
+        self.machine.placeholder_manager.dependencies.notify(("device", device.collection, device.name, notify))
 
     def _load_device_config_spec(self, **kwargs):
         del kwargs
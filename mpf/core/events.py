@@ -1,14 +1,19 @@
 """Classes for the EventManager and QueuedEvents."""
 import inspect
+import sys
+import bisect
+import heapq
+import itertools
 from collections import deque, namedtuple
 import uuid
 
 import asyncio
 from enum import Enum
 from functools import partial
+from operator import itemgetter
 from unittest.mock import MagicMock
 
-from typing import Dict, Any, Tuple, Optional, Generator, Callable, List
+from typing import Dict, Any, Tuple, Optional, Generator, Callable, List, Iterator, Set
 
 from mpf.core.mpf_controller import MpfController
 
@@ -22,6 +27,29 @@ EventHandlerKey = namedtuple("EventHandlerKey", ["key", "event"])
 RegisteredHandler = namedtuple("RegisteredHandler", ["callback", "priority", "kwargs", "key", "condition",
                                                      "blocking_facility"])
 PostedEvent = namedtuple("PostedEvent", ["event", "type", "callback", "kwargs"])
+HandlerSpec = namedtuple("HandlerSpec", ["event", "handler", "priority", "blocking_facility", "kwargs"])
+
+
+class EventIds(dict):
+
+    """Maps names to interned event ids which share a prefix and suffix.
+
+    Ids are the lowercase event names. They are computed once per name and can
+    be posted with :meth:`EventManager.post_by_id`.
+    """
+
+    __slots__ = ["prefix", "suffix"]
+
+    def __init__(self, prefix: str = "", suffix: str = "") -> None:
+        """Initialise event id cache."""
+        super().__init__()
+        self.prefix = prefix
+        self.suffix = suffix
+
+    def __missing__(self, name: str) -> str:
+        """Create the id for a name."""
+        event_id = self[name] = sys.intern((self.prefix + name + self.suffix).lower())
+        return event_id
 
 
 class EventManager(MpfController):
@@ -39,6 +67,18 @@ class EventManager(MpfController):
         self.callback_queue = deque([])     # type: Deque[Tuple[Any, dict]]
         self.monitor_events = False
         self._queue_tasks = []              # type: List[asyncio.Task]
+        self._event_id_caches = {}          # type: Dict[Tuple[str, str], EventIds]
+        self._event_ids = self.get_event_ids()
+        self._event_conditions = {}         # type: Dict[str, Tuple[str, Optional[BaseTemplate]]]
+
+        # handlers of an event are ordered by (-priority, seq). _sort_keys holds those keys in the same order
+        # as registered_handlers so handlers can be found and inserted with bisect.
+        self._sort_keys = {}                # type: Dict[str, List[Tuple[int, int]]]
+        self._handler_seq = itertools.count()
+        # reverse indexes from handler key and callback to the registered handler
+        self._handlers_by_key = {}          # type: Dict[uuid.UUID, Tuple[str, Tuple[int, int], RegisteredHandler]]
+        self._keys_by_callback = {}         # type: Dict[Any, Set[uuid.UUID]]
+        self._unhashable_keys = set()       # type: Set[uuid.UUID]
 
         self.add_handler("debug_dump_stats", self._debug_dump_events)
 
@@ -59,6 +99,24 @@ class EventManager(MpfController):
 
         self.log.info("--- DEBUG DUMP EVENTS END ---")
 
+    def get_event_ids(self, prefix: str = "", suffix: str = "") -> EventIds:
+        """Return the event ids for all events with a prefix and suffix.
+
+        Producers which post events for dynamic names (e.g. ``player_`` + var
+        name) should keep a reference to this and use
+        ``post_by_id(event_ids[name])`` instead of building the name on every
+        post.
+        """
+        try:
+            return self._event_id_caches[(prefix, suffix)]
+        except KeyError:
+            event_ids = self._event_id_caches[(prefix, suffix)] = EventIds(prefix, suffix)
+            return event_ids
+
+    def get_event_id(self, event: str) -> str:
+        """Return the interned id for an event name."""
+        return self._event_ids[event]
+
     def get_event_and_condition_from_string(self, event_string: str) -> Tuple[str, Optional["BaseTemplate"]]:
         """Parse an event string to divide the event name from a possible placeholder / conditional in braces.
 
@@ -74,13 +132,20 @@ class EventManager(MpfController):
                 exists, or None if it doesn't.
 
         """
-        if event_string.find("{") > 0 and event_string[-1:] == "}":
-            return (event_string[0:event_string.find("{")].lower(),
-                    self.machine.placeholder_manager.build_bool_template(
-                        event_string[event_string.find("{") + 1:-1]))
+        try:
+            return self._event_conditions[event_string]
+        except KeyError:
+            pass
 
+        if event_string.find("{") > 0 and event_string[-1:] == "}":
+            result = (self._event_ids[event_string[0:event_string.find("{")]],
+                      self.machine.placeholder_manager.build_bool_template(
+                          event_string[event_string.find("{") + 1:-1]))     # type: Tuple[str, Optional[BaseTemplate]]
         else:
-            return event_string.lower(), None
+            result = self._event_ids[event_string], None
+
+        self._event_conditions[event_string] = result
+        return result
 
     def add_async_handler(self, event: str, handler: Any, priority: int = 1, blocking_facility: Any = None,
                           **kwargs) -> EventHandlerKey:
@@ -139,6 +204,114 @@ class EventManager(MpfController):
         for handler in handler_list:
         ``events.remove_handler(my_handler)``
         """
+        event, registered_handler = self._build_handler(event, handler, priority, blocking_facility, kwargs)
+        sort_key = self._index_handler(event, registered_handler)
+
+        # Add an entry for this event if it's not there already
+        if event not in self.registered_handlers:
+            self.registered_handlers[event] = []
+            self._sort_keys[event] = []
+
+        # Insert the handler at its place in the priority order. We do it now
+        # so the list is pre-sorted so we don't have to do that with each
+        # event post. Handlers with the same priority stay in the order they
+        # were added.
+        sort_keys = self._sort_keys[event]
+        index = bisect.bisect_right(sort_keys, sort_key)
+        sort_keys.insert(index, sort_key)
+        self.registered_handlers[event].insert(index, registered_handler)
+
+        self._verify_handler(event, sort_key, registered_handler)
+
+        return EventHandlerKey(registered_handler.key, event)
+
+    def add_handlers(self, handlers: List[HandlerSpec]) -> List[EventHandlerKey]:
+        """Register a bundle of event handlers at once.
+
+        This is equivalent to calling :meth:`add_handler` for every entry but
+        only merges once into the sorted handler list of every affected event.
+        Handlers with the same priority are called in the same order as if
+        they were added one by one.
+
+        Args:
+            handlers: A list of :class:`HandlerSpec`.
+
+        Returns:
+            A list of keys in the same order as handlers.
+        """
+        keys = []
+        new_handlers = {}   # type: Dict[str, List[Tuple[Tuple[int, int], RegisteredHandler]]]
+        for spec in handlers:
+            event, registered_handler = self._build_handler(spec.event, spec.handler, spec.priority,
+                                                            spec.blocking_facility, spec.kwargs)
+            sort_key = self._index_handler(event, registered_handler)
+            new_handlers.setdefault(event, []).append((sort_key, registered_handler))
+            keys.append(EventHandlerKey(registered_handler.key, event))
+
+        for event, event_handlers in new_handlers.items():
+            event_handlers.sort(key=itemgetter(0))
+            existing_handlers = self.registered_handlers.get(event)
+            if existing_handlers:
+                # sort keys are unique so the merge never compares handlers
+                merged = list(heapq.merge(zip(self._sort_keys[event], existing_handlers), event_handlers))
+            else:
+                merged = event_handlers
+            self._sort_keys[event] = [sort_key for sort_key, _ in merged]
+            self.registered_handlers[event] = [handler for _, handler in merged]
+
+            for sort_key, registered_handler in event_handlers:
+                self._verify_handler(event, sort_key, registered_handler)
+
+        return keys
+
+    def _index_handler(self, event: str, registered_handler: RegisteredHandler) -> Tuple[int, int]:
+        """Add handler to the reverse indexes and return its sort key."""
+        sort_key = (-registered_handler.priority, next(self._handler_seq))
+        self._handlers_by_key[registered_handler.key] = (event, sort_key, registered_handler)
+        try:
+            self._keys_by_callback.setdefault(registered_handler.callback, set()).add(registered_handler.key)
+        except TypeError:
+            self._unhashable_keys.add(registered_handler.key)
+        return sort_key
+
+    def _unindex_handler(self, registered_handler: RegisteredHandler) -> None:
+        """Remove handler from the reverse indexes."""
+        del self._handlers_by_key[registered_handler.key]
+        if registered_handler.key in self._unhashable_keys:
+            self._unhashable_keys.remove(registered_handler.key)
+            return
+        keys = self._keys_by_callback[registered_handler.callback]
+        keys.discard(registered_handler.key)
+        if not keys:
+            del self._keys_by_callback[registered_handler.callback]
+
+    def _get_keys_for_callback(self, callback: Any) -> List[uuid.UUID]:
+        """Return the keys of all handlers which are registered with callback."""
+        try:
+            keys = list(self._keys_by_callback.get(callback, ()))
+        except TypeError:
+            keys = []
+        if self._unhashable_keys:
+            keys.extend(key for key in self._unhashable_keys if self._handlers_by_key[key][2].callback == callback)
+        return keys
+
+    def _remove_handler_with_key(self, key: uuid.UUID) -> Optional[RegisteredHandler]:
+        """Remove a handler using the indexes. Return the removed handler."""
+        entry = self._handlers_by_key.get(key)
+        if entry is None:
+            return None
+        event, sort_key, registered_handler = entry
+        sort_keys = self._sort_keys[event]
+        index = bisect.bisect_left(sort_keys, sort_key)
+        del sort_keys[index]
+        del self.registered_handlers[event][index]
+        self._unindex_handler(registered_handler)
+        self._remove_event_if_empty(event)
+        return registered_handler
+
+    def _build_handler(self, event: str, handler: Any, priority: int, blocking_facility: Any,
+                       kwargs: dict) -> Tuple[str, RegisteredHandler]:
+        """Validate a handler and return its event and registered handler."""
         if not callable(handler):
             raise ValueError('Cannot add handler "{}" for event "{}". Did you '
                              'accidentally add parenthesis to the end of the '
@@ -155,10 +328,6 @@ class EventManager(MpfController):
 
         event, condition = self.get_event_and_condition_from_string(event)
 
-        # Add an entry for this event if it's not there already
-        if event not in self.registered_handlers:
-            self.registered_handlers[event] = []
-
         key = uuid.uuid4()
 
         # An event 'handler' in our case is a tuple with 4 elements:
@@ -166,9 +335,6 @@ class EventManager(MpfController):
         if hasattr(handler, "relative_priority") and not isinstance(handler, MagicMock):
             priority += handler.relative_priority
 
-        self.registered_handlers[event].append(RegisteredHandler(handler, priority, kwargs, key, condition,
-                                                                 blocking_facility))
-
         try:
             self.debug_log("Registered %s as a handler for '%s', priority: %s, "
                            "kwargs: %s",
@@ -176,51 +342,48 @@ class EventManager(MpfController):
         except IndexError:
             pass
 
-        # Sort the handlers for this event based on priority. We do it now
-        # so the list is pre-sorted so we don't have to do that with each
-        # event post.
-        self.registered_handlers[event].sort(key=lambda x: x.priority, reverse=True)
-
-        if self._info_to_console or self._info_to_file or True:
-            self._verify_handlers(event, self.registered_handlers[event])
+        return event, RegisteredHandler(handler, priority, kwargs, key, condition, blocking_facility)
 
-        return EventHandlerKey(key, event)
+    def _verify_handler(self, event, sort_key, new_handler):
+        """Verify that no races can happen with a newly added handler.
 
-    def _verify_handlers(self, event, sorted_handlers):
-        """Verify that no races can happen."""
-        if not sorted_handlers:
+        Only handlers with the same priority are checked. They are found with
+        bisect.
+        """
+        # same priority order is random. check that is does not happen on one class
+        cls = self._get_handler_class(new_handler)
+        if cls is None:
             return
-        priority = -1
-        devices = []
-        for handler in sorted_handlers:
-            # if priority is different we are fine
-            if priority != handler.priority:
-                priority = handler.priority
-                devices = []
-
-            # same priority order is random. check that is does not happen on one class
-            if not inspect.ismethod(handler.callback):
-                continue
-            cls = handler.callback.__self__
-
-            # noinspection PyProtectedMember
-            # pylint: disable-msg=protected-access
-            if hasattr(self.machine, "device_manager") and cls == self.machine.device_manager and \
-                    handler.callback == self.machine.device_manager._control_event_handler:
-                cls = (handler.kwargs["callback"].__self__, handler.kwargs["ms_delay"])
-
-            if cls in devices:
-                handlers = [h for h in sorted_handlers if h.priority == priority and
-                            inspect.ismethod(h.callback) and
-                            h.condition == handler.condition and
-                            h.callback.__self__ == handler.callback.__self__]
-
-                self.info_log(
-                    "Duplicate handler for class {} on event {} with priority {}. Handlers: {}".format(
-                        cls, event, priority, handlers
-                    )
+
+        sort_keys = self._sort_keys[event]
+        handlers = self.registered_handlers[event]
+        start = bisect.bisect_left(sort_keys, (sort_key[0], -1))
+        end = bisect.bisect_left(sort_keys, (sort_key[0] + 1, -1))
+        duplicates = [handler for handler in handlers[start:end]
+                      if handler is not new_handler and self._get_handler_class(handler) == cls]
+        if duplicates:
+            handlers = [h for h in handlers[start:end] if
+                        inspect.ismethod(h.callback) and
+                        h.condition == new_handler.condition and
+                        h.callback.__self__ == new_handler.callback.__self__]
+
+            self.info_log(
+                "Duplicate handler for class {} on event {} with priority {}. Handlers: {}".format(
+                    cls, event, new_handler.priority, handlers
                 )
-            devices.append(cls)
+            )
+
+    def _get_handler_class(self, handler):
+        if not inspect.ismethod(handler.callback):
+            return None
+        cls = handler.callback.__self__
+
+        # noinspection PyProtectedMember
+        # pylint: disable-msg=protected-access
+        if hasattr(self.machine, "device_manager") and cls == self.machine.device_manager and \
+                handler.callback == self.machine.device_manager._control_event_handler:
+            cls = (handler.kwargs["callback"].__self__, handler.kwargs["ms_delay"])
+        return cls
 
     def replace_handler(self, event: str, handler: Any, priority: int = 1,
                         **kwargs: dict) -> EventHandlerKey:
@@ -247,17 +410,10 @@ class EventManager(MpfController):
         # remove it.
         event = event.lower()
 
-        if event in self.registered_handlers:
-            if kwargs:
-                # slice the full list [:] to make a copy so we can delete from the
-                # original while iterating
-                for rh in self.registered_handlers[event][:]:
-                    if rh[0] == handler and rh[2] == kwargs:
-                        self.registered_handlers[event].remove(rh)
-            else:
-                for rh in self.registered_handlers[event][:]:
-                    if rh[0] == handler:
-                        self.registered_handlers[event].remove(rh)
+        for key in self._get_keys_for_callback(handler):
+            handler_event, _, registered_handler = self._handlers_by_key[key]
+            if handler_event == event and (not kwargs or registered_handler.kwargs == kwargs):
+                self._remove_handler_with_key(key)
 
         return self.add_handler(event, handler, priority, **kwargs)
 
@@ -266,8 +422,9 @@ class EventManager(MpfController):
 
         Use carefully. This is currently used to remove handlers for all init events which only occur once.
         """
-        if event in self.registered_handlers:
-            del self.registered_handlers[event]
+        for registered_handler in self.registered_handlers.pop(event, []):
+            self._unindex_handler(registered_handler)
+        self._sort_keys.pop(event, None)
 
     def remove_handler(self, method: Any) -> None:
         """Remove an event handler from all events a method is registered to handle.
@@ -275,16 +432,10 @@ class EventManager(MpfController):
         Args:
             method : The method whose handlers you want to remove.
         """
-        events_to_delete_if_empty = []
-        for event, handler_list in self.registered_handlers.items():
-            for handler_tup in handler_list[:]:  # copy via slice
-                if handler_tup[0] == method:
-                    handler_list.remove(handler_tup)
-                    self.debug_log("Removing method %s from event %s", (str(method).split(' '))[2], event)
-                    events_to_delete_if_empty.append(event)
-
-        for event in events_to_delete_if_empty:
-            self._remove_event_if_empty(event)
+        for key in self._get_keys_for_callback(method):
+            event = self._handlers_by_key[key][0]
+            self._remove_handler_with_key(key)
+            self.debug_log("Removing method %s from event %s", method, event)
 
     def remove_handler_by_event(self, event: str, handler: Any) -> None:
         """Remove the handler you pass from the event you pass.
@@ -302,16 +453,10 @@ class EventManager(MpfController):
         """
         event = event.lower()
 
-        events_to_delete_if_empty = []
-        if event in self.registered_handlers:
-            for handler_tup in self.registered_handlers[event][:]:
-                if handler_tup[0] == handler:
-                    self.registered_handlers[event].remove(handler_tup)
-                    self.debug_log("Removing method %s from event %s", (str(handler).split(' '))[2], event)
-                    events_to_delete_if_empty.append(event)
-
-        for this_event in events_to_delete_if_empty:
-            self._remove_event_if_empty(this_event)
+        for key in self._get_keys_for_callback(handler):
+            if self._handlers_by_key[key][0] == event:
+                self._remove_handler_with_key(key)
+                self.debug_log("Removing method %s from event %s", handler, event)
 
     def remove_handler_by_key(self, key: EventHandlerKey) -> None:
         """Remove a registered event handler by key.
@@ -319,25 +464,39 @@ class EventManager(MpfController):
         Args:
             key: The key of the handler you want to remove
         """
-        if key.event not in self.registered_handlers:
-            return
-        events_to_delete_if_empty = []
-        for handler_tup in self.registered_handlers[key.event][:]:  # copy via slice
-            if handler_tup.key == key.key:
-                self.registered_handlers[key.event].remove(handler_tup)
-                self.debug_log("Removing method %s from event %s", (str(handler_tup[0]).split(' '))[2], key.event)
-                events_to_delete_if_empty.append(key.event)
-        for event in events_to_delete_if_empty:
-            self._remove_event_if_empty(event)
+        registered_handler = self._remove_handler_with_key(key.key)
+        if registered_handler:
+            self.debug_log("Removing method %s from event %s", registered_handler.callback, key.event)
 
     def remove_handlers_by_keys(self, key_list: List[EventHandlerKey]) -> None:
         """Remove multiple event handlers based on a passed list of keys.
 
+        The handler list of every affected event is filtered only once.
+
         Args:
             key_list: A list of keys of the handlers you want to remove
         """
+        keys_by_event = {}  # type: Dict[str, Set[uuid.UUID]]
         for key in key_list:
-            self.remove_handler_by_key(key)
+            entry = self._handlers_by_key.get(key.key)
+            if entry:
+                keys_by_event.setdefault(entry[0], set()).add(key.key)
+
+        for event, keys in keys_by_event.items():
+            if len(keys) == 1:
+                self._remove_handler_with_key(next(iter(keys)))
+                continue
+
+            remaining = [(sort_key, handler) for sort_key, handler in
+                         zip(self._sort_keys[event], self.registered_handlers[event]) if handler.key not in keys]
+            for key in keys:
+                self._unindex_handler(self._handlers_by_key[key][2])
+            if remaining:
+                self._sort_keys[event] = [sort_key for sort_key, _ in remaining]
+                self.registered_handlers[event] = [handler for _, handler in remaining]
+            else:
+                del self.registered_handlers[event]
+                del self._sort_keys[event]
 
     def _remove_event_if_empty(self, event: str) -> None:
         # Checks to see if the event doesn't have any more registered handlers,
@@ -348,6 +507,7 @@ class EventManager(MpfController):
 
         if not self.registered_handlers[event]:  # if value is empty list
             del self.registered_handlers[event]
+            del self._sort_keys[event]
             self.debug_log("Removing event %s since there are no more"
                            " handlers registered for it", event)
 
@@ -436,6 +596,14 @@ class EventManager(MpfController):
         """
         self._post(event, ev_type=None, callback=callback, **kwargs)
 
+    def post_by_id(self, event_id: str, callback=None, **kwargs) -> None:
+        """Post an event by its id.
+
+        This is the same as :meth:`post` but skips the name normalisation.
+        Use :meth:`get_event_id` or :meth:`get_event_ids` to get the id.
+        """
+        self._post_event(event_id, None, callback, kwargs)
+
     def post_boolean(self, event: str, callback=None, **kwargs) -> None:
         """Post an boolean event which causes all the registered handlers to be called one-by-one.
 
@@ -544,27 +712,31 @@ class EventManager(MpfController):
         self._post(event, ev_type='relay', callback=callback, **kwargs)
 
     def _post(self, event: str, ev_type: Optional[str], callback, **kwargs: dict) -> None:
+        self._post_event(event.lower(), ev_type, callback, kwargs)
 
-        event = event.lower()
-
+    def _post_event(self, event: str, ev_type: Optional[str], callback, kwargs: dict) -> None:
         if self._debug_to_console or self._debug_to_file:
             self.debug_log("Event: ===='%s'==== Type: %s, Callback: %s, "
                            "Args: %s", event, ev_type, callback, kwargs)
         elif not kwargs.get("_silent", False):
             self.info_log("Event: ======'%s'====== Args=%s", event, kwargs)
 
-        # fast path for events without handler
-        if not callback and not self.monitor_events and event not in self.registered_handlers:
-            return
-
-        if not self.event_queue and hasattr(self.machine.clock, "loop"):
-            self.machine.clock.loop.call_soon(self.process_event_queue)
+        if "events" in self.machine.monitors:
+            for monitor in self.machine.monitors["events"]:
+                monitor(event, ev_type, kwargs)
 
         posted_event = PostedEvent(event, ev_type, callback, kwargs)
 
         if self.monitor_events and not kwargs.get("_silent", False):
             self.machine.bcp.interface.monitor_posted_event(posted_event)
 
+        # fast path for events without handler (also when monitored)
+        if not callback and event not in self.registered_handlers:
+            return
+
+        if not self.event_queue and hasattr(self.machine.clock, "loop"):
+            self.machine.clock.loop.call_soon(self.process_event_queue)
+
         self.event_queue.append(posted_event)
         self.debug_log("+============= EVENTS QUEUE =============")
         for this_event in list(self.event_queue):    # type: ignore
@@ -572,9 +744,12 @@ class EventManager(MpfController):
                            this_event[2], this_event[3])
         self.debug_log("+========================================")
 
-    @asyncio.coroutine
-    def _run_handlers_sequential(self, event: str, callback, kwargs: dict) -> Generator[int, None, None]:
-        """Run all handlers for an event."""
+    def _run_handlers_sequential(self, event: str, callback, kwargs: dict) -> None:
+        """Run all handlers for a queue event.
+
+        Handlers are run synchronously. Only when a handler registers a wait
+        the remaining handlers are run in a task after the wait is cleared.
+        """
         self.debug_log("^^^^ Processing queue event '%s'. Callback: %s,"
                        " Args: %s", event, callback, kwargs)
 
@@ -582,11 +757,34 @@ class EventManager(MpfController):
         if event not in self.registered_handlers:
             return
 
-        # Now let's call the handlers one-by-one, including any kwargs
-        for handler in self.registered_handlers[event][:]:
-            # use slice above so we don't process new handlers that came
-            # in while we were processing previous handlers
+        # use a copy so we don't process new handlers that came in while we
+        # were processing previous handlers
+        handlers = iter(self.registered_handlers[event][:])
+        queue = self._run_queue_handlers(event, handlers, kwargs)
+
+        if queue:
+            task = self.machine.clock.loop.create_task(
+                self._wait_for_queue_handlers(event, callback, kwargs, handlers, queue))
+            task.add_done_callback(self._done)
+            self._queue_tasks.append(task)
+        else:
+            self._finish_queue_event(event, callback, kwargs)
 
+    @asyncio.coroutine
+    def _wait_for_queue_handlers(self, event: str, callback, kwargs: dict, handlers: Iterator[RegisteredHandler],
+                                 queue: "QueuedEvent") -> Generator[int, None, None]:
+        """Wait for a handler which registered a wait and run the remaining handlers afterwards."""
+        while queue:
+            yield from queue.event.wait()
+            queue = self._run_queue_handlers(event, handlers, kwargs)
+
+        self._finish_queue_event(event, callback, kwargs)
+
+    def _run_queue_handlers(self, event: str, handlers: Iterator[RegisteredHandler],
+                            kwargs: dict) -> Optional["QueuedEvent"]:
+        """Run handlers until one of them registers a wait and return its queue."""
+        # Now let's call the handlers one-by-one, including any kwargs
+        for handler in handlers:
             # merge the post's kwargs with the registered handler's kwargs
             # in case of conflict, handlers kwargs will win
             merged_kwargs = dict(list(kwargs.items()) + list(handler.kwargs.items()))
@@ -615,8 +813,11 @@ class EventManager(MpfController):
 
             if queue.waiter:
                 queue.event = asyncio.Event(loop=self.machine.clock.loop)
-                yield from queue.event.wait()
+                return queue
 
+        return None
+
+    def _finish_queue_event(self, event: str, callback, kwargs: dict) -> None:
         self.debug_log("vvvv Finished queue event '%s'. Callback: %s. "
                        "Args: %s", event, callback, kwargs)
 
@@ -677,9 +878,9 @@ class EventManager(MpfController):
             # fast path if there are not handlers
             self.callback_queue.append((callback, kwargs))
         else:
-            task = self.machine.clock.loop.create_task(self._run_handlers_sequential(event, callback, kwargs))
-            task.add_done_callback(self._done)
-            self._queue_tasks.append(task)
+            # handlers run in the next loop iteration (like a task would). a
+            # task is only created if one of the handlers waits
+            self.machine.clock.loop.call_soon(self._run_handlers_sequential, event, callback, kwargs)
 
     def _done(self, future):
         """Remove queue task from list and evaluate result."""
@@ -1,5 +1,9 @@
-"""Contains the LogMixin class."""
+"""Contains the LogMixin class and the non-blocking log handlers."""
+import copy
 import logging
+from collections import Counter
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue, Full
 
 from mpf.exceptions.ConfigFileError import ConfigFileError
 
@@ -83,11 +87,12 @@ class LogMixin(object):
         if not self.log:
             self._logging_not_configured()
 
-        code = None
         if self._info_to_console or self._debug_to_console:
             code = 21
         elif self._info_to_file or self._debug_to_file:
             code = 11
+        else:
+            return
 
         if context:
             self.log.log(code, msg + " context: " + context, *args, **kwargs)
@@ -139,3 +144,77 @@ class LogMixin(object):
             "Logging has not been configured for the {} module. You must call "
             "configure_logging() before you can post a log message".
             format(self))
+
+
+class BoundedQueueHandler(QueueHandler):
+
+    """QueueHandler which never blocks the caller.
+
+    Records are put into a bounded queue and are formatted and written by a
+    QueueListener in a background thread. When the queue is full (e.g.
+    because the disk is slow) records are dropped and counted instead of
+    stalling the event loop.
+    """
+
+    def __init__(self, queue: Queue) -> None:
+        """Initialise handler."""
+        super().__init__(queue)
+        self.dropped_records = 0
+        self.dropped_records_by_level = Counter()     # type: Counter
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge message and args and render exception info.
+
+        Arguments may be mutable objects which change before the listener
+        thread formats the record. Therefore, the message is merged here and
+        the listener only applies its formatter. The traceback is rendered
+        here as well because it cannot be formatted later.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put record into the queue or drop it if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            self.dropped_records += 1
+            self.dropped_records_by_level[record.levelname] += 1
+
+
+class BackgroundQueueListener(QueueListener):
+
+    """QueueListener which respects handler levels and waits for space in a bounded queue when stopping."""
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """Pass record to all handlers which accept its level.
+
+        The respect_handler_level argument of QueueListener needs Python 3.5.
+        """
+        record = self.prepare(record)
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def enqueue_sentinel(self) -> None:
+        """Block until the sentinel fits into the queue."""
+        self.queue.put(self._sentinel)
+
+
+def create_queue_logging(handler: logging.Handler, queue_size: int = 10000):
+    """Wrap a handler to log from a background thread.
+
+    Returns a tuple of the BoundedQueueHandler which should be added to the
+    logger and the (already started) QueueListener which writes to handler.
+    A queue_size of 0 means unbounded.
+    """
+    log_queue = Queue(maxsize=queue_size)     # type: Queue
+    queue_handler = BoundedQueueHandler(log_queue)
+    queue_listener = BackgroundQueueListener(log_queue, handler)
+    queue_listener.start()
+    return queue_handler, queue_listener
@@ -792,10 +792,10 @@ class MachineController(LogMixin):
             self.debug_log("Setting machine_var '%s' to: %s, (prior: %s, "
                            "change: %s)", name, value, prev_value,
                            change)
-            self.events.post('machine_var_' + name,
-                             value=value,
-                             prev_value=prev_value,
-                             change=change)
+            self.events.post_by_id(self.events.get_event_ids("machine_var_")[name],
+                                   value=value,
+                                   prev_value=prev_value,
+                                   change=change)
             '''event: machine_var_(name)
 
             desc: Posted when a machine variable is added or changes value.
@@ -9,6 +9,7 @@ from typing import Set
 from typing import Tuple
 
 from mpf.core.delays import DelayManager
+from mpf.core.events import HandlerSpec
 from mpf.core.utility_functions import Util
 from mpf.core.logging import LogMixin
 from mpf.core.switch_controller import SwitchHandler
@@ -17,6 +18,7 @@ MYPY = False
 if MYPY:   # pragma: no cover
     from mpf.core.events import QueuedEvent
     from mpf.core.mode_device import ModeDevice
+    from mpf.core.device import Device
     from mpf.core.events import EventHandlerKey
     from mpf.core.player import Player
     from mpf.core.machine import MachineController
@@ -53,6 +55,7 @@ class Mode(LogMixin):
         self.stop_callbacks = []                # type: List[Callable[[], None]]
         self.event_handlers = set()             # type: Set[EventHandlerKey]
         self.switch_handlers = list()           # type: List[SwitchHandler]
+        self._handler_bundle = None             # type: Tuple[List[HandlerSpec], List[HandlerSpec], List[Device]]
         self.mode_stop_kwargs = dict()          # type: Dict[str, Any]
         self.mode_devices = set()               # type: Set[ModeDevice]
         self.start_event_kwargs = None          # type: Dict[str, Any]
@@ -192,17 +195,12 @@ class Mode(LogMixin):
 
         self._add_mode_devices()
 
-        self.debug_log("Registering mode_stop handlers")
-
-        # register mode stop events
-        if 'stop_events' in self.config['mode']:
+        if self._handler_bundle is None:
+            self._build_handler_bundle()
+        stop_handlers, control_event_handlers, control_event_devices = self._handler_bundle
 
-            for event in self.config['mode']['stop_events']:
-                # stop priority is +1 so if two modes of the same priority
-                # start and stop on the same event, the one will stop before
-                # the other starts
-                self.add_mode_event_handler(event=event, handler=self.stop,
-                                            priority=self.config['mode']['stop_priority'] + 1)
+        self.debug_log("Registering mode_stop handlers")
+        self._add_mode_event_handlers(stop_handlers)
 
         self.start_callback = callback
 
@@ -217,7 +215,10 @@ class Mode(LogMixin):
                                 mode=self,
                                 **item.kwargs))
 
-        self._setup_device_control_events()
+        self.debug_log("Registering mode-based device control_events")
+        self._add_mode_event_handlers(control_event_handlers)
+        for device in control_event_devices:
+            device.add_control_events_in_mode(self)
 
         self.machine.events.post_queue(event='mode_{}_starting'.format(self.name),
                                        callback=self._started, **kwargs)
@@ -469,12 +470,24 @@ class Mode(LogMixin):
 
         self.mode_devices = set()
 
-    def _setup_device_control_events(self) -> None:
-        # registers mode handlers for control events for all devices specified
-        # in this mode's config (not just newly-created devices)
+    def _build_handler_bundle(self) -> None:
+        """Precompute the handlers which are added on every start of this mode.
 
-        self.debug_log("Scanning mode-based config for device control_events")
+        Priorities are relative to the mode priority which is only known when
+        the mode starts.
+        """
+        stop_handlers = []
+        if 'stop_events' in self.config['mode']:
+            for event in self.config['mode']['stop_events']:
+                # stop priority is +1 so if two modes of the same priority
+                # start and stop on the same event, the one will stop before
+                # the other starts
+                stop_handlers.append(HandlerSpec(event, self.stop, self.config['mode']['stop_priority'] + 1, None,
+                                                 {}))
 
+        # control events for all devices specified in this mode's config (not
+        # just newly-created devices)
+        control_event_handlers = []
         for event, method, delay, device in (
                 self.machine.device_manager.get_device_control_events(
                 self.config)):
@@ -485,30 +498,32 @@ class Mode(LogMixin):
                 priority = 0
 
             if not delay:
-                self.add_mode_event_handler(
-                    event=event,
-                    handler=method,
-                    priority=int(priority) + 2,
-                    blocking_facility=device.class_label)
+                control_event_handlers.append(HandlerSpec(event, method, int(priority) + 2, device.class_label, {}))
             else:
-                self.add_mode_event_handler(
-                    event=event,
-                    handler=self._control_event_handler,
-                    priority=int(priority) + 2,
-                    callback=method,
-                    ms_delay=delay,
-                    blocking_facility=device.class_label)
+                control_event_handlers.append(HandlerSpec(event, self._control_event_handler, int(priority) + 2,
+                                                          device.class_label, {"callback": method,
+                                                                               "ms_delay": delay}))
 
         # get all devices in the mode
-        device_list = set()
+        device_list = []
         for collection in self.machine.device_manager.collections:
             if self.machine.device_manager.collections[collection].config_section in self.config:
                 for device, _ in \
                         iter(self.config[self.machine.device_manager.collections[collection].config_section].items()):
-                    device_list.add(self.machine.device_manager.collections[collection][device])
+                    device = self.machine.device_manager.collections[collection][device]
+                    if device not in device_list:
+                        device_list.append(device)
 
-        for device in device_list:
-            device.add_control_events_in_mode(self)
+        self._handler_bundle = (stop_handlers, control_event_handlers, device_list)
+
+    def _add_mode_event_handlers(self, handlers: List[HandlerSpec]) -> None:
+        """Add a precomputed list of handlers relative to the current mode priority."""
+        if not handlers:
+            return
+        keys = self.machine.events.add_handlers(
+            [HandlerSpec(handler.event, handler.handler, self.priority + handler.priority, handler.blocking_facility,
+                         dict(handler.kwargs, mode=self)) for handler in handlers])
+        self.event_handlers.update(keys)
 
     def _control_event_handler(self, callback: Callable[..., None], ms_delay: int = 0, **kwargs) -> None:
         del kwargs
@@ -555,13 +570,11 @@ class Mode(LogMixin):
         return key
 
     def _remove_mode_event_handlers(self) -> None:
-        for key in self.event_handlers:
-            self.machine.events.remove_handler_by_key(key)
+        self.machine.events.remove_handlers_by_keys(list(self.event_handlers))
         self.event_handlers = set()
 
     def _remove_mode_switch_handlers(self) -> None:
-        for handler in self.switch_handlers:
-            self.machine.switch_controller.remove_switch_handler_by_key(handler)
+        self.machine.switch_controller.remove_switch_handlers_by_keys(self.switch_handlers)
         self.switch_handlers = list()
 
     def initialise_mode(self) -> None:
@@ -579,6 +592,7 @@ class Mode(LogMixin):
             elif not item.config_section:
                 item.method(config=self.config, mode_path=self.path,
                             **item.kwargs)
+        self._build_handler_bundle()
         self.mode_init()
 
     def mode_init(self) -> None:
@@ -37,4 +37,4 @@ class MpfController(LogMixin, metaclass=abc.ABCMeta):
             self.machine.machine_config['logging']['console'][self.config_name],
             self.machine.machine_config['logging']['file'][self.config_name])
 
-        self.debug_log("Loading the {}".format(self.module_name))
+        self.debug_log("Loading the %s", self.module_name)
@@ -4,10 +4,12 @@ import string
 import asyncio
 import operator as op
 import abc
+import json
+import os
 import re
-from typing import Tuple, List, Any
-
-from mpf.core.utility_functions import Util
+import time
+from collections import OrderedDict
+from typing import Tuple, List, Any, Dict
 
 from mpf.core.mpf_controller import MpfController
 
@@ -26,6 +28,9 @@ bool_operators = {ast.And: lambda a, b: a and b, ast.Or: lambda a, b: a or b}
 
 comparisons = {ast.Eq: op.eq, ast.Lt: op.lt, ast.Gt: op.gt, ast.LtE: op.le, ast.GtE: op.ge, ast.NotEq: op.ne}
 
+# written to the logs folder of the machine on shutdown when template_stats is enabled
+TEMPLATE_STATS_FILE = "template_stats.json"
+
 
 class TemplateEvalError(Exception):
 
@@ -56,6 +61,15 @@ class BaseTemplate(metaclass=abc.ABCMeta):
         """Evaluate template."""
         raise NotImplementedError
 
+    def evaluate_with_dependencies(self, parameters) -> Tuple[Any, List[Tuple]]:
+        """Evaluate template and return the keys it depends on."""
+        raise AssertionError("Not possible to subscribe this template.")
+
+    def evaluate_and_subscribe(self, parameters) -> Tuple[Any, asyncio.Future]:
+        """Evaluate template and return a future which is done when the value may have changed."""
+        value, dependencies = self.evaluate_with_dependencies(parameters)
+        return value, self.placeholder_manager.dependencies.wait_for_change(dependencies)
+
 
 class BoolTemplate(BaseTemplate):
 
@@ -73,12 +87,13 @@ class BoolTemplate(BaseTemplate):
             return self.default_value
         return bool(result)
 
-    def evaluate_and_subscribe(self, parameters) -> Tuple[bool, asyncio.Future]:
-        """Evaluate template to bool and subscribe."""
-        result, subscriptions = self.placeholder_manager.evaluate_and_subscribe_template(self.template, parameters)
+    def evaluate_with_dependencies(self, parameters) -> Tuple[bool, List[Tuple]]:
+        """Evaluate template to bool and return the keys it depends on."""
+        result, dependencies = self.placeholder_manager.evaluate_template_with_dependencies(
+            self.template, parameters)
         if isinstance(result, TemplateEvalError):
             result = self.default_value
-        return bool(result), subscriptions
+        return bool(result), dependencies
 
 
 class FloatTemplate(BaseTemplate):
@@ -97,13 +112,13 @@ class FloatTemplate(BaseTemplate):
             return self.default_value
         return float(result)
 
-    def evaluate_and_subscribe(self, parameters) -> Tuple[float, asyncio.Future]:
-        """Evaluate template to float and subscribe."""
-        result, subscriptions = self.placeholder_manager.evaluate_and_subscribe_template(self.template, parameters)
+    def evaluate_with_dependencies(self, parameters) -> Tuple[float, List[Tuple]]:
+        """Evaluate template to float and return the keys it depends on."""
+        result, dependencies = self.placeholder_manager.evaluate_template_with_dependencies(
+            self.template, parameters)
         if isinstance(result, TemplateEvalError):
             result = self.default_value
-
-        return float(result), subscriptions
+        return float(result), dependencies
 
 
 class IntTemplate(BaseTemplate):
@@ -122,12 +137,13 @@ class IntTemplate(BaseTemplate):
             return self.default_value
         return int(result)
 
-    def evaluate_and_subscribe(self, parameters) -> Tuple[int, asyncio.Future]:
-        """Evaluate template to int and subscribe."""
-        result, subscriptions = self.placeholder_manager.evaluate_and_subscribe_template(self.template, parameters)
+    def evaluate_with_dependencies(self, parameters) -> Tuple[int, List[Tuple]]:
+        """Evaluate template to int and return the keys it depends on."""
+        result, dependencies = self.placeholder_manager.evaluate_template_with_dependencies(
+            self.template, parameters)
         if isinstance(result, TemplateEvalError):
             result = self.default_value
-        return int(result), subscriptions
+        return int(result), dependencies
 
 
 class StringTemplate(BaseTemplate):
@@ -144,6 +160,14 @@ class StringTemplate(BaseTemplate):
             return self.default_value
         return str(result)
 
+    def evaluate_with_dependencies(self, parameters) -> Tuple[str, List[Tuple]]:
+        """Evaluate template to string and return the keys it depends on."""
+        result, dependencies = self.placeholder_manager.evaluate_template_with_dependencies(
+            self.template, parameters)
+        if isinstance(result, TemplateEvalError):
+            result = self.default_value
+        return str(result), dependencies
+
 
 class RawTemplate(BaseTemplate):
 
@@ -159,12 +183,13 @@ class RawTemplate(BaseTemplate):
             return self.default_value
         return result
 
-    def evaluate_and_subscribe(self, parameters) -> Tuple[bool, asyncio.Future]:
-        """Evaluate template to bool and subscribe."""
-        result, subscriptions = self.placeholder_manager.evaluate_and_subscribe_template(self.template, parameters)
+    def evaluate_with_dependencies(self, parameters) -> Tuple[Any, List[Tuple]]:
+        """Evaluate template and return the keys it depends on."""
+        result, dependencies = self.placeholder_manager.evaluate_template_with_dependencies(
+            self.template, parameters)
         if isinstance(result, TemplateEvalError):
             result = self.default_value
-        return result, subscriptions
+        return result, dependencies
 
 
 class NativeTypeTemplate:
@@ -182,7 +207,12 @@ class NativeTypeTemplate:
         del fail_on_missing_params
         return self.value
 
-    def evaluate_and_subscribe(self, parameters) -> Tuple[int, asyncio.Future]:
+    def evaluate_with_dependencies(self, parameters) -> Tuple[Any, List[Tuple]]:
+        """Return value. It does not depend on anything."""
+        del parameters
+        return self.value, []
+
+    def evaluate_and_subscribe(self, parameters) -> Tuple[Any, asyncio.Future]:
         """Evaluate and subscribe template."""
         del parameters
         future = asyncio.Future(loop=self.machine.clock.loop)   # type: asyncio.Future
@@ -197,16 +227,15 @@ class MpfFormatter(string.Formatter):
         """Initialise formatter."""
         self.machine = machine
         self.parameters = parameters
-        self.subscriptions = []
+        self.dependencies = []
         self.subscribe = subscribe
 
     def get_value(self, key, args, kwargs):
         """Return value of placeholder."""
         placeholder = self.machine.placeholder_manager.build_raw_template(key)
         if self.subscribe:
-            value, future = placeholder.evaluate_and_subscribe(self.parameters)
-            if future:
-                self.subscriptions.append(future)
+            value, dependencies = placeholder.evaluate_with_dependencies(self.parameters)
+            self.dependencies.extend(dependencies)
             return value
         else:
             return placeholder.evaluate(self.parameters)
@@ -243,19 +272,16 @@ class TextTemplate:
         f = MpfFormatter(self.machine, parameters, False)
         return f.format(self.text)
 
-    def evaluate_and_subscribe(self, parameters) -> Tuple[str, asyncio.Future]:
-        """Evaluate placeholder to string and subscribe to changes."""
+    def evaluate_with_dependencies(self, parameters) -> Tuple[str, List[Tuple]]:
+        """Evaluate placeholder to string and return the keys it depends on."""
         f = MpfFormatter(self.machine, parameters, True)
         value = f.format(self.text)
-        subscriptions = f.subscriptions
-        if not subscriptions:
-            future = asyncio.Future(loop=self.machine.clock.loop)   # type: asyncio.Future
-        elif len(subscriptions) == 1:
-            future = subscriptions[0]
-        else:
-            future = Util.any(subscriptions, loop=self.machine.clock.loop)
-        future = Util.ensure_future(future, loop=self.machine.clock.loop)
-        return value, future
+        return value, f.dependencies
+
+    def evaluate_and_subscribe(self, parameters) -> Tuple[str, asyncio.Future]:
+        """Evaluate placeholder to string and subscribe to changes."""
+        value, dependencies = self.evaluate_with_dependencies(parameters)
+        return value, self.machine.placeholder_manager.dependencies.wait_for_change(dependencies)
 
 
 class BasePlaceholder(object):
@@ -263,22 +289,35 @@ class BasePlaceholder(object):
     """Base class for placeholder variables."""
 
     # pylint: disable-msg=no-self-use
-    def subscribe(self):
-        """Subscribe to placeholder."""
+    def get_dependencies(self):
+        """Return the dependency keys of this placeholder."""
         raise AssertionError("Not possible to subscribe this.")
 
     # pylint: disable-msg=no-self-use
-    def subscribe_attribute(self, item):
-        """Subscribe to attribute."""
+    def get_attribute_dependencies(self, item):
+        """Return the dependency keys of an attribute."""
         raise AssertionError("Not possible to subscribe to attribute {}.".format(item))
 
-    # pylint: disable-msg=no-self-use
-    def subscribe_item(self, item):
-        """Subscribe to item."""
-        raise AssertionError("Not possible to subscribe to item {}.".format(item))
+
+class DeviceStatePlaceholder(dict, BasePlaceholder):
+
+    """Monitorable state of a device."""
+
+    def __init__(self, device):
+        """Initialise placeholder."""
+        super().__init__(device.get_monitorable_state())
+        self._device = device
+
+    def get_dependencies(self):
+        """Changes are tracked per attribute."""
+        return []
+
+    def get_attribute_dependencies(self, item):
+        """Subscribe to a monitored attribute of the device."""
+        return [("device", self._device.collection, self._device.name, item)]
 
 
-class DeviceClassPlaceholder:
+class DeviceClassPlaceholder(BasePlaceholder):
 
     """Wrap a monitorable device."""
 
@@ -286,6 +325,15 @@ class DeviceClassPlaceholder:
         """Initialise placeholder."""
         self._devices = devices
 
+    def get_dependencies(self):
+        """Devices do not change."""
+        return []
+
+    def get_attribute_dependencies(self, item):
+        """Changes are tracked per attribute of the device."""
+        del item
+        return []
+
     def __getitem__(self, item):
         """Array access."""
         return self.__getattr__(item)
@@ -296,10 +344,10 @@ class DeviceClassPlaceholder:
         if not device:
             raise AssertionError("Device {} does not exist in placeholders.".format(item))
 
-        return device.get_monitorable_state()
+        return DeviceStatePlaceholder(device)
 
 
-class DevicesPlaceholder:
+class DevicesPlaceholder(BasePlaceholder):
 
     """Device monitor placeholder."""
 
@@ -307,6 +355,15 @@ class DevicesPlaceholder:
         """Initialise placeholder."""
         self._machine = machine
 
+    def get_dependencies(self):
+        """Device collections do not change."""
+        return []
+
+    def get_attribute_dependencies(self, item):
+        """Device collections do not change."""
+        del item
+        return []
+
     def __getitem__(self, item):
         """Array access."""
         return self.__getattr__(item)
@@ -366,13 +423,13 @@ class PlayerPlaceholder(BasePlaceholder):
         self._machine = machine     # type: MachineController
         self._number = number
 
-    def subscribe(self):
+    def get_dependencies(self):
         """Subscribe to player changes."""
-        return self._machine.events.wait_for_any_event(["player_turn_ended", "player_turn_started"])
+        return [("event", "player_turn_ended"), ("event", "player_turn_started")]
 
-    def subscribe_attribute(self, item):
+    def get_attribute_dependencies(self, item):
         """Subscribe player variable changes."""
-        return self._machine.events.wait_for_event('player_{}'.format(item))
+        return [("player", item)]
 
     def __getitem__(self, item):
         """Array access."""
@@ -407,13 +464,13 @@ class PlayersPlaceholder(BasePlaceholder):
         """Initialise placeholder."""
         self._machine = machine     # type: MachineController
 
-    def subscribe(self):
+    def get_dependencies(self):
         """Subscribe to player list changes."""
-        return self._machine.events.wait_for_any_event(["player_added", "game_ended"])
+        return [("event", "player_added"), ("event", "game_ended")]
 
-    def subscribe_attribute(self, item):
+    def get_attribute_dependencies(self, item):
         """Subscribe player variable changes."""
-        return self._machine.events.wait_for_event('player_{}'.format(item))
+        return [("player", item)]
 
     def __getitem__(self, item):
         """Array access."""
@@ -432,16 +489,13 @@ class MachinePlaceholder(BasePlaceholder):
         """Initialise placeholder."""
         self._machine = machine     # type: MachineController
 
-    def subscribe(self):
-        """Subscribe to machine changes.
+    def get_dependencies(self):
+        """Machine itself never changes."""
+        return []
 
-        Will never return.
-        """
-        return asyncio.Future(loop=self._machine.clock.loop)
-
-    def subscribe_attribute(self, item):
+    def get_attribute_dependencies(self, item):
         """Subscribe to machine variable."""
-        return self._machine.events.wait_for_event('machine_var_{}'.format(item))
+        return [("machine_var", item)]
 
     def __getitem__(self, item):
         """Array access."""
@@ -460,23 +514,154 @@ class SettingsPlaceholder(BasePlaceholder):
         """Initialise placeholder."""
         self._machine = machine  # type: MachineController
 
-    def subscribe(self):
-        """Subscribe to settings controller changes.
-
-        Will never return.
-        """
-        return asyncio.Future(loop=self._machine.clock.loop)
+    def get_dependencies(self):
+        """Settings controller itself never changes."""
+        return []
 
-    def subscribe_attribute(self, item):
+    def get_attribute_dependencies(self, item):
         """Subscribe to machine variable for this setting."""
-        return self._machine.events.wait_for_event(
-            'machine_var_{}'.format(self._machine.settings.get_setting_machine_var(item)))
+        return [("machine_var", self._machine.settings.get_setting_machine_var(item))]
 
     def __getattr__(self, item):
         """Attribute access."""
         return self._machine.settings.get_setting_value(item)
 
 
+class DependencyTracker(object):
+
+    """Track which templates depend on which player vars, machine vars, device attributes and events.
+
+    Keys are tuples like ``("player", "score")``, ``("machine_var", "name")``,
+    ``("device", "lights", "l1", "color")`` or ``("event", "game_ended")``.
+    Listeners are plain callbacks. The tracker adds one event handler per
+    watched key (and removes it again when the last listener is gone) so a
+    change only notifies the listeners of that key.
+    """
+
+    __slots__ = ["machine", "_listeners", "_handler_keys"]
+
+    def __init__(self, machine):
+        """Initialise tracker."""
+        self.machine = machine
+        self._listeners = {}        # type: Dict[Tuple, OrderedDict]
+        self._handler_keys = {}     # type: Dict[Tuple, Any]
+
+    @staticmethod
+    def _get_event_for_key(key):
+        if key[0] == "player":
+            return "player_" + key[1]
+        elif key[0] == "machine_var":
+            return "machine_var_" + key[1]
+        elif key[0] == "event":
+            return key[1]
+        # devices notify the tracker directly
+        return None
+
+    def add_listener(self, key, callback):
+        """Call callback whenever key changes."""
+        listeners = self._listeners.get(key)
+        if listeners is None:
+            listeners = self._listeners[key] = OrderedDict()
+            event = self._get_event_for_key(key)
+            if event:
+                self._handler_keys[key] = self.machine.events.add_handler(event, self._notify_event, _key=key)
+        listeners[callback] = None
+
+    def remove_listener(self, key, callback):
+        """Stop calling callback when key changes."""
+        listeners = self._listeners.get(key)
+        if listeners is None:
+            return
+        listeners.pop(callback, None)
+        if not listeners:
+            del self._listeners[key]
+            handler_key = self._handler_keys.pop(key, None)
+            if handler_key:
+                self.machine.events.remove_handler_by_key(handler_key)
+
+    def _notify_event(self, _key, **kwargs):
+        del kwargs
+        self.notify(_key)
+
+    def notify(self, key):
+        """Notify all listeners of key."""
+        listeners = self._listeners.get(key)
+        if listeners:
+            for callback in list(listeners):
+                callback()
+
+    def has_listeners(self, key) -> bool:
+        """Return true if anybody listens to key."""
+        return key in self._listeners
+
+    def wait_for_change(self, keys) -> asyncio.Future:
+        """Return a future which is done when any of keys changes."""
+        future = asyncio.Future(loop=self.machine.clock.loop)     # type: asyncio.Future
+        if not keys:
+            return future
+        keys = set(keys)
+
+        def _done(*args):
+            del args
+            for key in keys:
+                self.remove_listener(key, _changed)
+
+        def _changed():
+            _done()
+            if not future.done():
+                future.set_result(True)
+
+        for key in keys:
+            self.add_listener(key, _changed)
+        future.add_done_callback(_done)
+        return future
+
+
+class TemplateSubscription(object):
+
+    """A template which is re-evaluated when one of its dependencies changes."""
+
+    __slots__ = ["_tracker", "template", "parameters", "_callback", "_dependencies", "_pending", "_cancelled"]
+
+    def __init__(self, tracker: DependencyTracker, template, parameters, callback) -> None:
+        """Initialise subscription."""
+        self._tracker = tracker
+        self.template = template
+        self.parameters = parameters
+        self._callback = callback
+        self._dependencies = set()
+        self._pending = False
+        self._cancelled = False
+
+    def update(self):
+        """Evaluate template, update dependencies and call the callback."""
+        self._pending = False
+        if self._cancelled:
+            return
+        value, dependencies = self.template.evaluate_with_dependencies(self.parameters)
+        dependencies = set(dependencies)
+        for key in self._dependencies - dependencies:
+            self._tracker.remove_listener(key, self._changed)
+        for key in dependencies - self._dependencies:
+            self._tracker.add_listener(key, self._changed)
+        self._dependencies = dependencies
+        self._callback(value)
+
+    def _changed(self):
+        # coalesce multiple changes in the same loop iteration into one evaluation
+        if self._pending:
+            return
+        self._pending = True
+        self._tracker.machine.clock.loop.call_soon(self.update)
+
+    def cancel(self):
+        """Stop updating this template."""
+        self._cancelled = True
+        for key in self._dependencies:
+            self._tracker.remove_listener(key, self._changed)
+        self._dependencies = set()
+
+
 class BasePlaceholderManager(MpfController):
 
     """Manages templates and placeholders for MPF and MC."""
@@ -488,6 +673,13 @@ class BasePlaceholderManager(MpfController):
     def __init__(self, machine):
         """Initialise."""
         super().__init__(machine)
+        self.dependencies = DependencyTracker(machine)
+        # templates are shared between all call sites with the same type, source and default value
+        self._template_cache = {}       # type: Dict[Tuple[type, str, Any], BaseTemplate]
+        self._template_sources = {}     # type: Dict[ast.AST, Tuple[str, str]]
+        self._template_stats = None     # type: Dict[ast.AST, List]
+        self.template_cache_hits = 0
+        self.template_cache_misses = 0
         self._eval_methods = {
             ast.Num: self._eval_num,
             ast.Str: self._eval_str,
@@ -576,11 +768,11 @@ class BasePlaceholderManager(MpfController):
                 ret_value = getattr(slice_value, node.attr)
             except ValueError:
                 if subscribe:
-                    raise TemplateEvalError(subscription + [slice_value.subscribe_attribute(node.attr)])
+                    raise TemplateEvalError(subscription + slice_value.get_attribute_dependencies(node.attr))
                 else:
                     raise
         if subscribe:
-            return ret_value, subscription + [slice_value.subscribe_attribute(node.attr)]
+            return ret_value, subscription + slice_value.get_attribute_dependencies(node.attr)
         else:
             return ret_value, subscription + []
 
@@ -604,7 +796,7 @@ class BasePlaceholderManager(MpfController):
         var = self.get_global_parameters(node.id)
         if var:
             if subscribe:
-                return var, [var.subscribe()]
+                return var, var.get_dependencies()
             else:
                 return var, []
         elif node.id in variables:
@@ -621,31 +813,74 @@ class BasePlaceholderManager(MpfController):
         else:
             raise TypeError(type(node))
 
+    def _build_template(self, template_class, template_str, default_value):
+        """Return a shared template for this type, source string and default value."""
+        key = (template_class, template_str, default_value)
+        try:
+            template = self._template_cache.get(key)
+        except TypeError:
+            # unhashable default value. do not cache
+            return template_class(self._parse_template(template_str), self, default_value)
+        if template is not None:
+            self.template_cache_hits += 1
+            return template
+
+        self.template_cache_misses += 1
+        template = template_class(self._parse_template(template_str), self, default_value)
+        self._template_cache[key] = template
+        self._template_sources[template.template] = (template_class.__name__, template_str)
+        return template
+
     def build_float_template(self, template_str, default_value=0.0):
         """Build a float template from a string."""
         if isinstance(template_str, (float, int)):
             return NativeTypeTemplate(float(template_str), self.machine)
-        return FloatTemplate(self._parse_template(template_str), self, default_value)
+        return self._build_template(FloatTemplate, template_str, default_value)
 
     def build_int_template(self, template_str, default_value=0):
         """Build a int template from a string."""
         if isinstance(template_str, (float, int)):
             return NativeTypeTemplate(int(template_str), self.machine)
-        return IntTemplate(self._parse_template(template_str), self, default_value)
+        return self._build_template(IntTemplate, template_str, default_value)
 
     def build_bool_template(self, template_str, default_value=False):
         """Build a bool template from a string."""
         if isinstance(template_str, bool):
             return NativeTypeTemplate(template_str, self.machine)
-        return BoolTemplate(self._parse_template(template_str), self, default_value)
+        return self._build_template(BoolTemplate, template_str, default_value)
 
     def build_string_template(self, template_str, default_value=""):
         """Build a string template from a string."""
-        return StringTemplate(self._parse_template(template_str), self, default_value)
+        return self._build_template(StringTemplate, template_str, default_value)
 
     def build_raw_template(self, template_str, default_value=None):
         """Build a raw template from a string."""
-        return RawTemplate(self._parse_template(template_str), self, default_value)
+        return self._build_template(RawTemplate, template_str, default_value)
+
+    def enable_template_stats(self, enabled=True):
+        """Count evaluations and evaluation time of all templates."""
+        self._template_stats = {} if enabled else None
+
+    def _record_evaluation(self, template, duration):
+        stats = self._template_stats.get(template)
+        if stats is None:
+            stats = self._template_stats[template] = [0, 0.0]
+        stats[0] += 1
+        stats[1] += duration
+
+    def get_template_stats(self) -> dict:
+        """Return cache counters and evaluation statistics sorted by evaluation count."""
+        templates = []
+        for template, (count, duration) in (self._template_stats or {}).items():
+            template_type, source = self._template_sources.get(template, ("unknown", ast.dump(template)))
+            templates.append({"type": template_type, "source": source, "count": count, "time": duration})
+        templates.sort(key=lambda x: (-x["count"], -x["time"]))
+
+        return {
+            "cache": {"hits": self.template_cache_hits, "misses": self.template_cache_misses,
+                      "size": len(self._template_cache)},
+            "templates": templates
+        }
 
     def get_global_parameters(self, name):
         """Return global params."""
@@ -653,24 +888,40 @@ class BasePlaceholderManager(MpfController):
 
     def evaluate_template(self, template, parameters):
         """Evaluate template."""
-        return self._eval(template, parameters, False)[0]
+        if self._template_stats is None:
+            return self._eval(template, parameters, False)[0]
 
-    def evaluate_and_subscribe_template(self, template, parameters):
-        """Evaluate and subscribe template."""
+        start_time = time.perf_counter()
         try:
-            value, subscriptions = self._eval(template, parameters, True)
+            return self._eval(template, parameters, False)[0]
+        finally:
+            self._record_evaluation(template, time.perf_counter() - start_time)
+
+    def evaluate_template_with_dependencies(self, template, parameters):
+        """Evaluate template and return the keys it depends on."""
+        start_time = time.perf_counter() if self._template_stats is not None else None
+        try:
+            return self._eval(template, parameters, True)
         except TemplateEvalError as e:
-            value = e
-            subscriptions = e.subscriptions
+            return e, e.subscriptions
+        finally:
+            if start_time is not None:
+                self._record_evaluation(template, time.perf_counter() - start_time)
 
-        if not subscriptions:
-            future = asyncio.Future(loop=self.machine.clock.loop)
-        elif len(subscriptions) == 1:
-            future = subscriptions[0]
-        else:
-            future = Util.any(subscriptions, loop=self.machine.clock.loop)
-        future = Util.ensure_future(future, loop=self.machine.clock.loop)
-        return value, future
+    def evaluate_and_subscribe_template(self, template, parameters):
+        """Evaluate and subscribe template."""
+        value, dependencies = self.evaluate_template_with_dependencies(template, parameters)
+        return value, self.dependencies.wait_for_change(dependencies)
+
+    def subscribe_template(self, template, parameters, callback) -> "TemplateSubscription":
+        """Call callback with the value of a template now and whenever it may have changed.
+
+        Unlike evaluate_and_subscribe this registers the template with the
+        dependency tracker once and does not create any futures.
+        """
+        subscription = TemplateSubscription(self.dependencies, template, parameters, callback)
+        subscription.update()
+        return subscription
 
     def parse_conditional_template(self, template, default_number=None):
         """Parse a template for condition and number and return a dict."""
@@ -707,6 +958,30 @@ class PlaceholderManager(BasePlaceholderManager):
 
     """Manages templates and placeholders for MPF."""
 
+    def __init__(self, machine):
+        """Initialise placeholder manager."""
+        super().__init__(machine)
+        self.machine.events.add_handler('init_phase_1', self._configure_template_stats)
+
+    def _configure_template_stats(self, **kwargs):
+        del kwargs
+        if not self.machine.config['mpf']['template_stats']:
+            return
+        self.enable_template_stats()
+        self.machine.events.add_handler('shutdown', self._write_template_stats)
+
+    def get_template_stats_file(self):
+        """Return the file which template stats are written to on shutdown."""
+        return os.path.join(self.machine.machine_path, "logs", TEMPLATE_STATS_FILE)
+
+    def _write_template_stats(self, **kwargs):
+        del kwargs
+        stats_file = self.get_template_stats_file()
+        os.makedirs(os.path.dirname(stats_file), exist_ok=True)
+        with open(stats_file, "w") as f:
+            json.dump(self.get_template_stats(), f, indent=2)
+        self.info_log("Wrote template stats to %s", stats_file)
+
     # pylint: disable-msg=too-many-return-statements
     def get_global_parameters(self, name):
         """Return global params."""
@@ -1,6 +1,8 @@
 """Contains the Player class which represents a player in a pinball game."""
 import copy
 import logging
+from collections import OrderedDict
+from contextlib import contextmanager
 
 from mpf.core.utility_functions import Util
 
@@ -74,6 +76,14 @@ class Player(object):
     ``player_score`` with Args: ``value=500, change=500, prev_value=0``
     ``player_score`` with Args: ``value=1200, change=700, prev_value=500``
 
+    Variable changes can be coalesced with :meth:`batch`. All writes within
+    the block result in (at most) one event per variable which carries the net
+    change. When ``coalesce_player_var_events`` is set in the ``mpf:`` section
+    every write is batched until the end of the current loop iteration.
+
+    Use :attr:`fast_vars` to read and write variables without the attribute
+    fallbacks.
+
     """
 
     monitor_enabled = False
@@ -88,6 +98,11 @@ class Player(object):
         self.__dict__['machine'] = machine
         self.__dict__['vars'] = dict()
         self.__dict__['_events_enabled'] = False
+        self.__dict__['_var_event_ids'] = machine.events.get_event_ids("player_")
+        self.__dict__['_batch'] = None
+        self.__dict__['_batch_depth'] = 0
+        self.__dict__['_auto_batch'] = machine.config['mpf']['coalesce_player_var_events']
+        self.__dict__['fast_vars'] = PlayerVarStore(self)
 
         number = index + 1
 
@@ -166,11 +181,11 @@ class Player(object):
         :param change: The change in value or True/False
         :param player_num: The player number this variable belongs to
         """
-        self.machine.events.post('player_' + name,
-                                 value=value,
-                                 prev_value=prev_value,
-                                 change=change,
-                                 player_num=player_num)
+        self.machine.events.post_by_id(self._var_event_ids[name],
+                                       value=value,
+                                       prev_value=prev_value,
+                                       change=change,
+                                       player_num=player_num)
         '''event: player_(var_name)
 
         desc: Posted when simpler types of player variables are added or
@@ -244,6 +259,10 @@ class Player(object):
             self.__dict__[name] = value
             return
 
+        self.set_var(name, value)
+
+    def set_var(self, name, value):
+        """Set a player variable and inform about the change (or queue it when batching)."""
         new_entry = False
         prev_value = 0
         if name in self.vars:
@@ -253,6 +272,20 @@ class Player(object):
 
         self.vars[name] = value
 
+        if self._batch is None and self._auto_batch:
+            # flush at the end of this loop iteration
+            self._begin_batch()
+            self.machine.clock.loop.call_soon(self._end_batch)
+
+        if self._batch is not None:
+            # remember the value before the batch started
+            if name not in self._batch:
+                self._batch[name] = (prev_value, new_entry)
+            return
+
+        self._notify_change(name, value, prev_value, new_entry)
+
+    def _notify_change(self, name, value, prev_value, new_entry):
         try:
             change = value - prev_value
         except TypeError:
@@ -260,10 +293,44 @@ class Player(object):
 
         if (change or new_entry) and isinstance(value, (int, str, float)):
             self.log.debug("Setting '%s' to: %s, (prior: %s, change: %s)",
-                           name, self.vars[name], prev_value, change)
+                           name, value, prev_value, change)
 
             if self._events_enabled:
-                self._send_variable_event(name, self.vars[name], prev_value, change, self.vars['number'])
+                self._send_variable_event(name, value, prev_value, change, self.vars['number'])
+
+    @contextmanager
+    def batch(self):
+        """Coalesce all variable changes in this block.
+
+        Events are posted when the (outermost) block ends. Multiple writes to
+        the same variable result in one event with the net change.
+
+        .. code::
+
+            with self.machine.game.player.batch():
+                player.score += 100
+                player.score += 200     # one player_score event with change=300
+        """
+        self._begin_batch()
+        try:
+            yield self
+        finally:
+            self._end_batch()
+
+    def _begin_batch(self):
+        self._batch_depth += 1
+        if self._batch is None:
+            self._batch = OrderedDict()
+
+    def _end_batch(self):
+        self._batch_depth -= 1
+        if self._batch_depth:
+            return
+
+        batch = self._batch
+        self._batch = None
+        for name, (prev_value, new_entry) in batch.items():
+            self._notify_change(name, self.vars[name], prev_value, new_entry)
 
     def __getitem__(self, name):
         """Allow array get access."""
@@ -288,3 +355,35 @@ class Player(object):
 
         """
         return var_name in self.vars
+
+
+class PlayerVarStore(object):
+
+    """Fast access to player variables.
+
+    Reads do not create missing variables and writes skip the attribute
+    lookups of :class:`Player`. Changes are reported the same way.
+    """
+
+    __slots__ = ["_player", "_vars"]
+
+    def __init__(self, player: Player) -> None:
+        """Initialise var store."""
+        self._player = player
+        self._vars = player.vars
+
+    def get(self, name, default=0):
+        """Return value of a player variable or default if it does not exist."""
+        return self._vars.get(name, default)
+
+    def set(self, name, value):
+        """Set a player variable."""
+        self._player.set_var(name, value)
+
+    def add(self, name, value):
+        """Add value to a player variable."""
+        self._player.set_var(name, self._vars.get(name, 0) + value)
+
+    def __contains__(self, name):
+        """Return true if the player variable exists."""
+        return name in self._vars
@@ -81,13 +81,13 @@ class SettingsController(MpfController):
         else:
             value = self.machine.get_machine_var(self._settings[setting_name].machine_var)
 
-        self.debug_log("Retrieving value: {}={}".format(setting_name, value))
+        self.debug_log("Retrieving value: %s=%s", setting_name, value)
 
         return value
 
     def set_setting_value(self, setting_name, value):
         """Set the value of a setting."""
-        self.debug_log("New value: {}={}".format(setting_name, value))
+        self.debug_log("New value: %s=%s", setting_name, value)
 
         if setting_name not in self._settings:
             raise AssertionError("Invalid setting {}".format(setting_name))
@@ -0,0 +1,252 @@
+"""Contains the ShowCache which keeps parsed and validated shows."""
+import errno
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:     # pragma: no cover
+    fcntl = None
+    import msvcrt
+
+
+class ShowCache(object):
+
+    """Bounded LRU cache for show files.
+
+    Parsed show files are stored in a single cache directory which contains
+    one index plus one data file per show. The index tracks the size and the
+    order of last use of every entry. Once the total size exceeds
+    ``max_size`` bytes the least recently used entries are evicted.
+
+    Additionally, the validated steps of a show are kept in memory (up to
+    ``max_shows`` shows). Shows which are unloaded and loaded again (e.g.
+    when a mode stops and starts again) can reuse them instead of parsing and
+    validating the file again.
+
+    All methods are thread safe because the asset manager may load shows in
+    worker threads. Multiple processes may share the cache directory. Their
+    changes to the index are merged into the index on disk under a file lock
+    and data files which are not in the index are removed.
+    """
+
+    INDEX_FILE = "index"
+    LOCK_FILE = "index.lock"
+    DATA_FILE_EXTENSION = ".mpf_cache"
+
+    def __init__(self, cache_dir: str = None, max_size: int = 32 * 1024 * 1024, max_shows: int = 250) -> None:
+        """Initialise show cache."""
+        self.log = logging.getLogger("ShowCache")
+        if not cache_dir:
+            cache_dir = os.path.join(tempfile.gettempdir(), "mpf_show_cache")
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.max_shows = max_shows
+
+        self._lock = threading.Lock()
+        self._index = None      # type: OrderedDict
+        # changes to the index since it was last saved. filename -> (action, entry)
+        self._changes = OrderedDict()   # type: OrderedDict
+        self._steps = OrderedDict()     # type: OrderedDict
+
+    @staticmethod
+    def _get_mtime(filename) -> Optional[float]:
+        try:
+            return os.path.getmtime(filename)
+        except OSError:
+            return None
+
+    def _get_data_file_name(self, filename) -> str:
+        return hashlib.md5(bytes(filename, 'UTF-8')).hexdigest() + self.DATA_FILE_EXTENSION
+
+    @contextmanager
+    def _file_lock(self):
+        """Lock the cache directory against other processes."""
+        with open(os.path.join(self.cache_dir, self.LOCK_FILE), 'a+b') as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            else:   # pragma: no cover
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+                else:   # pragma: no cover
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _read_index(self) -> OrderedDict:
+        """Read the index from disk."""
+        try:
+            with open(os.path.join(self.cache_dir, self.INDEX_FILE), 'rb') as f:
+                index = pickle.load(f)
+        except OSError as exception:
+            if exception.errno != errno.ENOENT:
+                self.log.warning("Could not read show cache index: %s", exception)
+            return OrderedDict()
+        # unfortunately pickle can raise all kinds of exceptions and we dont want to crash on corrupted cache
+        # pylint: disable-msg=broad-except
+        except Exception:   # pragma: no cover
+            self.log.warning("Show cache index is corrupted. Discarding it.")
+            return OrderedDict()
+
+        if isinstance(index, OrderedDict):
+            return index
+        return OrderedDict()
+
+    def _load_index(self) -> None:
+        """Load the index from disk (if not already loaded)."""
+        if self._index is None:
+            self._index = self._read_index()
+
+    def _save_index(self) -> None:
+        """Merge our changes into the index on disk and write it.
+
+        Needs the file lock. Other processes may have changed the index since
+        we read it. Their entries are kept unless we replaced or removed them.
+        """
+        index = self._read_index()
+        for filename, (action, entry) in self._changes.items():
+            if action == "put":
+                index[filename] = entry
+                index.move_to_end(filename)
+            elif index.get(filename) == entry:
+                if action == "use":
+                    index.move_to_end(filename)
+                else:
+                    del index[filename]
+        self._changes = OrderedDict()
+
+        self._evict(index)
+        self._remove_unused_data_files(index)
+
+        tmp_file = os.path.join(self.cache_dir, "{}.{}.tmp".format(self.INDEX_FILE, os.getpid()))
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(index, f, protocol=4)
+        os.replace(tmp_file, os.path.join(self.cache_dir, self.INDEX_FILE))
+        self._index = index
+
+    def _record_change(self, filename, action, entry) -> None:
+        self._changes[filename] = (action, entry)
+        self._changes.move_to_end(filename)
+
+    def _remove_entry(self, filename) -> None:
+        """Remove an entry. Its data file is removed when the index is saved."""
+        self._record_change(filename, "remove", self._index.pop(filename))
+
+    def _evict(self, index: OrderedDict) -> None:
+        """Remove least recently used entries until the cache fits into max_size."""
+        total_size = sum(entry[1] for entry in index.values())
+        while total_size > self.max_size and index:
+            filename, entry = index.popitem(last=False)
+            total_size -= entry[1]
+            self.log.debug("Evicting show %s from cache", filename)
+
+    def _remove_unused_data_files(self, index: OrderedDict) -> None:
+        """Remove data files which are not in the index (anymore)."""
+        used_files = set(entry[2] for entry in index.values())
+        for data_file in os.listdir(self.cache_dir):
+            if data_file.endswith(self.DATA_FILE_EXTENSION) and data_file not in used_files:
+                try:
+                    os.remove(os.path.join(self.cache_dir, data_file))
+                except OSError:
+                    pass
+
+    @property
+    def size(self) -> int:
+        """Return the total size of all parsed shows on disk."""
+        with self._lock:
+            self._load_index()
+            return sum(entry[1] for entry in self._index.values())
+
+    def get_parsed(self, filename: str) -> Any:
+        """Return the parsed content of a show file or None if it is not in the cache (or outdated)."""
+        filename = os.path.abspath(filename)
+        mtime = self._get_mtime(filename)
+        with self._lock:
+            self._load_index()
+            entry = self._index.get(filename)
+            if not entry:
+                return None
+            if entry[0] != mtime:
+                self._remove_entry(filename)
+                return None
+
+            try:
+                with open(os.path.join(self.cache_dir, entry[2]), 'rb') as f:
+                    data = pickle.load(f)
+            # pylint: disable-msg=broad-except
+            except Exception:
+                self.log.warning("Could not load show %s from cache", filename)
+                self._remove_entry(filename)
+                return None
+
+            self._index.move_to_end(filename)
+            self._record_change(filename, "use", entry)
+            return data
+
+    def put_parsed(self, filename: str, data: Any) -> None:
+        """Store the parsed content of a show file."""
+        filename = os.path.abspath(filename)
+        mtime = self._get_mtime(filename)
+        if mtime is None:
+            return
+
+        blob = pickle.dumps(data, protocol=4)
+        data_file = self._get_data_file_name(filename)
+        with self._lock:
+            self._load_index()
+            os.makedirs(self.cache_dir, exist_ok=True)
+            entry = (mtime, len(blob), data_file)
+            self._index[filename] = entry
+            self._index.move_to_end(filename)
+            self._record_change(filename, "put", entry)
+
+            with self._file_lock():
+                tmp_file = os.path.join(self.cache_dir, "{}.{}.tmp".format(data_file, os.getpid()))
+                with open(tmp_file, 'wb') as f:
+                    f.write(blob)
+                os.replace(tmp_file, os.path.join(self.cache_dir, data_file))
+                self._save_index()
+
+    def get_steps(self, filename: str) -> Optional[list]:
+        """Return the validated steps of a show file if they are still in memory."""
+        key = self._get_steps_key(filename)
+        with self._lock:
+            steps = self._steps.get(key)
+            if steps is not None:
+                self._steps.move_to_end(key)
+            return steps
+
+    def put_steps(self, filename: str, steps: list) -> None:
+        """Keep the validated steps of a show file in memory.
+
+        The steps are shared between all loads of the show so they must not be
+        modified afterwards.
+        """
+        key = self._get_steps_key(filename)
+        with self._lock:
+            self._steps[key] = steps
+            self._steps.move_to_end(key)
+            while len(self._steps) > self.max_shows:
+                self._steps.popitem(last=False)
+
+    def _get_steps_key(self, filename) -> Tuple[str, Optional[float]]:
+        filename = os.path.abspath(filename)
+        return filename, self._get_mtime(filename)
+
+    def flush(self) -> None:
+        """Write pending index updates (e.g. LRU order) to disk."""
+        with self._lock:
+            if self._changes and os.path.isdir(self.cache_dir):
+                with self._file_lock():
+                    self._save_index()
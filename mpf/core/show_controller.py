@@ -2,6 +2,7 @@
 
 from mpf.assets.show import Show
 from mpf.core.mpf_controller import MpfController
+from mpf.core.show_cache import ShowCache
 
 
 class ShowController(MpfController):
@@ -27,10 +28,14 @@ class ShowController(MpfController):
         self.running_shows = list()
         self._next_show_id = 0
 
+        self.show_cache = ShowCache()
+
         # Registers Show with the asset manager
         Show.initialize(self.machine)
 
+        self.machine.events.add_handler('init_phase_1', self._configure_show_cache)
         self.machine.events.add_handler('init_phase_3', self._initialize)
+        self.machine.events.add_handler('shutdown', self._flush_show_cache)
 
         self.machine.mode_controller.register_load_method(
             self._process_config_shows_section, 'shows')
@@ -40,6 +45,15 @@ class ShowController(MpfController):
         if 'shows' in self.machine.config:
             self._process_config_shows_section(self.machine.config['shows'])
 
+    def _configure_show_cache(self, **kwargs):
+        del kwargs
+        self.show_cache.max_size = self.machine.config['mpf']['show_cache_max_kb'] * 1024
+        self.show_cache.max_shows = self.machine.config['mpf']['show_cache_max_shows']
+
+    def _flush_show_cache(self, **kwargs):
+        del kwargs
+        self.show_cache.flush()
+
     def get_next_show_id(self):
         """Return the next show id."""
         self._next_show_id += 1
@@ -59,7 +73,7 @@ class ShowController(MpfController):
                              "there's already a show with that name. Shows are"
                              " shared machine-wide".format(name))
         else:
-            self.debug_log("Registering show: {}".format(name))
+            self.debug_log("Registering show: %s", name)
             self.machine.shows[name] = Show(self.machine,
                                             name=name,
                                             data=settings,
@@ -0,0 +1,332 @@
+"""Run a machine headless under a virtual clock as fast as possible.
+
+The :class:`SimulationLoop` jumps to the next scheduled timer whenever there is
+nothing left to do at the current (virtual) time. The :class:`MachineSimulator`
+drives randomized or scripted switch activity and collects throughput stats.
+"""
+import asyncio
+import random
+import time
+from collections import Counter
+
+from mpf.core.clock import ClockBase
+from mpf.core.machine import MachineController
+from mpf.core.utility_functions import Util
+from mpf.plugins.switch_player import play_switch_step, SWITCH_PLAYER_ACTIONS
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from typing import Dict, List, Optional
+
+
+class LatencyHistogram(object):
+
+    """Histogram of durations with microsecond resolution."""
+
+    def __init__(self):
+        """Initialise histogram."""
+        self._buckets = Counter()   # type: Counter
+        self.count = 0
+
+    def add(self, duration: float):
+        """Record a duration in seconds."""
+        self._buckets[int(duration * 1000000)] += 1
+        self.count += 1
+
+    def percentile(self, percent: float) -> float:
+        """Return the duration in seconds below which percent of all samples are."""
+        if not self.count:
+            return 0.0
+        limit = self.count * percent / 100.0
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= limit:
+                return bucket / 1000000.0
+        return max(self._buckets) / 1000000.0
+
+
+class SimulationLoop(asyncio.SelectorEventLoop):   # pylint: disable-msg=abstract-method
+
+    """Event loop with a virtual clock which skips idle time.
+
+    Sockets still work but are only polled. The wall clock duration of every
+    loop iteration is recorded in ``latencies``.
+    """
+
+    def __init__(self, start_time=0.0):
+        """Initialise loop."""
+        super().__init__()
+        self._virtual_time = start_time
+        self.latencies = LatencyHistogram()
+
+    def time(self):
+        """Return virtual time."""
+        return self._virtual_time
+
+    # pylint: disable-msg=protected-access
+    def _run_once(self):
+        if not self._ready and self._scheduled:
+            # nothing to do right now. jump to the next timer
+            self._virtual_time = max(self._virtual_time, self._scheduled[0]._when)
+
+        start = time.perf_counter()
+        super()._run_once()
+        self.latencies.add(time.perf_counter() - start)
+
+
+class SimulationMachineController(MachineController):
+
+    """Machine controller which runs on a :class:`SimulationLoop` and is driven by a :class:`MachineSimulator`."""
+
+    def __init__(self, mpf_path: str, machine_path: str, options: dict, simulator_config: dict) -> None:
+        """Initialise machine and simulator."""
+        self._simulation_loop = SimulationLoop()
+        super().__init__(mpf_path, machine_path, options)
+        self.simulator = MachineSimulator(self, **simulator_config)
+
+    def _load_config(self) -> None:
+        super()._load_config()
+        # headless. do not open BCP servers or connect to a media controller
+        self.config['bcp'] = []
+        # the loop jumps ahead in virtual time while it waits for threads. load assets in the loop instead
+        self.config['asset_manager'] = dict(self.config.get('asset_manager') or {}, num_workers=0)
+
+    def _load_clock(self) -> ClockBase:
+        clock = ClockBase(self, loop=self._simulation_loop)
+        clock.loop.set_exception_handler(self._exception_handler)
+        return clock
+
+    def shutdown(self) -> None:
+        """Cancel all pending tasks and shutdown the machine."""
+        self._cancel_pending_tasks()
+        super().shutdown()
+
+    def _cancel_pending_tasks(self) -> None:
+        """Cancel all pending tasks and wait until they are done.
+
+        This has to happen before the loop is closed because cancelling
+        schedules callbacks in the loop.
+        """
+        loop = self.clock.loop
+        if loop.is_closed() or loop.is_running():
+            return
+        tasks = [task for task in asyncio.Task.all_tasks(loop=loop) if not task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            loop.run_until_complete(asyncio.gather(*tasks, loop=loop, return_exceptions=True))
+
+    def run(self) -> None:
+        """Initialise MPF and run the simulation until it is done."""
+        self.initialise_mpf()
+        if self.clock.loop.is_closed():
+            # init failed
+            return
+
+        self.run_simulation()
+
+    def run_simulation(self) -> None:
+        """Run the simulation on an initialised machine until it is done."""
+        self.info_log("Starting the simulation.")
+        try:
+            self.simulator.start()
+        except AssertionError:
+            self.shutdown()
+            raise
+        self._run_loop()
+
+
+class MachineSimulator(object):
+
+    """Drive switch activity on a machine and collect stats.
+
+    Without steps, the simulator starts games with the start button, hits
+    random playfield switches and drains balls into the drain device. Steps
+    use the format of the ``switch_player`` plugin (dicts with ``time``,
+    ``switch`` and ``action``) and are played in order. The simulation
+    always runs for duration (virtual) seconds.
+
+    Args:
+        machine: The machine to drive.
+        duration: Virtual seconds to run.
+        seed: Seed for the random activity.
+        steps: List of switch_player steps. Randomized activity if None.
+        repeat: Repeat the steps until duration passed.
+        switch_rate: Random switch hits per virtual second.
+        ball_time: Average virtual seconds a ball stays on the playfield.
+        balls: Balls to add to the trough if the machine does not know any
+            balls at start. Fills the trough if None.
+    """
+
+    # pylint: disable-msg=too-many-arguments
+    def __init__(self, machine: MachineController, duration=3600.0, seed=None, steps=None, repeat=False,
+                 switch_rate=5.0, ball_time=30.0, balls=None) -> None:
+        """Initialise simulator."""
+        self.machine = machine
+        self.duration = duration
+        self.steps = steps
+        self.repeat = repeat
+        self.switch_rate = switch_rate
+        self.ball_time = ball_time
+        self.balls = balls
+        self._random = random.Random(seed)
+
+        self.stats = Counter()      # type: Counter
+        self._start_wall_time = None    # type: Optional[float]
+        self._start_time = None         # type: Optional[float]
+        self._end_wall_time = None      # type: Optional[float]
+        self._end_time = None           # type: Optional[float]
+        self._step = 0
+        self._start_switches = []       # type: List[str]
+        self._playfield_switches = []   # type: List[str]
+        self._held_switches = set()
+        self._drain_device = None
+
+        self.machine.register_monitor("events", self._event_posted)
+
+    def start(self):
+        """Start driving the machine."""
+        self._start_wall_time = time.perf_counter()
+        self._start_time = self.machine.clock.get_time()
+        self.machine.clock.loop.call_at(self._start_time + self.duration, self.stop)
+        if not self.machine.ball_controller.num_balls_known:
+            self._add_initial_balls()
+
+        if self.steps is not None:
+            self._validate_steps()
+            self._schedule_step()
+            return
+
+        self._start_switches = [switch.name for switch in self.machine.switches.items_tagged('start')]
+        self._playfield_switches = self._get_playfield_switches()
+        drain_devices = (self.machine.ball_devices.items_tagged('drain') or
+                         self.machine.ball_devices.items_tagged('trough'))
+        self._drain_device = drain_devices[0] if drain_devices else None
+        self._schedule_random_action()
+
+    def _add_initial_balls(self):
+        """Put balls into the trough."""
+        for device in self.machine.ball_devices.items_tagged('trough'):
+            balls = device.config['ball_capacity'] if self.balls is None else self.balls
+            for _ in range(min(balls, device.config['ball_capacity'])):
+                self.machine.default_platform.add_ball_to_device(device)
+            return
+
+    def stop(self):
+        """Stop the simulation and the machine."""
+        if self._end_time is None:
+            self._end_wall_time = time.perf_counter()
+            self._end_time = self.machine.clock.get_time()
+        self.machine.stop()
+
+    def _event_posted(self, event, ev_type, kwargs):
+        del ev_type
+        del kwargs
+        self.stats["events"] += 1
+        if event == "game_ended":
+            self.stats["games"] += 1
+        elif event == "ball_ended":
+            self.stats["balls"] += 1
+
+    def _get_playfield_switches(self):
+        """Return all switches which are not part of a ball device and not start switches."""
+        active_switches = [switch.name for switch in self.machine.switches.items_tagged('playfield_active')]
+        if active_switches:
+            return active_switches
+
+        device_switches = set(self._start_switches)
+        for device in self.machine.ball_devices:
+            if device.is_playfield():
+                continue
+            device_switches.update(switch.name for switch in device.config['ball_switches'])
+            for switch_setting in ('entrance_switch', 'jam_switch'):
+                if device.config[switch_setting]:
+                    device_switches.add(device.config[switch_setting].name)
+
+        return [switch.name for switch in self.machine.switches if switch.name not in device_switches]
+
+    def _validate_steps(self):
+        """Raise AssertionError if steps are invalid."""
+        if not isinstance(self.steps, list):
+            raise AssertionError("Steps have to be a list.")
+        for num, step in enumerate(self.steps):
+            if not isinstance(step, dict) or not {"time", "switch", "action"} <= set(step):
+                raise AssertionError("Step {} needs time, switch and action: {}".format(num, step))
+            if step['switch'] not in self.machine.switches:
+                raise AssertionError("Step {} uses unknown switch {}".format(num, step['switch']))
+            if step['action'] not in SWITCH_PLAYER_ACTIONS:
+                raise AssertionError("Step {} has invalid action {}. Valid actions are: {}".format(
+                    num, step['action'], ", ".join(SWITCH_PLAYER_ACTIONS)))
+
+    def _schedule_step(self):
+        if self._step >= len(self.steps):
+            if not self.repeat or not self.steps:
+                # keep running until duration passed
+                return
+            self._step = 0
+
+        step = self.steps[self._step]
+        self.machine.clock.loop.call_later(Util.string_to_ms(step['time']) / 1000.0, self._do_step, step)
+
+    def _do_step(self, step):
+        play_switch_step(self.machine.switch_controller, step)
+        self.stats["switch_changes"] += 2 if step['action'] == "hit" else 1
+        self._step += 1
+        self._schedule_step()
+
+    def _schedule_random_action(self):
+        self.machine.clock.loop.call_later(self._random.expovariate(self.switch_rate), self._random_action)
+
+    def _random_action(self):
+        if self._end_time is not None:
+            return
+
+        if not self.machine.game:
+            if self._start_switches and self.machine.ball_controller.num_balls_known:
+                self._hit(self._random.choice(self._start_switches))
+        elif (self._drain_device and self.machine.playfield.balls > 0 and
+              self._random.random() < 1 / (self.ball_time * self.switch_rate)):
+            self.machine.default_platform.add_ball_to_device(self._drain_device)
+            self.stats["drains"] += 1
+        elif self._playfield_switches and self.machine.playfield.balls > 0:
+            self._hit(self._random.choice(self._playfield_switches))
+
+        self._schedule_random_action()
+
+    def _hit(self, switch_name):
+        if switch_name in self._held_switches:
+            return
+        self._held_switches.add(switch_name)
+        self.machine.switch_controller.process_switch(switch_name, state=1, logical=True)
+        self.machine.clock.loop.call_later(.05, self._release, switch_name)
+        self.stats["switch_changes"] += 2
+
+    def _release(self, switch_name):
+        self._held_switches.discard(switch_name)
+        self.machine.switch_controller.process_switch(switch_name, state=0, logical=True)
+
+    def get_report(self) -> "Dict[str, float]":
+        """Return throughput and latency stats of the simulation."""
+        end_wall_time = self._end_wall_time if self._end_wall_time is not None else time.perf_counter()
+        end_time = self._end_time if self._end_time is not None else self.machine.clock.get_time()
+        wall_time = max(end_wall_time - self._start_wall_time, 1e-9)
+        virtual_time = end_time - self._start_time
+        latencies = self.machine.clock.loop.latencies
+        return {
+            "virtual_time": virtual_time,
+            "wall_time": wall_time,
+            "speedup": virtual_time / wall_time,
+            "games": self.stats["games"],
+            "balls": self.stats["balls"],
+            "games_per_hour": self.stats["games"] * 3600.0 / virtual_time if virtual_time else 0.0,
+            "events": self.stats["events"],
+            "events_per_second": self.stats["events"] / wall_time,
+            "switch_changes": self.stats["switch_changes"],
+            "loop_iterations": latencies.count,
+            "latency_p50": latencies.percentile(50),
+            "latency_p90": latencies.percentile(90),
+            "latency_p99": latencies.percentile(99),
+            "latency_max": latencies.percentile(100),
+        }
+
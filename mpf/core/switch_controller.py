@@ -8,16 +8,17 @@ import logging
 from collections import defaultdict, namedtuple
 import asyncio
 from functools import partial
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
 
 from mpf.core.machine import MachineController
 from mpf.core.mpf_controller import MpfController
+# SwitchState is imported here so that the old import path keeps working
+from mpf.core.switch_state_table import SwitchState, SwitchStateTable, POWER_ON_TIME, iter_bits     # noqa
 from mpf.devices.switch import Switch
 
 MonitoredSwitchChange = namedtuple("MonitoredSwitchChange", ["name", "label", "platform", "num", "state"])
 SwitchHandler = namedtuple("SwitchHandler", ["switch_name", "callback", "state", "ms"])
 RegisteredSwitch = namedtuple("RegisteredSwitch", ["ms", "callback"])
-SwitchState = namedtuple("SwitchState", ["state", "time"])
 TimedSwitchHandler = namedtuple("TimedSwitchHandler", ["callback", 'switch_name', 'state', 'ms'])
 
 
@@ -43,16 +44,20 @@ class SwitchController(MpfController):
         # that tracks current switches for things like "do foo() if switch bar
         # is active for 100ms."
 
-        self.switches = dict()                                  # type: Dict[str, SwitchState]
-        # Dictionary which holds the master list of switches as well as their
+        self.switches = SwitchStateTable()                      # type: SwitchStateTable
+        # Table which holds the master list of switches as well as their
         # current states. State here does factor in whether a switch is NO or
-        # NC so 1 = active and 0 = inactive.
+        # NC so 1 = active and 0 = inactive. Reading by name returns a
+        # SwitchState. Snapshots of all states are bitsets indexed by switch
+        # id.
 
         # register for events
         self.machine.events.add_async_handler('init_phase_2', self._initialize_switches, 1000)
         # priority 1000 so this fires first
 
         self.monitors = list()      # type: List[Callable[[MonitoredSwitchChange], None]]
+        self.batched_monitors = list()      # type: List[Callable[[List[MonitoredSwitchChange]], None]]
+        self._monitor_batch = list()        # type: List[MonitoredSwitchChange]
 
         # to detect early switch changes before init
         self._initialised = False
@@ -88,56 +93,76 @@ class SwitchController(MpfController):
         This method works silently and does not post any events if any switches
         changed state.
         """
-        # create a list of hw switch numbers, platforms, and switch objects
-        platforms = set()
-        switches = set()  # (switch_object, number)
+        hw_states = yield from self.read_hw_switch_states()
+        for switch in self.machine.switches:
+            switch.state = (hw_states >> self.switches.get_id(switch.name)) & 1
+
+    @asyncio.coroutine
+    def read_hw_switch_states(self):
+        """Read the logical states of all switches from their hardware platforms.
 
+        Returns a bitset indexed by switch id (like :meth:`snapshot`).
+        """
+        # group switches by platform
+        platforms = defaultdict(list)
         for switch in self.machine.switches:
-            platforms.add(switch.platform)
-            switches.add((switch, switch.hw_switch.number))
+            platforms[switch.platform].append(switch)
 
-        for platform in platforms:
+        hw_states = 0
+        for platform, switches in platforms.items():
             switch_states = yield from platform.get_hw_switch_states()
 
-            for switch, number in switches:
-                # if two platforms have the same number choose the right switch
-                if switch.platform != platform:
-                    continue
+            for switch in switches:
+                number = switch.hw_switch.number
                 try:
-                    switch.state = switch_states[number] ^ switch.invert
+                    state = switch_states[number] ^ switch.invert
                 except (IndexError, KeyError):
                     raise AssertionError("Missing switch {} in update from hw.  Update from HW: {}, switches: {}".
                                          format(number, switch_states, switches))
+                if state:
+                    hw_states |= 1 << self.switches.get_id(switch.name)
 
-    def verify_switches(self) -> bool:
+        return hw_states
+
+    def verify_switches(self, hw_states=None) -> bool:
         """Verify that switches states match the hardware.
 
-        Loops through all the switches and queries their hardware states via
-        their platform interfaces and then compares that to the state that MPF
-        thinks the switches are in.
+        Compares the states that MPF thinks the switches are in with the
+        states which were reported by the hardware (either hw_states as read by
+        :meth:`read_hw_switch_states` or the last states reported to the
+        switch devices).
 
         Throws logging warnings if anything doesn't match.
 
         This method is notification only. It doesn't fix anything.
         """
-        current_states = dict()
-
-        for switch in self.machine.switches.values():
-            current_states[switch] = switch.state
-
-        self.update_switches_from_hw()
-
-        ok = True
-
-        for switch in self.machine.switches.values():
-            if switch.state != current_states[switch]:  # pragma: no cover
-                ok = False
-                self.warning_log("Switch State Error! Switch: %s, HW State: "
-                                 "%s, MPF State: %s", switch.name,
-                                 current_states[switch],
-                                 switch.state)
+        if hw_states is None:
+            hw_states = 0
+            for switch in self.machine.switches:
+                if switch.state:
+                    hw_states |= 1 << self.switches.get_id(switch.name)
+
+        mismatch = self.switches.diff(hw_states)
+        for switch_id in iter_bits(mismatch):  # pragma: no cover
+            name = self.switches.get_name(switch_id)
+            self.warning_log("Switch State Error! Switch: %s, HW State: "
+                             "%s, MPF State: %s", name,
+                             (hw_states >> switch_id) & 1,
+                             self.switches.get_state(name))
+
+        return not mismatch
+
+    def snapshot(self) -> int:
+        """Return the logical states of all switches as bitset indexed by switch id.
+
+        Snapshots are immutable and consistent. Pass one to
+        :meth:`get_changed_switches` to find the switches which changed since.
+        """
+        return self.switches.snapshot()
 
-        return ok
+    def get_changed_switches(self, snapshot: int) -> List[str]:
+        """Return the names of all switches which changed since snapshot."""
+        return self.switches.get_changed_switches(snapshot)
 
     def is_state(self, switch_name, state, ms=0):
         """Check if switch is in state.
@@ -163,7 +188,7 @@ class SwitchController(MpfController):
         if not ms:
             ms = 0
 
-        return self.switches[switch_name].state == state and ms <= self.ms_since_change(switch_name)
+        return self.switches.get_state(switch_name) == state and ms <= self.ms_since_change(switch_name)
 
     def is_active(self, switch_name, ms=None):
         """Query whether a switch is active.
@@ -210,7 +235,7 @@ class SwitchController(MpfController):
         Returns:
             Integer of milliseconds.
         """
-        return round((self.machine.clock.get_time() - self.switches[switch_name].time) * 1000.0, 0)
+        return round((self.machine.clock.get_time() - self.switches.get_time(switch_name)) * 1000.0, 0)
 
     def set_state(self, switch_name, state=1, reset_time=False):
         """Set the state of a switch.
@@ -232,11 +257,11 @@ class SwitchController(MpfController):
 
         """
         if reset_time:
-            timestamp = -100000     # clock can be 0 at start
+            timestamp = POWER_ON_TIME
         else:
             timestamp = self.machine.clock.get_time()
 
-        self.switches[switch_name] = SwitchState(state=state, time=timestamp)
+        self.switches.set_state(switch_name, state, timestamp)
 
     def process_switch_by_num(self, num, state, platform, logical=False):
         """Process a switch state change by switch number.
@@ -263,9 +288,9 @@ class SwitchController(MpfController):
 
         self.debug_log("Unknown switch %s change to state %s on platform %s", num, state, platform)
         # if the switch is not configured still trigger the monitor
-        for monitor in self.monitors:
-            monitor(MonitoredSwitchChange(name=str(num), label="{}-{}".format(str(platform), str(num)),
-                                          platform=platform, num=str(num), state=state))
+        if self.monitors or self.batched_monitors:
+            self._notify_monitors(MonitoredSwitchChange(name=str(num), label="{}-{}".format(str(platform), str(num)),
+                                                        platform=platform, num=str(num), state=state))
 
     def process_switch(self, name, state=1, logical=False):
         """Process a new switch state change for a switch by name.
@@ -364,7 +389,7 @@ class SwitchController(MpfController):
                                       obj.recycle_secs)
 
         # if the switch is already in this state, then abort
-        if self.switches[obj.name].state == state:
+        if self.switches.get_state(obj.name) == state:
 
             if not obj.recycle_secs:
                 self.warning_log(
@@ -375,9 +400,9 @@ class SwitchController(MpfController):
             return
 
         if state:
-            self.info_log("<<<<<<< '{}' active >>>>>>>".format(obj.name))
+            self.info_log("<<<<<<< '%s' active >>>>>>>", obj.name)
         else:
-            self.info_log("<<<<<<< '{}' inactive >>>>>>>".format(obj.name))
+            self.info_log("<<<<<<< '%s' inactive >>>>>>>", obj.name)
 
         # Update the switch controller's logical state for this switch
         self.set_state(obj.name, state)
@@ -386,9 +411,28 @@ class SwitchController(MpfController):
 
         self._cancel_timed_handlers(obj.name, state)
 
+        if self.monitors or self.batched_monitors:
+            self._notify_monitors(MonitoredSwitchChange(name=obj.name, label=obj.label, platform=obj.platform,
+                                                        num=obj.hw_switch.number, state=state))
+
+    def _notify_monitors(self, change: MonitoredSwitchChange):
+        """Call monitors now and queue the change for batched monitors."""
         for monitor in self.monitors:
-            monitor(MonitoredSwitchChange(name=obj.name, label=obj.label, platform=obj.platform,
-                                          num=obj.hw_switch.number, state=state))
+            monitor(change)
+
+        if self.batched_monitors:
+            if not self._monitor_batch:
+                self.machine.clock.loop.call_soon(self._flush_monitor_batch)
+            self._monitor_batch.append(change)
+
+    def _flush_monitor_batch(self):
+        """Pass all changes of the last loop iteration to batched monitors."""
+        changes = self._monitor_batch
+        self._monitor_batch = []
+        for monitor in list(self.batched_monitors):
+            # skip monitors which got removed by another monitor
+            if monitor in self.batched_monitors:
+                monitor(changes)
 
     def _recycle_passed(self, obj, state, logical, hw_state):
         if obj.hw_state == hw_state:
@@ -515,6 +559,20 @@ class SwitchController(MpfController):
         if monitor in self.monitors:
             self.monitors.remove(monitor)
 
+    def add_batched_monitor(self, monitor: Callable[[List[MonitoredSwitchChange]], None]):
+        """Add a monitor callback which is called once per loop iteration with all switch changes in it.
+
+        Use this for monitors which do not need to run before the next switch
+        change is processed (e.g. to redraw or send changes to clients).
+        """
+        if monitor not in self.batched_monitors:
+            self.batched_monitors.append(monitor)
+
+    def remove_batched_monitor(self, monitor: Callable[[List[MonitoredSwitchChange]], None]):
+        """Remove a batched monitor callback."""
+        if monitor in self.batched_monitors:
+            self.batched_monitors.remove(monitor)
+
     # pylint: disable-msg=too-many-arguments
     def add_switch_handler(self, switch_name, callback, state=1, ms=0,
                            return_info=False, callback_kwargs=None) -> SwitchHandler:
@@ -585,6 +643,32 @@ class SwitchController(MpfController):
         self.remove_switch_handler(switch_handler.switch_name, switch_handler.callback, switch_handler.state,
                                    switch_handler.ms)
 
+    def remove_switch_handlers_by_keys(self, switch_handlers: List[SwitchHandler]):
+        """Remove multiple switch handlers returned from add_switch_handler.
+
+        Every affected switch and the timed switch handlers are scanned only
+        once.
+        """
+        by_entry_key = {}   # type: Dict[str, List[SwitchHandler]]
+        by_timed_key = {}   # type: Dict[Tuple[str, int, int], List[Callable]]
+        for switch_handler in switch_handlers:
+            entry_key = str(switch_handler.switch_name) + '-' + str(switch_handler.state)
+            by_entry_key.setdefault(entry_key, []).append(switch_handler)
+            by_timed_key.setdefault((str(switch_handler.switch_name), switch_handler.state, switch_handler.ms),
+                                    []).append(switch_handler.callback)
+
+        for entry_key, handlers in by_entry_key.items():
+            registered = self.registered_switches.get(entry_key)
+            if registered:
+                registered[:] = [settings for settings in registered
+                                 if not any(settings.ms == handler.ms and settings.callback == handler.callback
+                                            for handler in handlers)]
+
+        for timed_entry in self.active_timed_switches.values():
+            timed_entry[:] = [entry for entry in timed_entry
+                              if entry.callback not in by_timed_key.get((str(entry.switch_name), entry.state,
+                                                                         entry.ms), ())]
+
     def remove_switch_handler(self, switch_name, callback, state=1, ms=0):
         """Remove a registered switch handler.
 
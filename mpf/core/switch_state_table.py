@@ -0,0 +1,118 @@
+"""Bitset backed table of logical switch states.
+
+Every switch gets a stable id when it is added. The states of all switches are
+stored as bits of one int and the timestamps of their last change in a
+parallel float array. Since ints are immutable a snapshot of all states is
+just a reference and the difference of two snapshots is a XOR.
+"""
+from array import array
+from collections import namedtuple
+from collections.abc import Mapping
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from typing import Dict, Iterator, List
+
+SwitchState = namedtuple("SwitchState", ["state", "time"])
+
+POWER_ON_TIME = -100000.0   # clock can be 0 at start
+
+
+def iter_bits(bits: int) -> "Iterator[int]":
+    """Yield the positions of all set bits in ascending order."""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+class SwitchStateTable(Mapping):
+
+    """States and last change times of all switches indexed by switch id.
+
+    Reading by name returns a :class:`SwitchState` so the table can be used
+    like the dict of states it replaces.
+    """
+
+    __slots__ = ["states", "_ids", "_names", "_times"]
+
+    def __init__(self) -> None:
+        """Initialise empty table."""
+        self.states = 0     # bit n is the state of the switch with id n
+        self._ids = {}      # type: Dict[str, int]
+        self._names = []    # type: List[str]
+        self._times = array('d')
+
+    def add(self, name: str) -> int:
+        """Add a switch in inactive state and return its id."""
+        switch_id = self._ids.get(name)
+        if switch_id is None:
+            switch_id = len(self._names)
+            self._ids[name] = switch_id
+            self._names.append(name)
+            self._times.append(POWER_ON_TIME)
+        return switch_id
+
+    def get_id(self, name: str) -> int:
+        """Return the id of a switch."""
+        return self._ids[name]
+
+    def get_name(self, switch_id: int) -> str:
+        """Return the name of the switch with id."""
+        return self._names[switch_id]
+
+    def set_state(self, name: str, state: int, timestamp: float) -> None:
+        """Set the state and the time of the last change of a switch. Adds unknown switches."""
+        switch_id = self._ids.get(name)
+        if switch_id is None:
+            switch_id = self.add(name)
+        if state:
+            self.states |= 1 << switch_id
+        else:
+            self.states &= ~(1 << switch_id)
+        self._times[switch_id] = timestamp
+
+    def get_state(self, name: str) -> int:
+        """Return the state of a switch."""
+        return (self.states >> self._ids[name]) & 1
+
+    def get_time(self, name: str) -> float:
+        """Return the time of the last change of a switch."""
+        return self._times[self._ids[name]]
+
+    def snapshot(self) -> int:
+        """Return the states of all switches as bitset."""
+        return self.states
+
+    def get_times(self) -> array:
+        """Return a copy of the last change times of all switches indexed by id."""
+        return array('d', self._times)
+
+    def diff(self, snapshot: int, other: int = None) -> int:
+        """Return a bitset of all switches which differ between snapshot and other (or the current states)."""
+        return snapshot ^ (self.states if other is None else other)
+
+    def get_names(self, bits: int) -> "List[str]":
+        """Return the names of all switches in a bitset."""
+        return [self._names[switch_id] for switch_id in iter_bits(bits)]
+
+    def get_changed_switches(self, snapshot: int) -> "List[str]":
+        """Return the names of all switches which changed since snapshot."""
+        return self.get_names(snapshot ^ self.states)
+
+    def __getitem__(self, name: str) -> SwitchState:
+        """Return state and time of a switch."""
+        switch_id = self._ids[name]
+        return SwitchState((self.states >> switch_id) & 1, self._times[switch_id])
+
+    def __contains__(self, name) -> bool:
+        """Return true if the switch is in the table."""
+        return name in self._ids
+
+    def __iter__(self) -> "Iterator[str]":
+        """Iterate over all switch names in id order."""
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        """Return number of switches."""
+        return len(self._names)
@@ -1,6 +1,13 @@
-"""Contains the TextUI class."""
+"""Contains the TextUI class.
+
+The screen is split into regions which are rendered to lists of segments when
+they change. At most ``fps`` times per second all dirty regions are rendered,
+composed to rows and only rows which differ from the last frame are written to
+the terminal. Terminal writes run in a worker thread if ``threaded`` is set.
+"""
 import asyncio
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
 from typing import Tuple
@@ -15,9 +22,14 @@ MYPY = False
 if MYPY:   # pragma: no cover
     from mpf.core.machine import MachineController
     from mpf.devices.switch import Switch
-    from typing import Dict, List
+    from typing import Dict, List, Set
     from mpf.devices.ball_device.ball_device import BallDevice
 
+# segments of later regions are drawn on top of earlier ones
+REGIONS = ("header", "stats", "modes", "switches", "ball_devices", "player", "banners")
+
+Segment = Tuple[int, int, str, int, int]    # x, y, text, colour, bg
+
 
 # pylint: disable-msg=too-many-instance-attributes
 class TextUi(MpfController):
@@ -35,6 +47,9 @@ class TextUi(MpfController):
         if not machine.options['text_ui']:
             return
 
+        self.config = self.machine.config_validator.validate_config(
+            "text_ui", self.machine.config.get('text_ui', {}))
+
         self.start_time = datetime.now()
         self.machine = machine
         self._tick_task = self.machine.clock.schedule_interval(self._tick, 1)
@@ -43,10 +58,21 @@ class TextUi(MpfController):
         self.ball_devices = list()      # type: List[BallDevice]
 
         self.switches = OrderedDict()   # type: Dict[Switch, Tuple[str, int, int]]
+        self._switch_segments = OrderedDict()   # type: Dict[Switch, Segment]
+        self._switch_snapshot = 0
         self.player_start_row = 0
         self.column_positions = [0, .25, .5, .75]
         self.columns = [0] * len(self.column_positions)
 
+        self._frame_interval = 1.0 / self.config['fps'] if self.config['fps'] > 0 else 0
+        self._regions = {region: [] for region in REGIONS}  # type: Dict[str, List[Segment]]
+        self._dirty = set()             # type: Set[str]
+        self._drawn_rows = {}           # type: Dict[int, Tuple]
+        self._render_handle = None      # type: asyncio.Handle
+        self._last_frame = None         # type: float
+        self.frames = 0
+        self._executor = ThreadPoolExecutor(max_workers=1) if self.config['threaded'] else None
+
         self.machine.events.add_handler('init_phase_2', self._init)
         self.machine.events.add_handler('init_phase_3', self._update_switches)
         # self.machine.events.add_handler('init_phase_3', self._init2)
@@ -68,15 +94,16 @@ class TextUi(MpfController):
         self._pending_bcp_connection = False
         self._asset_percent = 0
         self._bcp_status = (0, 0, 0)  # type: Tuple[float, int, int]
+        self._show_player = True
 
-        self._draw_screen()
-        self.screen.refresh()
+        self._update_layout()
+        self._mark_dirty(*REGIONS)
 
     def _init(self, **kwargs):
         del kwargs
         self.machine.mode_controller.register_start_method(self._mode_change)
         self.machine.mode_controller.register_stop_method(self._mode_change)
-        self.machine.switch_controller.add_monitor(self._update_switches)
+        self.machine.switch_controller.add_batched_monitor(self._switches_changed)
         self.machine.bcp.interface.register_command_callback(
             "status_report", self._bcp_status_report)
 
@@ -84,67 +111,148 @@ class TextUi(MpfController):
             self.ball_devices.append(bd)
 
         self.ball_devices.sort()
-        self._draw_player_header()
+        self.player_start_row = (
+            len(self.ball_devices) + len(self.machine.playfields)) + 7
 
         self._update_switch_layout()
+        self._mark_dirty("ball_devices", "player")
 
     @asyncio.coroutine
     def _bcp_status_report(self, client, cpu, rss, vms):
         del client
         self._bcp_status = cpu, rss, vms
 
-    def _draw_screen(self):
+    def _mark_dirty(self, *regions):
+        """Mark regions as changed and schedule a frame if there is none pending.
 
-        for i, percent in enumerate(self.column_positions):
-            if not i:
-                self.columns[i] = 1
-            self.columns[i] = int(self.screen.width * percent)
+        Frames are at least 1/fps apart. Changes until then end up in the same frame.
+        """
+        self._dirty.update(regions)
+        if self._render_handle or not self.screen:
+            return
 
-        height, width = self.screen.dimensions
-        title = 'Mission Pinball Framework v{}'.format(mpf._version.__version__)    # noqa
-        padding = int((self.screen.width - len(title)) / 2)
+        now = self.machine.clock.get_time()
+        delay = 0 if self._last_frame is None else max(0, self._last_frame + self._frame_interval - now)
+        self._render_handle = self.machine.clock.loop.call_later(delay, self._render)
 
-        self.screen.print_at((' ' * padding) + title + (' ' * (padding + 1)),
-                             0, 0, colour=7, bg=1)
+    def _render(self):
+        """Render dirty regions and write all rows which changed since the last frame."""
+        self._render_handle = None
+        if not self.screen:
+            return
+        self._last_frame = self.machine.clock.get_time()
+
+        for region in REGIONS:
+            if region in self._dirty:
+                self._regions[region] = getattr(self, "_draw_" + region)()
+        self._dirty.clear()
+
+        rows = {}   # type: Dict[int, List]
+        for region in REGIONS:
+            for x, y, text, colour, bg in self._regions[region]:
+                rows.setdefault(y, []).append((x, text, colour, bg))
+
+        changed_rows = []
+        for y in set(rows).union(self._drawn_rows):
+            row = tuple(rows.get(y, ()))
+            if self._drawn_rows.get(y, ()) == row:
+                continue
+            changed_rows.append((y, row))
+            if row:
+                self._drawn_rows[y] = row
+            else:
+                del self._drawn_rows[y]
 
-        self.screen.print_at('<CTRL+C> TO EXIT', width - 16, 0, colour=0, bg=1)
+        if not changed_rows:
+            return
 
-        self.screen.print_at('ACTIVE MODES', self.columns[0], 2)
-        self.screen.print_at('SWITCHES', int((width * .5) - 8), 2)
-        self.screen.print_at('BALL COUNTS', self.columns[3], 2)
-        self.screen.print_at('-' * width, 0, 3)
+        self.frames += 1
+        self._run_on_screen(self._write_rows, sorted(changed_rows))
 
-        self.screen.print_at(self.machine.machine_path, 0, height - 2, colour=3)
+    def _run_on_screen(self, callback, *args):
+        """Run a callback which accesses the terminal in the worker thread (if enabled)."""
+        if not self._executor:
+            callback(*args)
+            return
+
+        future = self._executor.submit(callback, *args)
+        future.add_done_callback(self._screen_callback_done)
+
+    def _screen_callback_done(self, future):
+        if not future.cancelled() and future.exception():
+            self.error_log("Failed to update screen: %s", future.exception())
+
+    def _write_rows(self, rows):
+        """Clear and redraw rows. Runs in the worker thread when threaded."""
+        width = self.screen.width
+        for y, row in rows:
+            self.screen.print_at(' ' * width, 0, y)
+            for x, text, colour, bg in row:
+                self.screen.print_at(text, x, y, colour=colour, bg=bg)
+
+        self.screen.refresh()
+
+    def _check_resize(self):
+        """Check if the terminal was resized. Runs in the worker thread when threaded."""
+        if self.screen.has_resized():
+            self.machine.clock.loop.call_soon_threadsafe(self._resized)
+
+    def _resized(self):
+        """Reopen the screen and redraw everything.
+
+        This has to run in the main thread because the screen installs signal
+        handlers when it is opened.
+        """
+        if not self.screen:
+            # stopped before the resize was processed
+            return
+        if self._executor:
+            # wait for pending writes to the old screen
+            self._executor.submit(lambda: None).result()
+        self.screen = Screen.open()
+        self._drawn_rows = {}
+        self._update_layout()
+        self._update_switch_layout()
+        self._mark_dirty(*REGIONS)
+
+    def _update_layout(self):
+        for i, percent in enumerate(self.column_positions):
+            self.columns[i] = int(self.screen.width * percent)
+
+    def _draw_header(self) -> "List[Segment]":
+        height, width = self.screen.dimensions
+        title = 'Mission Pinball Framework v{}'.format(mpf._version.__version__)    # noqa
+        padding = int((width - len(title)) / 2)
+
+        return [
+            (0, 0, (' ' * padding) + title + (' ' * (padding + 1)), 7, 1),
+            (width - 16, 0, '<CTRL+C> TO EXIT', 0, 1),
+            (self.columns[0], 2, 'ACTIVE MODES', 7, 0),
+            (int((width * .5) - 8), 2, 'SWITCHES', 7, 0),
+            (self.columns[3], 2, 'BALL COUNTS', 7, 0),
+            (0, 3, '-' * width, 7, 0),
+            (0, height - 2, self.machine.machine_path, 3, 0),
+        ]
+
+    def _draw_banners(self) -> "List[Segment]":
+        height, width = self.screen.dimensions
+        segments = []
 
         if 0 < self._asset_percent < 100:
-            self.screen.print_at(' ' * width, 0, int(height / 2) + 1, bg=3)
-            self.screen.print_at(
-                'LOADING ASSETS: {}%'.format(self._asset_percent),
-                int(width / 2) - 10, int(height / 2) + 1, colour=0, bg=3)
+            segments.append((0, int(height / 2) + 1, ' ' * width, 7, 3))
+            segments.append((int(width / 2) - 10, int(height / 2) + 1,
+                             'LOADING ASSETS: {}%'.format(self._asset_percent), 0, 3))
 
         if self._pending_bcp_connection:
             bcp_string = 'WAITING FOR MEDIA CONTROLLER {}...'.format(
                 self._pending_bcp_connection)
 
-            self.screen.print_at(' ' * width, 0, int(height / 2) - 1, bg=3)
-            self.screen.print_at(
-                bcp_string, int((width - len(bcp_string)) / 2),
-                int(height / 2) - 1, colour=0, bg=3)
-
-        self._update_stats()
+            segments.append((0, int(height / 2) - 1, ' ' * width, 7, 3))
+            segments.append((int((width - len(bcp_string)) / 2), int(height / 2) - 1, bcp_string, 0, 3))
 
-    def _draw_player_header(self):
-        self.player_start_row = (
-            len(self.ball_devices) + len(self.machine.playfields)) + 7
+        return segments
 
-        self.screen.print_at('CURRENT PLAYER', self.columns[3],
-                             self.player_start_row - 2)
-        self.screen.print_at('-' * (int(self.screen.width * .75) + 1),
-                             self.columns[3],
-                             self.player_start_row - 1)
-        self._update_player()
-
-    def _update_stats(self):
+    def _draw_stats(self) -> "List[Segment]":
         height, width = self.screen.dimensions
 
         # Runtime
@@ -152,15 +260,11 @@ class TextUi(MpfController):
         mins, sec = divmod(rt.seconds + rt.days * 86400, 60)
         hours, mins = divmod(mins, 60)
         time_string = 'RUNNING {:d}:{:02d}:{:02d}'.format(hours, mins, sec)
-        self.screen.print_at(time_string, width - len(time_string),
-                             height - 2, colour=2)
 
         # System Stats
         system_str = 'Free Memory (MB): {} CPU:{:3d}%'.format(
             round(virtual_memory().available / 1048576),
             round(cpu_percent(interval=None, percpu=False)))
-        self.screen.print_at(system_str, width - len(system_str), height - 1,
-                             colour=2)
 
         # MPF process stats
         stats_str = 'MPF (CPU RSS/VMS): {}% {}/{} MB    '.format(
@@ -168,7 +272,11 @@ class TextUi(MpfController):
             round(self.mpf_process.memory_info().rss / 1048576),
             round(self.mpf_process.memory_info().vms / 1048576))
 
-        self.screen.print_at(stats_str, 0, height - 1, colour=6)
+        segments = [
+            (width - len(time_string), height - 2, time_string, 2, 0),
+            (width - len(system_str), height - 1, system_str, 2, 0),
+            (0, height - 1, stats_str, 6, 0),
+        ]
 
         # MC process stats
         if self._bcp_status != (0, 0, 0):
@@ -177,7 +285,9 @@ class TextUi(MpfController):
                 round(self._bcp_status[1] / 1048576),
                 round(self._bcp_status[2] / 1048576))
 
-            self.screen.print_at(bcp_string, len(stats_str) - 2, height - 1, colour=5)
+            segments.append((len(stats_str) - 2, height - 1, bcp_string, 5, 0))
+
+        return segments
 
     def _update_switch_layout(self):
         start_row = 4
@@ -203,131 +313,129 @@ class TextUi(MpfController):
 
     def _update_switches(self, *args, **kwargs):
         del args, kwargs
+        switch_controller = self.machine.switch_controller
+        self._switch_snapshot = switch_controller.snapshot()
+        self._switch_segments = OrderedDict()
         for sw, info in self.switches.items():
-            if sw.state:
-                self.screen.print_at(*info, colour=0, bg=2)
-            else:
-                self.screen.print_at(*info)
+            self._switch_segments[sw] = self._switch_segment(info, switch_controller.switches.get_state(sw.name))
 
-        self.screen.refresh()
+        self._mark_dirty("switches")
 
-    def _mode_change(self, *args, **kwargs):
-        # Have to call this on the next frame since the mode controller's
-        # active list isn't updated yet
-        del args
-        del kwargs
-        self.machine.clock.schedule_once(self._update_modes)
+    def _switches_changed(self, *args, **kwargs):
+        """Only update switches which changed since the last snapshot."""
+        del args, kwargs
+        switch_controller = self.machine.switch_controller
+        snapshot = switch_controller.snapshot()
+        for name in switch_controller.switches.get_names(self._switch_snapshot ^ snapshot):
+            sw = self.machine.switches[name]
+            info = self.switches.get(sw)
+            if info:
+                self._switch_segments[sw] = self._switch_segment(info, switch_controller.switches.get_state(name))
+        self._switch_snapshot = snapshot
 
-    def _update_modes(self, *args, **kwargs):
-        del args
-        del kwargs
-        modes = self.machine.mode_controller.active_modes
+        self._mark_dirty("switches")
+
+    @staticmethod
+    def _switch_segment(info, state) -> "Segment":
+        name, x, y = info
+        if state:
+            return x, y, name, 0, 2
 
-        for i, mode in enumerate(modes):
-            self.screen.print_at(' ' * (self.columns[0] - 1),
-                                 self.columns[0], i + 4)
-            self.screen.print_at('{} ({})'.format(mode.name, mode.priority),
-                                 self.columns[0], i + 4)
+        return x, y, name, 7, 0
 
-        self.screen.print_at(' ' * (int(self.screen.width * .25) - 1),
-                             self.columns[0], len(modes) + 4)
+    def _draw_switches(self) -> "List[Segment]":
+        return list(self._switch_segments.values())
 
-    def _update_ball_devices(self, **kwargs):
+    def _mode_change(self, *args, **kwargs):
+        # the mode controller's active list isn't updated yet but frames are
+        # always rendered in a later loop iteration
+        del args
         del kwargs
+        self._mark_dirty("modes")
 
+    def _draw_modes(self) -> "List[Segment]":
+        return [(self.columns[0], i + 4, '{} ({})'.format(mode.name, mode.priority), 7, 0)
+                for i, mode in enumerate(self.machine.mode_controller.active_modes)]
+
+    def _draw_ball_devices(self) -> "List[Segment]":
+        segments = []
         row = 4
 
         try:
             for pf in self.machine.playfields:
-                self.screen.print_at('{}: {} '.format(pf.name, pf.balls),
-                                     self.columns[3], row,
-                                     colour=2 if pf.balls else 7)
+                segments.append((self.columns[3], row, '{}: {} '.format(pf.name, pf.balls),
+                                 2 if pf.balls else 7, 0))
                 row += 1
         except AttributeError:
             pass
 
         for bd in self.ball_devices:
-            # extra spaces to overwrite previous chars if the str shrinks
-            self.screen.print_at('{}: {} ({})                   '.format(
-                bd.name, bd.balls, bd.state), self.columns[3], row,
-                colour=2 if bd.balls else 7)
+            segments.append((self.columns[3], row, '{}: {} ({})'.format(bd.name, bd.balls, bd.state),
+                             2 if bd.balls else 7, 0))
             row += 1
 
+        return segments
+
     def _update_player(self, **kwargs):
         del kwargs
-        for i in range(3):
-            self.screen.print_at(
-                ' ' * (int(self.screen.width * (1 / len(self.columns))) + 1),
-                self.columns[3],
-                self.player_start_row + i)
-        try:
-            self.screen.print_at(
-                'PLAYER: {}'.format(self.machine.game.player.number),
-                self.columns[3], self.player_start_row)
-            self.screen.print_at(
-                'BALL: {}'.format(self.machine.game.player.ball),
-                self.columns[3], self.player_start_row + 1)
-            self.screen.print_at(
-                'SCORE: {:,}'.format(self.machine.game.player.score),
-                self.columns[3], self.player_start_row + 2)
-        except AttributeError:
-            self._update_player_no_game()
+        self._show_player = True
+        self._mark_dirty("player")
 
     def _update_player_no_game(self, **kwargs):
         del kwargs
-        for i in range(3):
-            self.screen.print_at(
-                ' ' * (int(self.screen.width * (1 / len(self.columns))) + 1),
-                self.columns[3],
-                self.player_start_row + i)
-
-        self.screen.print_at('NO GAME IN PROGRESS', self.columns[3],
-                             self.player_start_row)
+        self._show_player = False
+        self._mark_dirty("player")
+
+    def _draw_player(self) -> "List[Segment]":
+        if not self.player_start_row:
+            return []
+
+        x = self.columns[3]
+        row = self.player_start_row
+        segments = [
+            (x, row - 2, 'CURRENT PLAYER', 7, 0),
+            (x, row - 1, '-' * (int(self.screen.width * .75) + 1), 7, 0),
+        ]
+
+        player = self.machine.game.player if self._show_player and self.machine.game else None
+        if not player:
+            segments.append((x, row, 'NO GAME IN PROGRESS', 7, 0))
+            return segments
+
+        segments.append((x, row, 'PLAYER: {}'.format(player.number), 7, 0))
+        segments.append((x, row + 1, 'BALL: {}'.format(player.ball), 7, 0))
+        segments.append((x, row + 2, 'SCORE: {:,}'.format(player.score), 7, 0))
+        return segments
 
     def _tick(self):
-        if self.screen.has_resized():
-            self.screen = Screen.open()
-            self._update_switch_layout()
-            self._update_modes()
-            self._draw_screen()
-            self._draw_player_header()
+        self._run_on_screen(self._check_resize)
 
         self.machine.bcp.transport.send_to_clients_with_handler(handler="_status_request",
                                                                 bcp_command="status_request")
-        self._update_stats()
-        self._update_ball_devices()
-        self.screen.refresh()
+        self._mark_dirty("stats", "ball_devices")
 
     def _bcp_connection_attempt(self, name, host, port, **kwargs):
         del name
         del kwargs
         self._pending_bcp_connection = '{}:{}'.format(host, port)
-        self._draw_screen()
+        self._mark_dirty("banners")
 
     def _bcp_connected(self, **kwargs):
         del kwargs
         self._pending_bcp_connection = None
-        self.screen.print_at(' ' * self.screen.width,
-                             0, int(self.screen.height / 2) - 1)
-
-        self._update_modes()
+        self._mark_dirty("banners", "modes", "ball_devices")
         self._update_switches()
-        self._update_ball_devices()
 
     def _asset_load_change(self, percent, **kwargs):
         del kwargs
         self._asset_percent = percent
-        self._draw_screen()
+        self._mark_dirty("banners")
 
     def _asset_load_complete(self, **kwargs):
         del kwargs
         self._asset_percent = 100
-        self.screen.print_at(' ' * self.screen.width,
-                             0, int(self.screen.height / 2) + 1)
-
-        self._update_modes()
+        self._mark_dirty("banners", "modes", "ball_devices")
         self._update_switches()
-        self._update_ball_devices()
 
     def stop(self, **kwargs):
         """Stop the Text UI and restore the original console screen."""
@@ -335,6 +443,13 @@ class TextUi(MpfController):
 
         if self.screen:
             self.machine.clock.unschedule(self._tick_task)
+            if self._render_handle:
+                self._render_handle.cancel()
+                self._render_handle = None
+            if self._executor:
+                # wait for pending writes before closing the screen
+                self._executor.shutdown(wait=True)
             logger = logging.getLogger()
             logger.addHandler(logging.StreamHandler())
             self.screen.close(True)
+            self.screen = None
@@ -1,11 +1,88 @@
 """Switch ball counter."""
 import asyncio
+import heapq
+from functools import partial
 
 from mpf.core.utility_functions import Util
 from mpf.devices.ball_device.physical_ball_counter import PhysicalBallCounter, EjectTracker, BallLostActivity, \
     BallEntranceActivity, UnknownBallActivity, BallReturnActivity
 
 
+class SwitchSettleTracker(object):
+
+    """Track when ball switches settle and count the settled active switches.
+
+    A switch settles once it stayed in its state for the entrance delay (active) or the exit delay (inactive).
+    Every change only touches the changed switch. Deadlines of unsettled switches are kept in a heap so the owner
+    only has to wake up when the earliest deadline passes.
+    """
+
+    # switch_controller.is_state rounds to full ms. settle switches which are less than half a ms away as well.
+    TOLERANCE = 0.0005
+
+    __slots__ = ["_names", "_delays", "_states", "_settled_active", "_deadlines", "_heap"]
+
+    def __init__(self, switch_names, entrance_delay: float, exit_delay: float) -> None:
+        """Initialise tracker with delays in seconds."""
+        self._names = list(switch_names)
+        self._delays = (exit_delay, entrance_delay)     # indexed by state
+        self._states = {}
+        self._settled_active = set()
+        self._deadlines = {}
+        self._heap = []
+
+    def set_state(self, switch_name, state: int, change_time: float) -> float:
+        """Record that a switch changed into state at change_time and return when it will settle."""
+        self._states[switch_name] = state
+        self._settled_active.discard(switch_name)
+        deadline = change_time + self._delays[state]
+        self._deadlines[switch_name] = deadline
+        heapq.heappush(self._heap, (deadline, switch_name))
+        return deadline
+
+    def settle(self, now: float) -> bool:
+        """Settle all switches whose deadline passed. Return true if any switch settled."""
+        heap = self._heap
+        settled = False
+        while heap and heap[0][0] <= now + self.TOLERANCE:
+            deadline, switch_name = heapq.heappop(heap)
+            if self._deadlines.get(switch_name) != deadline:
+                # switch changed again in the meantime
+                continue
+            del self._deadlines[switch_name]
+            if self._states[switch_name]:
+                self._settled_active.add(switch_name)
+            settled = True
+
+        return settled
+
+    @property
+    def next_deadline(self):
+        """Return the earliest deadline of all unsettled switches (or None if all settled)."""
+        heap = self._heap
+        while heap and self._deadlines.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    @property
+    def is_stable(self) -> bool:
+        """Return true if all switches settled."""
+        return not self._deadlines
+
+    @property
+    def count(self) -> int:
+        """Return number of settled active switches."""
+        return len(self._settled_active)
+
+    def get_active_switches(self):
+        """Return names of all settled active switches."""
+        return [name for name in self._names if name in self._settled_active]
+
+    def get_unstable_switches(self):
+        """Return names of all switches which did not settle yet."""
+        return [name for name in self._names if name in self._deadlines]
+
+
 class SwitchCounter(PhysicalBallCounter):
 
     """Determine ball count by counting switches.
@@ -19,23 +96,23 @@ class SwitchCounter(PhysicalBallCounter):
         super().__init__(ball_device, config)
         self._entrances = []
         self._trigger_recount = asyncio.Event(loop=self.machine.clock.loop)
-        # Register switch handlers with delays for entrance & exit counts
+        self._settle_tracker = SwitchSettleTracker([switch.name for switch in self.config['ball_switches']],
+                                                   self.config['entrance_count_delay'] / 1000.0,
+                                                   self.config['exit_count_delay'] / 1000.0)
+        self._settle_timer = None
+        self._settle_time = None
+        # Register switch handlers to track when switches settle for entrance & exit counts
         for switch in self.config['ball_switches']:
+            switch_state = self.machine.switch_controller.switches[switch.name]
+            self._settle_tracker.set_state(switch.name, switch_state.state, switch_state.time)
             self.machine.switch_controller.add_switch_handler(
                 switch_name=switch.name, state=1,
-                ms=self.config['entrance_count_delay'],
-                callback=self.trigger_recount)
-            self.machine.switch_controller.add_switch_handler(
-                switch_name=switch.name, state=1,
-                callback=self.invalidate_count)
+                callback=partial(self._switch_changed, switch.name, 1))
             self.machine.switch_controller.add_switch_handler(
                 switch_name=switch.name, state=0,
-                ms=self.config['exit_count_delay'],
-                callback=self.trigger_recount)
-            self.machine.switch_controller.add_switch_handler(
-                switch_name=switch.name, state=0,
-                callback=self.invalidate_count)
+                callback=partial(self._switch_changed, switch.name, 0))
 
+        self._settle_switches()
         self._task = self.machine.clock.loop.create_task(self._run())
         self._is_unreliable = False
 
@@ -44,11 +121,41 @@ class SwitchCounter(PhysicalBallCounter):
         super().stop()
         if self._task:
             self._task.cancel()
+        if self._settle_timer:
+            self.machine.clock.timer_wheel.cancel(self._settle_timer)
+            self._settle_timer = None
 
     def trigger_recount(self):
         """Trigger a count."""
         self._trigger_recount.set()
 
+    def _switch_changed(self, switch_name, state):
+        """Invalidate the count and wait for the switch to settle."""
+        self.invalidate_count()
+        self._settle_tracker.set_state(switch_name, state, self.machine.clock.get_time())
+        self._settle_switches()
+
+    def _settle_switches(self):
+        """Settle all due switches, recount when all settled and wake up at the next deadline."""
+        if self._settle_timer and self._settle_time <= self.machine.clock.get_time():
+            # timer is due (or running right now)
+            self.machine.clock.timer_wheel.cancel(self._settle_timer)
+            self._settle_timer = None
+
+        if self._settle_tracker.settle(self.machine.clock.get_time()) and self._settle_tracker.is_stable:
+            self.trigger_recount()
+
+        next_deadline = self._settle_tracker.next_deadline
+        if next_deadline == self._settle_time and self._settle_timer:
+            return
+
+        if self._settle_timer:
+            self.machine.clock.timer_wheel.cancel(self._settle_timer)
+            self._settle_timer = None
+        self._settle_time = next_deadline
+        if next_deadline is not None:
+            self._settle_timer = self.machine.clock.timer_wheel.add_at(next_deadline, self._settle_switches)
+
     @asyncio.coroutine
     def _recount(self):
         while True:
@@ -118,23 +225,13 @@ class SwitchCounter(PhysicalBallCounter):
 
     def _count_switches_sync(self):
         """Return active switches or raise ValueError if switches are unstable."""
-        switches = []
-        for switch in self.config['ball_switches']:
-            valid = False
-            if self.machine.switch_controller.is_active(
-                    switch.name, ms=self.config['entrance_count_delay']):
-                switches.append(switch.name)
-                valid = True
-            elif self.machine.switch_controller.is_inactive(
-                    switch.name, ms=self.config['exit_count_delay']):
-                valid = True
-
-            if not valid:
-                # one of our switches wasn't valid long enough
-                self.debug_log("Switch '%s' changed too recently. Aborting count!", switch.name)
-                raise ValueError('Count not stable yet. Run again!')
-
-        return switches
+        if not self._settle_tracker.is_stable:
+            # one of our switches wasn't valid long enough
+            self.debug_log("Switches %s changed too recently. Aborting count!",
+                           self._settle_tracker.get_unstable_switches())
+            raise ValueError('Count not stable yet. Run again!')
+
+        return self._settle_tracker.get_active_switches()
 
     def count_balls_sync(self):
         """Count currently active switches or raise ValueError if switches are unstable."""
@@ -156,12 +253,10 @@ class SwitchCounter(PhysicalBallCounter):
     @property
     def is_ready_to_receive(self):
         """Return true if count is stable and we got at least one slot."""
-        try:
-            count = self._count_switches_sync()
-        except ValueError:
+        if not self._settle_tracker.is_stable:
             # count not stable
             return False
-        return count != len(self.config['ball_switches'])
+        return self._settle_tracker.count != len(self.config['ball_switches'])
 
     def wait_for_ready_to_receive(self):
         """Wait until there is at least on inactive switch."""
@@ -28,6 +28,7 @@ class Driver(SystemWideDevice):
     config_section = 'coils'
     collection = 'coils'
     class_label = 'coil'
+    monitor_enabled = False
 
     def __init__(self, machine: MachineController, name: str) -> None:
         """Initialise driver."""
@@ -204,6 +205,7 @@ class Driver(SystemWideDevice):
         # inform bcp clients
         self.machine.bcp.interface.send_driver_event(action="enable", name=self.name, number=self.config['number'],
                                                      pulse_ms=pulse_ms, pulse_power=pulse_power, hold_power=hold_power)
+        self._notify_monitors("enable", pulse_ms=pulse_ms, pulse_power=pulse_power, hold_power=hold_power)
 
     @event_handler(1)
     def disable(self, **kwargs):
@@ -214,6 +216,12 @@ class Driver(SystemWideDevice):
         self.hw_driver.disable()
         # inform bcp clients
         self.machine.bcp.interface.send_driver_event(action="disable", name=self.name, number=self.config['number'])
+        self._notify_monitors("disable")
+
+    def _notify_monitors(self, action, **kwargs):
+        if Driver.monitor_enabled and "drivers" in self.machine.monitors:
+            for callback in self.machine.monitors['drivers']:
+                callback(name=self.name, action=action, **kwargs)
 
     def _get_wait_ms(self, pulse_ms: int, max_wait_ms: Optional[int]) -> int:
         """Determine if this pulse should be delayed."""
@@ -238,6 +246,7 @@ class Driver(SystemWideDevice):
         # inform bcp clients
         self.machine.bcp.interface.send_driver_event(action="pulse", name=self.name, number=self.config['number'],
                                                      pulse_ms=pulse_ms, pulse_power=pulse_power)
+        self._notify_monitors("pulse", pulse_ms=pulse_ms, pulse_power=pulse_power)
 
     @event_handler(3)
     def pulse(self, pulse_ms: int = None, pulse_power: float = None, max_wait_ms: int = None, **kwargs) -> int:
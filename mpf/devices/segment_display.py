@@ -9,6 +9,7 @@ from mpf.core.system_wide_device import SystemWideDevice
 
 MYPY = False
 if MYPY:   # pragma: no cover
+    from mpf.core.placeholder_manager import TemplateSubscription
     from mpf.platforms.interfaces.segment_display_platform_interface import SegmentDisplayPlatformInterface
 
 TextStack = namedtuple("TextStack", ["text", "priority", "key"])
@@ -30,6 +31,7 @@ class SegmentDisplay(SystemWideDevice):
         self.platform = None
         self._text_stack = []               # type: List[TextStack]
         self._current_placeholder = None    # type: TextTemplate
+        self._current_subscription = None   # type: TemplateSubscription
         self.text = ""                      # type: str
         self.flashing = False               # type: bool
 
@@ -65,6 +67,10 @@ class SegmentDisplay(SystemWideDevice):
 
     def _update_stack(self) -> None:
         """Sort stack and show top entry on display."""
+        if self._current_subscription:
+            self._current_subscription.cancel()
+            self._current_subscription = None
+
         # do nothing if stack is emtpy. set display empty
         if not self._text_stack:
             self.hw_display.set_text("", flashing=False)
@@ -79,19 +85,18 @@ class SegmentDisplay(SystemWideDevice):
         top_entry = self._text_stack[0]
 
         self._current_placeholder = TextTemplate(self.machine, top_entry.text)
-        self._update_display()
+        self._current_subscription = self.machine.placeholder_manager.subscribe_template(
+            self._current_placeholder, {}, self._set_text)
 
-    def _update_display(self, *args, **kwargs) -> None:
+    def _update_display(self) -> None:
         """Update display to current text."""
-        del args
-        del kwargs
-        if not self._current_placeholder:
-            new_text = ""
+        if self._current_subscription:
+            self._current_subscription.update()
         else:
-            new_text, future = self._current_placeholder.evaluate_and_subscribe({})
-            future.add_done_callback(self._update_display)
+            self._set_text("")
 
-        # set text to display if it changed
+    def _set_text(self, new_text) -> None:
+        """Set text to display if it changed."""
         if new_text != self.text:
             self.text = new_text
             self.hw_display.set_text(self.text, flashing=self.flashing)
@@ -38,6 +38,7 @@ class Shot(EnableDisableMixin, ModeDevice):
         self.active_delays = set()
         self.running_show = None
         self._handlers = []
+        self._state_handlers = []
 
     def device_loaded_in_mode(self, mode: Mode, player: Player):
         """Add device to a mode that was already started.
@@ -47,6 +48,7 @@ class Shot(EnableDisableMixin, ModeDevice):
         since the mode started after that.
         """
         super().device_loaded_in_mode(mode, player)
+        self._notify_state_handlers()
         self._update_show()
 
     def _initialize(self):
@@ -148,6 +150,21 @@ class Shot(EnableDisableMixin, ModeDevice):
 
     def _set_state(self, state):
         self.player["shot_{}".format(self.name)] = state
+        self._notify_state_handlers()
+
+    def add_state_handler(self, callback):
+        """Call callback with this shot whenever its state (or player) changes."""
+        if callback not in self._state_handlers:
+            self._state_handlers.append(callback)
+
+    def remove_state_handler(self, callback):
+        """Remove a state handler."""
+        if callback in self._state_handlers:
+            self._state_handlers.remove(callback)
+
+    def _notify_state_handlers(self):
+        for callback in self._state_handlers:
+            callback(self)
 
     def _get_profile_settings(self):
         state = self._get_state()
@@ -162,59 +179,54 @@ class Shot(EnableDisableMixin, ModeDevice):
         state_settings = self.profile.config['states'][state]
 
         if state_settings['show']:  # there's a show specified this state
-            if self.running_show:
-                if (self.running_show.show.name == state_settings['show'] and
-                        self.running_show.manual_advance == bool(state_settings['manual_advance'])):
-                    if (self.running_show.manual_advance and
-                            self.running_show.current_step_index + 1 == state_settings['start_step']):
-                        # manual advance and correct step. stay there.
-                        return
-                    elif (self.running_show.manual_advance and
-                            self.running_show.current_step_index + 2 == state_settings['start_step']):
-                        # show it one step behind. advance it.
-                        self.running_show.advance()
-                        return
-                    elif not self.running_show.manual_advance:
-                        # not advancing manually but correct show. keep it that way.
-                        return
-
-                # current show it not the right one. stop it
-                self._stop_show()
-
-            # play the right one
-            self._play_show(settings=state_settings)
+            show_name, settings = self._get_show_settings(state_settings)
+            if (self.running_show and not settings['manual_advance'] and
+                    self.running_show.show.name == show_name and not self.running_show.manual_advance):
+                # not advancing manually but correct show. keep it that way.
+                return
 
         elif self.profile.config['show']:
-            # no show for this state, but we have a profile root show
-            if self.running_show:
-                # is the running show the profile root one or a step-specific
-                # one from the previous step?
-                if (self.running_show.show.name !=
-                        self.profile.config['show']):  # not ours
-                    self._stop_show()
-
-                    # start the new show at this step
-                    self._play_show(settings=state_settings, start_step=state + 1)
-
-                elif self.running_show.current_step_index == state_settings['start_step'] - 1:
-                    self.running_show.advance()
-                else:
-                    # restart otherwise
-                    self._stop_show()
-
-                    # start the new show at this step
-                    self._play_show(settings=state_settings, start_step=state + 1)
-
-            else:  # no running show, so start the profile root show
-                start_step = state + 1
-                self._play_show(settings=state_settings, start_step=start_step)
-
-        # if neither if/elif above happens, it means the current step has no
-        # show but the previous step had one. We stop the previous show if there is one
-        elif self.running_show:
+            # no show for this state, but we have a profile root show. start
+            # it at this step
+            show_name, settings = self._get_show_settings(state_settings, start_step=state + 1)
+
+        else:
+            # the current step has no show but the previous step may have had
+            # one. We stop the previous show if there is one
+            self._stop_show()
+            return
+
+        if self.running_show:
+            if self._hand_over_show(show_name, settings):
+                return
+
+            # current show it not the right one. stop it
             self._stop_show()
 
-    def _play_show(self, settings, start_step=None):
+        # play the right one
+        self.debug_log("Playing show: %s. %s", show_name, settings)
+        self.running_show = self.machine.shows[show_name].play(**settings)
+
+    def _hand_over_show(self, show_name, settings) -> bool:
+        """Reuse the running show for a new state if only its step changed.
+
+        Returns True if the running show is showing the new state.
+        """
+        running_show = self.running_show
+        if (running_show.stopped or running_show.current_step_index is None or
+                not settings['manual_advance'] or not running_show.manual_advance or
+                running_show.show.name != show_name or running_show.priority != settings['priority'] or
+                running_show.show_tokens != settings['show_tokens']):
+            return False
+
+        if running_show.current_step_index + 1 != settings['start_step']:
+            # move the show to the step of this state
+            running_show.advance(show_step=settings['start_step'])
+
+        return True
+
+    def _get_show_settings(self, settings, start_step=None):
+        """Return name and play settings of the show for the state with settings."""
         s = copy(settings)
         if settings['show']:
             show_name = settings['show']
@@ -234,9 +246,7 @@ class Shot(EnableDisableMixin, ModeDevice):
         s.pop('show')
         s.pop('name')
 
-        self.debug_log("Playing show: %s. %s", show_name, s)
-
-        self.running_show = self.machine.shows[show_name].play(**s)
+        return show_name, s
 
     def device_removed_from_mode(self, mode):
         """Remove this shot device.
@@ -248,6 +258,7 @@ class Shot(EnableDisableMixin, ModeDevice):
         if self.running_show:
             self.running_show.stop()
             self.running_show = None
+        self._notify_state_handlers()
 
     @event_handler(5)
     def hit(self, **kwargs):
@@ -1,6 +1,6 @@
 """Contains the ShotGroup base class."""
 
-from collections import deque
+from collections import Counter, deque
 
 from mpf.core.events import event_handler
 from mpf.core.mode import Mode
@@ -31,6 +31,11 @@ class ShotGroup(ModeDevice):
         self.rotation_enabled = None
         self.profile = None
         self.rotation_pattern = None
+        self._shot_states = dict()
+        self._state_counts = Counter()
+        """Number of member shots per state name. Updated by the shots on every
+        state change (and when their player vars change) so completion checks
+        do not have to look at all shots."""
 
     def add_control_events_in_mode(self, mode) -> None:
         """Remove enable here."""
@@ -39,25 +44,57 @@ class ShotGroup(ModeDevice):
     def device_loaded_in_mode(self, mode: Mode, player: Player):
         """Add device in mode."""
         super().device_loaded_in_mode(mode, player)
+        self._count_states()
         self._check_for_complete()
         self.profile = self.config['shots'][0].profile
         self.rotation_pattern = deque(self.profile.config['rotation_pattern'])
         self.rotation_enabled = not self.config['enable_rotation_events']
         for shot in self.config['shots']:
             self.machine.events.add_handler("{}_hit".format(shot.name), self._hit)
+            shot.add_state_handler(self._shot_state_changed)
+            # the state is a player var which may also be changed directly
+            self.machine.events.add_handler("player_shot_{}".format(shot.name), self._shot_player_var_changed,
+                                            shot=shot)
 
     def device_removed_from_mode(self, mode):
         """Disable device when mode stops."""
         super().device_removed_from_mode(mode)
         self.machine.events.remove_handler(self._hit)
+        self.machine.events.remove_handler(self._shot_player_var_changed)
+        for shot in self.config['shots']:
+            shot.remove_state_handler(self._shot_state_changed)
+
+    def _count_states(self):
+        """Count the states of all member shots."""
+        self._shot_states = {shot: shot.state_name for shot in self.config['shots']}
+        self._state_counts = Counter(self._shot_states.values())
+
+    def _shot_state_changed(self, shot):
+        """Move a member shot from the count of its old state to its new state."""
+        state = shot.state_name
+        old_state = self._shot_states.get(shot)
+        if state == old_state:
+            return
+
+        self._shot_states[shot] = state
+        if old_state is not None:
+            self._state_counts[old_state] -= 1
+            if not self._state_counts[old_state]:
+                del self._state_counts[old_state]
+        self._state_counts[state] += 1
+
+    def _shot_player_var_changed(self, shot, **kwargs):
+        """Update the counts when the player var of a member shot was written directly."""
+        del kwargs
+        self._shot_state_changed(shot)
 
     def _check_for_complete(self):
         """Check if all shots in this group are in the same state."""
-        state = self.config['shots'][0].state_name
-        for shot in self.config['shots']:
-            if state != shot.state_name:
-                # shots do not have a common state
-                return
+        if len(self._state_counts) != 1:
+            # shots do not have a common state
+            return
+
+        state = next(iter(self._state_counts))
 
         # if we reached this point we got a common state
 
@@ -189,11 +226,7 @@ class ShotGroup(ModeDevice):
 
             return
 
-        # shot_state_list is deque of tuples (state num, show step num)
-        shot_state_list = deque()
-
-        for shot in self.config['shots']:
-            shot_state_list.append(shot.state)
+        shot_state_list = deque(shot.state for shot in self.config['shots'])
 
         # figure out which direction we're going to rotate
         if not direction:
@@ -86,7 +86,7 @@ class Switch(SystemWideDevice, DevicePositionMixin):
         self.machine.switch_controller.add_switch_handler(
             switch_name=self.name,
             state=state,
-            callback=partial(self.machine.events.post, event=event),
+            callback=partial(self.machine.events.post_by_id, self.machine.events.get_event_id(event)),
             ms=ms
         )
 
@@ -49,6 +49,7 @@ class Timer(ModeDevice):
         self.timer = None                   # type: PeriodicTask
         self.event_keys = list()            # type: List[EventHandlerKey]
         self.delay = None                   # type: DelayManager
+        self._event_ids = self.machine.events.get_event_ids('timer_' + name + '_')
 
     def device_added_to_mode(self, mode: Mode):
         """Device added in mode."""
@@ -212,9 +213,9 @@ class Timer(ModeDevice):
         self.delay.remove('pause')
         self._create_system_timer()
 
-        self.machine.events.post('timer_' + self.name + '_started',
-                                 ticks=self.ticks,
-                                 ticks_remaining=self.ticks_remaining)
+        self.machine.events.post_by_id(self._event_ids['started'],
+                                       ticks=self.ticks,
+                                       ticks_remaining=self.ticks_remaining)
         '''event: timer_(name)_started
 
         desc: The timer named (name) has just started.
@@ -260,9 +261,9 @@ class Timer(ModeDevice):
         self.running = False
         self._remove_system_timer()
 
-        self.machine.events.post('timer_' + self.name + '_stopped',
-                                 ticks=self.ticks,
-                                 ticks_remaining=self.ticks_remaining)
+        self.machine.events.post_by_id(self._event_ids['stopped'],
+                                       ticks=self.ticks,
+                                       ticks_remaining=self.ticks_remaining)
         '''event: timer_(name)_stopped
 
         desc: The timer named (name) has stopped.
@@ -298,9 +299,9 @@ class Timer(ModeDevice):
         pause_secs = timer_value
 
         self._remove_system_timer()
-        self.machine.events.post('timer_' + self.name + '_paused',
-                                 ticks=self.ticks,
-                                 ticks_remaining=self.ticks_remaining)
+        self.machine.events.post_by_id(self._event_ids['paused'],
+                                       ticks=self.ticks,
+                                       ticks_remaining=self.ticks_remaining)
         '''event: timer_(name)_paused
 
         desc: The timer named (name) has paused.
@@ -330,9 +331,9 @@ class Timer(ModeDevice):
 
         self.stop()
 
-        self.machine.events.post('timer_' + self.name + '_complete',
-                                 ticks=self.ticks,
-                                 ticks_remaining=self.ticks_remaining)
+        self.machine.events.post_by_id(self._event_ids['complete'],
+                                       ticks=self.ticks,
+                                       ticks_remaining=self.ticks_remaining)
         '''event: timer_(name)_complete
 
         desc: The timer named (name) has completed.
@@ -372,9 +373,9 @@ class Timer(ModeDevice):
     def _post_tick_events(self):
 
         if not self._check_for_done():
-            self.machine.events.post('timer_' + self.name + '_tick',
-                                     ticks=self.ticks,
-                                     ticks_remaining=self.ticks_remaining)
+            self.machine.events.post_by_id(self._event_ids['tick'],
+                                           ticks=self.ticks,
+                                           ticks_remaining=self.ticks_remaining)
             '''event: timer_(name)_tick
 
             desc: The timer named (name) has just counted down (or up,
@@ -412,10 +413,10 @@ class Timer(ModeDevice):
         self.ticks = new_value
         ticks_added = new_value - timer_value
 
-        self.machine.events.post('timer_' + self.name + '_time_added',
-                                 ticks=self.ticks,
-                                 ticks_added=ticks_added,
-                                 ticks_remaining=self.ticks_remaining)
+        self.machine.events.post_by_id(self._event_ids['time_added'],
+                                       ticks=self.ticks,
+                                       ticks_added=ticks_added,
+                                       ticks_remaining=self.ticks_remaining)
         '''event: timer_(name)_time_added
 
         desc: The timer named (name) has just had time added to it.
@@ -444,10 +445,10 @@ class Timer(ModeDevice):
 
         self.ticks -= ticks_subtracted
 
-        self.machine.events.post('timer_' + self.name + '_time_subtracted',
-                                 ticks=self.ticks,
-                                 ticks_subtracted=ticks_subtracted,
-                                 ticks_remaining=self.ticks_remaining)
+        self.machine.events.post_by_id(self._event_ids['time_subtracted'],
+                                       ticks=self.ticks,
+                                       ticks_subtracted=ticks_subtracted,
+                                       ticks_remaining=self.ticks_remaining)
         '''event: timer_(name)_time_subtracted
 
         desc: The timer named (name) just had some ticks removed.
@@ -492,7 +493,8 @@ class Timer(ModeDevice):
         # Creates the clock event which drives this mode timer's tick method.
         self._remove_system_timer()
         self.timer = self.machine.clock.schedule_interval(self._timer_tick,
-                                                          self.tick_secs)
+                                                          self.tick_secs,
+                                                          self.config['sync_ticks'])
 
     def _remove_system_timer(self):
         # Removes the clock event associated with this mode timer.
@@ -3,8 +3,8 @@
 Fixes for octal and boolean values are from here:
 http://stackoverflow.com/questions/32965846/cant-parse-yaml-correctly/
 """
-import copy
 import logging
+import pickle
 import re
 
 from typing import Any, Iterable
@@ -161,7 +161,9 @@ class YamlInterface(FileInterface):
 
     file_types = ['.yaml', '.yml']
     cache = False
-    file_cache = dict()     # type: Dict[str, Any]
+    file_cache = collections.OrderedDict()     # type: Dict[str, bytes]
+    file_cache_size = 0
+    file_cache_max_size = 64 * 1024 * 1024
 
     def load(self, filename, expected_version_str=None, halt_on_error=True) -> dict:
         """Load a YAML file from disk.
@@ -178,7 +180,8 @@ class YamlInterface(FileInterface):
             A dictionary of the settings from this YAML file.
         """
         if self.cache and filename in self.file_cache:
-            return copy.deepcopy(self.file_cache[filename])
+            self.file_cache.move_to_end(filename)
+            return pickle.loads(self.file_cache[filename])
 
         config = dict()     # type: dict
 
@@ -210,10 +213,26 @@ class YamlInterface(FileInterface):
                 self.log.warning(msg)
 
         if self.cache and config:
-            self.file_cache[filename] = copy.deepcopy(config)
+            self._add_to_cache(filename, config)
 
         return config
 
+    @classmethod
+    def _add_to_cache(cls, filename, config):
+        """Add config to the LRU file cache and evict old entries if it grew too large.
+
+        Entries are stored pickled which is a lot cheaper than a deepcopy on every hit.
+        """
+        data = pickle.dumps(config, protocol=4)
+        if filename in cls.file_cache:
+            cls.file_cache_size -= len(cls.file_cache.pop(filename))
+        cls.file_cache[filename] = data
+        cls.file_cache_size += len(data)
+
+        while cls.file_cache_size > cls.file_cache_max_size and len(cls.file_cache) > 1:
+            _, evicted = cls.file_cache.popitem(last=False)
+            cls.file_cache_size -= len(evicted)
+
     @staticmethod
     def process(data_string: Iterable[str]) -> dict:
         """Parse yaml from a string."""
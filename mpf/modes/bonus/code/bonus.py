@@ -134,7 +134,7 @@ class Bonus(Mode):
 
     def _do_multiplier(self):
         multiplier = self.player.vars.get("bonus_multiplier", 1)
-        self.debug_log("Bonus multiplier: {}".format(multiplier))
+        self.debug_log("Bonus multiplier: %s", multiplier)
         self.machine.events.post('bonus_multiplier', multiplier=multiplier)
         '''event: bonus_multiplier
 
@@ -114,27 +114,28 @@ down_events: list|str|sw_service_down_active
                 yield from items[position].callback()
                 self._update_main_menu(items, position)
 
-    def _switch_monitor(self, change: MonitoredSwitchChange):
-        if change.state:
-            state_string = "active"
-            self.machine.events.post("service_switch_hit")
-        else:
-            state_string = "inactive"
-
-        self.machine.events.post("service_switch_test_start",
-                                 switch_name=change.name,
-                                 switch_num=change.num,
-                                 switch_label=change.label,
-                                 switch_state=state_string)
+    def _switch_monitor(self, changes: List[MonitoredSwitchChange]):
+        for change in changes:
+            if change.state:
+                state_string = "active"
+                self.machine.events.post("service_switch_hit")
+            else:
+                state_string = "inactive"
+
+            self.machine.events.post("service_switch_test_start",
+                                     switch_name=change.name,
+                                     switch_num=change.num,
+                                     switch_label=change.label,
+                                     switch_state=state_string)
 
     @asyncio.coroutine
     def _switch_test_menu(self):
-        self.machine.switch_controller.add_monitor(self._switch_monitor)
+        self.machine.switch_controller.add_batched_monitor(self._switch_monitor)
         self.machine.events.post("service_switch_test_start",
                                  switch_name="", switch_state="", switch_num="", switch_label="")
         yield from self.machine.events.wait_for_any_event(self.config['mode_settings']['esc_events'])
         self.machine.events.post("service_switch_test_stop")
-        self.machine.switch_controller.remove_monitor(self._switch_monitor)
+        self.machine.switch_controller.remove_batched_monitor(self._switch_monitor)
 
     def _update_coil_slide(self, items, position):
         board, coil = items[position]
@@ -1,5 +1,6 @@
 """MPF plugin for an auditor which records switch events, high scores, shots, etc."""
 
+from array import array
 import logging
 
 from mpf.core.switch_controller import MonitoredSwitchChange
@@ -8,12 +9,94 @@ from mpf.devices.shot import Shot
 MYPY = False
 if MYPY:   # pragma: no cover
     from mpf.core.machine import MachineController
-    from typing import Any, Set
+    from typing import Any, Dict, List, Set, Tuple
+
+
+class AuditCounters(object):
+
+    """Audit counters grouped by category.
+
+    Every counter gets a fixed slot in the array of its category when it is
+    added, so counting is an index lookup and an increment. Changes are found
+    by comparing with a copy of the counts taken at the last flush.
+    """
+
+    __slots__ = ["_ids", "_names", "_counts", "_flushed"]
+
+    def __init__(self) -> None:
+        """Initialise empty counters."""
+        self._ids = {}          # type: Dict[str, Dict[str, int]]
+        self._names = {}        # type: Dict[str, List[str]]
+        self._counts = {}       # type: Dict[str, array]
+        self._flushed = {}      # type: Dict[str, array]
+
+    def add(self, category: str, name: str, value: int = 0) -> int:
+        """Add a counter (if it does not exist yet) and return its id in the category."""
+        ids = self._ids.get(category)
+        if ids is None:
+            ids = self._ids[category] = {}
+            self._names[category] = []
+            self._counts[category] = array('q')
+            self._flushed[category] = array('q')
+
+        counter_id = ids.get(name)
+        if counter_id is None:
+            counter_id = ids[name] = len(self._names[category])
+            self._names[category].append(name)
+            self._counts[category].append(value)
+            self._flushed[category].append(value)
+        return counter_id
+
+    def get_counts(self, category: str) -> array:
+        """Return the counts of a category indexed by counter id."""
+        if category not in self._counts:
+            self._ids[category] = {}
+            self._names[category] = []
+            self._counts[category] = array('q')
+            self._flushed[category] = array('q')
+        return self._counts[category]
+
+    def increment(self, category: str, name: str) -> int:
+        """Increment a counter (adding it if needed) and return its new value."""
+        try:
+            counter_id = self._ids[category][name]
+        except KeyError:
+            counter_id = self.add(category, name)
+        counts = self._counts[category]
+        counts[counter_id] += 1
+        return counts[counter_id]
+
+    def get(self, category: str, name: str) -> int:
+        """Return the value of a counter."""
+        return self._counts[category][self._ids[category][name]]
+
+    def get_changes(self) -> "List[Tuple[str, str, int]]":
+        """Return category, name and value of all counters which changed since the last call."""
+        changes = []
+        for category, counts in self._counts.items():
+            flushed = self._flushed[category]
+            if counts == flushed:
+                continue
+            names = self._names[category]
+            for counter_id, value in enumerate(counts):
+                if value != flushed[counter_id]:
+                    changes.append((category, names[counter_id], value))
+            self._flushed[category] = array('q', counts)
+        return changes
+
+    def to_dict(self) -> "Dict[str, Dict[str, int]]":
+        """Return all counters as nested dicts."""
+        return {category: dict(zip(self._names[category], counts)) for category, counts in self._counts.items()}
 
 
 class Auditor(object):
 
-    """Writes switch events, regular events, and player variables to an audit log file."""
+    """Writes switch events, regular events, and player variables to an audit log file.
+
+    Counters live in :class:`AuditCounters` and are published as machine
+    variables every ``flush_interval``. They are saved on ``save_events`` and
+    on shutdown.
+    """
 
     def __init__(self, machine: "MachineController") -> None:
         """Initialise auditor.
@@ -33,7 +116,11 @@ class Auditor(object):
         self.machine.auditor = self
         self.switchnames_to_audit = set()       # type: Set[str]
         self.config = None                      # type: Any
-        self.current_audits = None              # type: Any
+        self.counters = AuditCounters()
+        self.player_audits = dict()             # type: Dict[str, Any]
+        self._switch_ids = dict()               # type: Dict[str, int]
+        self._switch_counts = self.counters.get_counts('switches')
+        self._flush_task = None
 
         self.enabled = False
         """Attribute that's viewed by other core components to let them know
@@ -49,6 +136,13 @@ class Auditor(object):
         """Return string representation."""
         return '<Auditor>'
 
+    @property
+    def current_audits(self) -> "Dict[str, Any]":
+        """Return all audits as nested dicts (as they are saved)."""
+        audits = self.counters.to_dict()    # type: Dict[str, Any]
+        audits['player'] = self.player_audits
+        return audits
+
     def _initialize(self, **kwargs):
         del kwargs
         # Initializes the auditor. We do this separate from __init__() since
@@ -56,43 +150,33 @@ class Auditor(object):
 
         self.config = self.machine.config_validator.validate_config('auditor', self.machine.config['auditor'])
 
-        self.current_audits = self.data_manager.get_data()
-
-        if not isinstance(self.current_audits, dict):
-            self.current_audits = dict()
-
-        # Make sure we have all the sections we need in our audit dict
-        if 'switches' not in self.current_audits:
-            self.current_audits['switches'] = dict()
-
-        if 'events' not in self.current_audits:
-            self.current_audits['events'] = dict()
+        self._load_audits(self.data_manager.get_data())
 
-        if 'player' not in self.current_audits:
-            self.current_audits['player'] = dict()
+        # Make sure we have all the sections we need in our audits
+        self.counters.get_counts('events')
 
-        # Make sure we have all the switches in our audit dict
-        for switch in self.machine.switches:
-            if (switch.name not in self.current_audits['switches'] and
-                    'no_audit' not in switch.tags):
-                self.current_audits['switches'][switch.name] = 0
-
-        # build the list of switches we should audit
+        # build the list of switches we should audit and make sure they all have a counter
         self.switchnames_to_audit = {x.name for x in self.machine.switches
                                      if 'no_audit' not in x.tags}
+        self._switch_ids = {name: self.counters.add('switches', name) for name in sorted(self.switchnames_to_audit)}
+
+        # Make sure we have all the events and player stuff in our audits
+        if 'events' in self.config['audit']:
+            for event in self.config['events']:
+                self.counters.add('events', event)
 
-        # Make sure we have all the player stuff in our audit dict
         if 'player' in self.config['audit']:
             for item in self.config['player']:
-                if item not in self.current_audits['player']:
-                    self.current_audits['player'][item] = dict()
-                    self.current_audits['player'][item]['top'] = list()
-                    self.current_audits['player'][item]['average'] = 0
-                    self.current_audits['player'][item]['total'] = 0
+                if item not in self.player_audits:
+                    self.player_audits[item] = dict()
+                    self.player_audits[item]['top'] = list()
+                    self.player_audits[item]['average'] = 0
+                    self.player_audits[item]['total'] = 0
 
         # Register for the events the auditor needs to do its job
         self.machine.events.add_handler('game_starting', self.enable)
         self.machine.events.add_handler('game_ended', self.disable)
+        self.machine.events.add_handler('shutdown', self._shutdown)
         if 'player' in self.config['audit']:
             self.machine.events.add_handler('game_ending', self.audit_player)
 
@@ -101,13 +185,36 @@ class Auditor(object):
         self.machine.register_monitor('shots', self.audit_shot)
 
         # Add the switches monitor
-        self.machine.switch_controller.add_monitor(self.audit_switch)
+        self.machine.switch_controller.add_batched_monitor(self.audit_switches)
 
         for category, audits in self.current_audits.items():
             if not isinstance(audits, dict):
                 continue
             for name, value in audits.items():
                 self.machine.set_machine_var("audits_{}_{}".format(category, name), value)
+        self.counters.get_changes()
+
+        if self.config['flush_interval']:
+            self._flush_task = self.machine.clock.schedule_interval(self.flush, self.config['flush_interval'] / 1000)
+
+    def _load_audits(self, data):
+        if not isinstance(data, dict):
+            return
+
+        for category, audits in data.items():
+            if not isinstance(audits, dict):
+                continue
+            if category == 'player':
+                self.player_audits = audits
+                continue
+            for name, value in audits.items():
+                if isinstance(value, int):
+                    self.counters.add(category, name, value)
+
+    def flush(self):
+        """Publish all changed counters as machine variables."""
+        for category, name, value in self.counters.get_changes():
+            self.machine.set_machine_var("audits_{}_{}".format(category, name), value)
 
     def audit(self, audit_class, event, **kwargs):
         """Log an auditable event.
@@ -120,20 +227,26 @@ class Auditor(object):
                 might include random kwargs.
         """
         del kwargs
-
-        if audit_class not in self.current_audits:
-            self.current_audits[audit_class] = dict()
-
-        if event not in self.current_audits[audit_class]:
-            self.current_audits[audit_class][event] = 0
-
-        self.current_audits[audit_class][event] += 1
-        self.machine.set_machine_var("audits_{}_{}".format(audit_class, event), self.current_audits[audit_class][event])
+        self.counters.increment(audit_class, event)
 
     def audit_switch(self, change: MonitoredSwitchChange):
         """Record switch change."""
-        if self.enabled and change.state and change.name in self.switchnames_to_audit:
-            self.audit('switches', change.name)
+        if self.enabled and change.state:
+            switch_id = self._switch_ids.get(change.name)
+            if switch_id is not None:
+                self._switch_counts[switch_id] += 1
+
+    def audit_switches(self, changes: "List[MonitoredSwitchChange]"):
+        """Record a batch of switch changes."""
+        if not self.enabled:
+            return
+        switch_ids = self._switch_ids
+        counts = self._switch_counts
+        for change in changes:
+            if change.state:
+                switch_id = switch_ids.get(change.name)
+                if switch_id is not None:
+                    counts[switch_id] += 1
 
     def audit_shot(self, name, profile, state):
         """Record shot hit."""
@@ -150,8 +263,7 @@ class Auditor(object):
                 kwargs.
         """
         del kwargs
-
-        self.current_audits['events'][eventname] += 1
+        self.counters.increment('events', eventname)
 
     def audit_player(self, **kwargs):
         """Write player data to the audit log.
@@ -166,19 +278,19 @@ class Auditor(object):
         for item in self.config['player']:
             for player in self.machine.game.player_list:
 
-                self.current_audits['player'][item]['top'] = (
+                self.player_audits[item]['top'] = (
                     self._merge_into_top_list(
                         player[item],
-                        self.current_audits['player'][item]['top'],
+                        self.player_audits[item]['top'],
                         self.config['num_player_top_records']))
 
-                self.current_audits['player'][item]['average'] = (
-                    ((self.current_audits['player'][item]['total'] *
-                      self.current_audits['player'][item]['average']) +
+                self.player_audits[item]['average'] = (
+                    ((self.player_audits[item]['total'] *
+                      self.player_audits[item]['average']) +
                      self.machine.game.player[item]) /
-                    (self.current_audits['player'][item]['total'] + 1))
+                    (self.player_audits[item]['total'] + 1))
 
-                self.current_audits['player'][item]['total'] += 1
+                self.player_audits[item]['total'] += 1
 
     @classmethod
     def _merge_into_top_list(cls, new_item, current_list, num_items):
@@ -214,9 +326,6 @@ class Auditor(object):
                                                 self.audit_event,
                                                 eventname=event,
                                                 priority=2)
-                # Make sure we have an entry in our audit file for this event
-                if event not in self.current_audits['events']:
-                    self.current_audits['events'][event] = 0
 
         for event in self.config['save_events']:
             self.machine.events.add_handler(event, self._save_audits,
@@ -224,13 +333,22 @@ class Auditor(object):
 
     def _save_audits(self, **kwargs):
         del kwargs
+        self.flush()
         self.data_manager.save_all(data=self.current_audits)
 
+    def _shutdown(self, **kwargs):
+        del kwargs
+        if self._flush_task:
+            self.machine.clock.unschedule(self._flush_task)
+            self._flush_task = None
+        self._save_audits()
+
     def disable(self, **kwargs):
         """Disable the auditor."""
         del kwargs
         self.log.debug("Disabling the Auditor")
         self.enabled = False
+        self.flush()
 
         # remove switch and event handlers
         self.machine.events.remove_handler(self.audit_event)
@@ -5,6 +5,20 @@ from mpf.core.delays import DelayManager
 from mpf.core.utility_functions import Util
 
 
+SWITCH_PLAYER_ACTIONS = ("activate", "deactivate", "hit")
+
+
+def play_switch_step(switch_controller, step):
+    """Perform the switch action of one step (dict with switch and action)."""
+    if step['action'] == 'activate':
+        switch_controller.process_switch(step['switch'], state=1, logical=True)
+    elif step['action'] == 'deactivate':
+        switch_controller.process_switch(step['switch'], state=0, logical=True)
+    elif step['action'] == 'hit':
+        switch_controller.process_switch(step['switch'], state=1, logical=True)
+        switch_controller.process_switch(step['switch'], state=0, logical=True)
+
+
 class SwitchPlayer(object):
 
     """Plays back switch sequences from a config file, used for testing."""
@@ -49,18 +63,7 @@ class SwitchPlayer(object):
                        this_step['action'])
 
         # send this step's switches
-        if this_step['action'] == 'activate':
-            self.machine.switch_controller.process_switch(
-                this_step['switch'],
-                state=1,
-                logical=True)
-        elif this_step['action'] == 'deactivate':
-            self.machine.switch_controller.process_switch(
-                this_step['switch'],
-                state=0,
-                logical=True)
-        elif this_step['action'] == 'hit':
-            self._hit(this_step['switch'])
+        play_switch_step(self.machine.switch_controller, this_step)
 
         # inc counter
         if self.current_step < len(self.step_list) - 1:
@@ -71,15 +74,5 @@ class SwitchPlayer(object):
                            ms=Util.string_to_ms(self.step_list[self.current_step]['time']),
                            callback=self._do_step)
 
-    def _hit(self, switch):
-        self.machine.switch_controller.process_switch(
-            switch,
-            state=1,
-            logical=True)
-        self.machine.switch_controller.process_switch(
-            switch,
-            state=0,
-            logical=True)
-
 
 plugin_class = SwitchPlayer
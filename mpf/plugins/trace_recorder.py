@@ -0,0 +1,167 @@
+"""MPF plugin which records events, switch changes and driver actions into a binary ring buffer."""
+import logging
+import marshal
+import os
+import struct
+from collections import deque, namedtuple
+
+from mpf.core.switch_controller import MonitoredSwitchChange
+from mpf.devices.driver import Driver
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.core.machine import MachineController
+    from typing import Any, Deque, Dict, Iterator, List
+
+TraceRecord = namedtuple("TraceRecord", ["type", "time", "name", "data"])
+
+TRACE_MAGIC = b"MPFTRACE"
+TRACE_VERSION = 1
+
+RECORD_EVENT = 1
+RECORD_SWITCH = 2
+RECORD_DRIVER = 3
+
+# type, time, name id, payload length
+_RECORD_HEADER = struct.Struct("<BdII")
+_FILE_HEADER = struct.Struct("<8sBI")
+_STRING_LENGTH = struct.Struct("<H")
+
+
+def _to_primitive(value):
+    """Convert value to something which can be marshalled."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    elif isinstance(value, (list, tuple)):
+        return [_to_primitive(x) for x in value]
+    elif isinstance(value, dict):
+        return {str(k): _to_primitive(v) for k, v in value.items()}
+
+    return str(value)
+
+
+class TraceRecorder(object):
+
+    """Records a trace of all events, switch changes and driver actions.
+
+    Records are packed into a compact binary format and kept in a ring buffer
+    of ``buffer_size`` records. Names are stored once in a string table and
+    records only reference them. The buffer is written to disk on one of the
+    ``dump_events`` or when MPF stops because of a crash.
+    """
+
+    def __init__(self, machine: "MachineController") -> None:
+        """Initialise trace recorder."""
+        if 'trace_recorder' not in machine.config:
+            machine.log.debug('"trace_recorder:" section not found in '
+                              'machine configuration, so the trace recorder '
+                              'will not be used.')
+            return
+
+        self.log = logging.getLogger('TraceRecorder')
+        self.machine = machine
+        self.config = self.machine.config_validator.validate_config('trace_recorder',
+                                                                    self.machine.config['trace_recorder'])
+
+        self.buffer = deque(maxlen=self.config['buffer_size'])  # type: Deque[bytes]
+        self.strings = {}       # type: Dict[str, int]
+
+        if self.config['record_events']:
+            self.machine.register_monitor('events', self.record_event)
+        if self.config['record_switches']:
+            self.machine.switch_controller.add_monitor(self.record_switch)
+        if self.config['record_drivers']:
+            Driver.monitor_enabled = True
+            self.machine.register_monitor('drivers', self.record_driver)
+
+        for event in self.config['dump_events']:
+            self.machine.events.add_handler(event, self._dump_event_handler)
+        self.machine.events.add_handler('shutdown', self._shutdown)
+
+    def __repr__(self):
+        """Return string representation."""
+        return '<TraceRecorder>'
+
+    def _get_string_id(self, name: str) -> int:
+        try:
+            return self.strings[name]
+        except KeyError:
+            string_id = self.strings[name] = len(self.strings)
+            return string_id
+
+    def _add_record(self, record_type: int, name: str, payload: bytes) -> None:
+        self.buffer.append(_RECORD_HEADER.pack(record_type, self.machine.clock.get_time(),
+                                               self._get_string_id(name), len(payload)) + payload)
+
+    def record_event(self, event: str, ev_type, kwargs: dict) -> None:
+        """Record a posted event."""
+        self._add_record(RECORD_EVENT, event, marshal.dumps((ev_type, _to_primitive(kwargs))))
+
+    def record_switch(self, change: MonitoredSwitchChange) -> None:
+        """Record a switch edge."""
+        self._add_record(RECORD_SWITCH, change.name, b'\x01' if change.state else b'\x00')
+
+    def record_driver(self, name: str, action: str, **kwargs) -> None:
+        """Record a driver action."""
+        kwargs['action'] = action
+        self._add_record(RECORD_DRIVER, name, marshal.dumps(_to_primitive(kwargs)))
+
+    def _dump_event_handler(self, **kwargs):
+        del kwargs
+        self.dump()
+
+    def _shutdown(self, **kwargs):
+        del kwargs
+        # pylint: disable-msg=protected-access
+        if self.config['dump_on_crash'] and self.machine._exception:
+            self.dump()
+
+    def dump(self, filename: str = None) -> str:
+        """Write the current buffer to disk and return the file name."""
+        if not filename:
+            filename = os.path.join(self.machine.machine_path, self.config['file'])
+
+        os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+
+        strings = sorted(self.strings, key=self.strings.get)
+        with open(filename, 'wb') as f:
+            f.write(_FILE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, len(strings)))
+            for string in strings:
+                encoded = string.encode()
+                f.write(_STRING_LENGTH.pack(len(encoded)))
+                f.write(encoded)
+            f.write(b''.join(self.buffer))
+
+        self.log.info("Wrote %s trace records to %s", len(self.buffer), filename)
+        return filename
+
+
+def read_trace(filename: str) -> "Iterator[TraceRecord]":
+    """Read a trace file written by the TraceRecorder."""
+    with open(filename, 'rb') as f:
+        data = f.read()
+
+    magic, version, num_strings = _FILE_HEADER.unpack_from(data, 0)
+    if magic != TRACE_MAGIC or version != TRACE_VERSION:
+        raise AssertionError("File {} is not a valid trace (version {}).".format(filename, TRACE_VERSION))
+
+    offset = _FILE_HEADER.size
+    strings = []    # type: List[str]
+    for _ in range(num_strings):
+        length, = _STRING_LENGTH.unpack_from(data, offset)
+        offset += _STRING_LENGTH.size
+        strings.append(data[offset:offset + length].decode())
+        offset += length
+
+    while offset < len(data):
+        record_type, time, name_id, length = _RECORD_HEADER.unpack_from(data, offset)
+        offset += _RECORD_HEADER.size
+        payload = data[offset:offset + length]
+        offset += length
+
+        if record_type == RECORD_SWITCH:
+            record_data = payload[0]    # type: Any
+        else:
+            record_data = marshal.loads(payload)
+
+        yield TraceRecord(record_type, time, strings[name_id], record_data)
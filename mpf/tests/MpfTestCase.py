@@ -3,6 +3,7 @@ import copy
 import inspect
 import logging
 import os
+import pickle
 import sys
 import time
 import unittest
@@ -12,7 +13,7 @@ from unittest.mock import *
 import asyncio
 from asyncio import events
 import ruamel.yaml as yaml
-from typing import Any
+from typing import Any, Dict
 
 from mpf.core.logging import LogMixin
 from mpf.core.rgb_color import RGBColor
@@ -80,13 +81,30 @@ class TestMachineController(MachineController):
         self.config = Util.dict_merge(self.config, self.test_config_patches)
 
 
+class SnapshotTestError(AssertionError):
+
+    """Error or failure which happened in a forked test process."""
+
+
 class MpfTestCase(unittest.TestCase):
 
-    """Primary TestCase class used for all MPF unit tests."""
+    """Primary TestCase class used for all MPF unit tests.
+
+    Set ``use_machine_snapshot`` to True in a test class to boot the machine
+    only once per config and class. Every test will then run in a forked
+    process (copy-on-write) of the booted machine. Config patches have to be
+    set in ``__init__`` (not in ``setUp``) for this to work because the
+    machine is booted before ``setUp`` runs. On platforms without
+    ``os.fork`` the tests run as usual.
+    """
+
+    use_machine_snapshot = False
+    _machine_snapshots = None   # type: Dict[Any, Any]
 
     def __init__(self, methodName='runTest'):
         self._get_event_loop = None
         self._get_event_loop2 = None
+        self._machine_snapshot = None
 
         LogMixin.unit_test = True
 
@@ -97,6 +115,8 @@ class MpfTestCase(unittest.TestCase):
         self.machine_config_patches['mpf']['default_platform_hz'] = 100
         self.machine_config_patches['mpf']['plugins'] = list()
         self.machine_config_patches['bcp'] = []
+        # the test loop cannot wait for threads. load assets in the loop
+        self.machine_config_patches['asset_manager'] = {'num_workers': 0}
 
         self.machine_config_defaults = dict()
         self.machine_config_defaults['playfields'] = dict()
@@ -435,6 +455,10 @@ class MpfTestCase(unittest.TestCase):
 
         self.save_and_prepare_sys_path()
 
+        if self._machine_snapshot:
+            self._restore_machine_snapshot()
+            return
+
         # init machine
         machine_path = self.getAbsoluteMachinePath()
 
@@ -465,6 +489,126 @@ class MpfTestCase(unittest.TestCase):
                 raise Exception(self._exception, e)
             raise e
 
+    def _get_machine_snapshot(self):
+        """Return the booted machine for this class and config. Boot it if needed."""
+        cls = self.__class__
+        if cls.__dict__.get("_machine_snapshots") is None:
+            cls._machine_snapshots = {}
+
+        key = (self.getMachinePath(), self.getConfigFile())
+        if key not in cls._machine_snapshots:
+            attributes_before = set(self.__dict__)
+            MpfTestCase.setUp(self)
+            excluded_attributes = {"_exception", "test_start_time", "_sys_path"}
+            cls._machine_snapshots[key] = {k: v for k, v in self.__dict__.items()
+                                           if (k not in attributes_before or k == "machine") and
+                                           k not in excluded_attributes}
+            self.machine = None
+            self.restore_sys_path()
+            asyncio.get_event_loop = self._get_event_loop
+            events.get_event_loop = self._get_event_loop2
+
+        return cls._machine_snapshots[key]
+
+    def _restore_machine_snapshot(self):
+        """Use the machine from the snapshot (in a forked process)."""
+        self.__dict__.update(self._machine_snapshot)
+        self.loop.set_exception_handler(self._exception_handler)
+        # worker threads of the executor did not survive the fork
+        self.loop._default_executor = None
+
+    @classmethod
+    def tearDownClass(cls):
+        snapshots = cls.__dict__.get("_machine_snapshots")
+        if snapshots:
+            for snapshot in snapshots.values():
+                snapshot["machine"]._do_stop()
+            cls._machine_snapshots = None
+        super().tearDownClass()
+
+    def run(self, result=None):
+        """Run test. Fork a booted machine if ``use_machine_snapshot`` is set."""
+        if not self.use_machine_snapshot or not hasattr(os, "fork"):
+            return super().run(result)
+
+        if result is None:
+            result = self.defaultTestResult()
+
+        try:
+            snapshot = self._get_machine_snapshot()
+        # pylint: disable-msg=broad-except
+        except Exception:
+            # boot failed. run the test as usual to report the error
+            return super().run(result)
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # never return from the child. otherwise it would run the rest of the test suite
+            exit_code = 1
+            try:
+                os.close(read_fd)
+                self._machine_snapshot = snapshot
+                child_result = unittest.TestResult()
+                super().run(child_result)
+                outcome = {
+                    "errors": [text for _, text in child_result.errors],
+                    "failures": [text for _, text in child_result.failures],
+                    "skipped": [reason for _, reason in child_result.skipped],
+                    "expected_failures": [text for _, text in child_result.expectedFailures],
+                    "unexpected_successes": len(child_result.unexpectedSuccesses),
+                }
+                with os.fdopen(write_fd, "wb") as f:
+                    pickle.dump(outcome, f)
+                exit_code = 0
+            finally:
+                os._exit(exit_code)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as f:
+            data = f.read()
+        os.waitpid(pid, 0)
+
+        try:
+            outcome = pickle.loads(data) if data else None
+        # pylint: disable-msg=broad-except
+        except Exception:
+            # child died while writing its outcome
+            outcome = None
+
+        result.startTest(self)
+        try:
+            self._report_forked_outcome(result, outcome)
+        finally:
+            result.stopTest(self)
+        return result
+
+    def _report_forked_outcome(self, result, outcome):
+        if outcome is None:
+            result.addError(self, self._get_exc_info("Forked test process died without reporting a result."))
+            return
+
+        for text in outcome["errors"]:
+            result.addError(self, self._get_exc_info(text))
+        for text in outcome["failures"]:
+            result.addFailure(self, self._get_exc_info(text))
+        for reason in outcome["skipped"]:
+            result.addSkip(self, reason)
+        for text in outcome["expected_failures"]:
+            result.addExpectedFailure(self, self._get_exc_info(text))
+        for _ in range(outcome["unexpected_successes"]):
+            result.addUnexpectedSuccess(self)
+
+        if not any(outcome.values()):
+            result.addSuccess(self)
+
+    @staticmethod
+    def _get_exc_info(text):
+        try:
+            raise SnapshotTestError(text)
+        except SnapshotTestError:
+            return sys.exc_info()
+
     def _initialise_machine(self):
         init = Util.ensure_future(self.machine.initialise(), loop=self.loop)
         self._wait_for_start(init, 20)
@@ -0,0 +1,40 @@
+"""Test case which replays traces recorded by the TraceRecorder plugin."""
+from mpf.plugins.trace_recorder import read_trace, RECORD_SWITCH
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class MpfTraceReplayTestCase(MpfTestCase):
+
+    """Replays switch changes from a trace with their original timing.
+
+    Time in the trace is replayed using the TimeTravelLoop so timing bugs can
+    be reproduced in a test without waiting for real time to pass.
+    """
+
+    def _record_posted_event(self, event, ev_type, kwargs):
+        del ev_type, kwargs
+        self._replayed_events.append(event)
+
+    def replay_trace(self, filename):
+        """Replay all switch changes from a trace file.
+
+        Returns:
+            List of all events which have been posted during the replay.
+        """
+        self._replayed_events = []
+        self.machine.register_monitor('events', self._record_posted_event)
+
+        last_time = None
+        for record in read_trace(filename):
+            if record.type != RECORD_SWITCH:
+                continue
+
+            if last_time is not None:
+                self.advance_time_and_run(record.time - last_time)
+            last_time = record.time
+
+            self.machine.switch_controller.process_switch(record.name, record.data, logical=True)
+
+        self.machine_run()
+        self.machine.monitors['events'].discard(self._record_posted_event)
+        return self._replayed_events
@@ -0,0 +1,279 @@
+"""Run unit tests in parallel worker processes.
+
+Tests are sharded per test case class (or per test file for text tests) and
+executed in a pool of worker processes. Every worker gets its own temp dir so
+that the config and show caches (which live in ``tempfile.gettempdir()``) do
+not collide between workers. Results are aggregated in the parent process and
+the slowest tests are reported.
+
+Run the internal suite with ``python -m mpf.tests.parallel -j 4``.
+"""
+import argparse
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+import traceback
+import unittest
+from collections import OrderedDict, namedtuple
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from typing import Dict, Iterable, List, Tuple
+
+TestOutcome = namedtuple("TestOutcome", ["test_id", "outcome", "duration", "details"])
+
+OUTCOME_SUCCESS = "ok"
+OUTCOME_FAILURE = "FAIL"
+OUTCOME_ERROR = "ERROR"
+OUTCOME_SKIP = "skip"
+OUTCOME_EXPECTED_FAILURE = "expected failure"
+OUTCOME_UNEXPECTED_SUCCESS = "unexpected success"
+
+# unit kinds which can be sent to a worker
+UNIT_NAMES = "names"
+UNIT_TEXT_TEST = "text_test"
+
+
+class TimingTestResult(unittest.TestResult):
+
+    """Test result which records the outcome and duration of every test."""
+
+    def __init__(self, stream=None, descriptions=None, verbosity=None):
+        """Initialise timing result."""
+        super().__init__(stream, descriptions, verbosity)
+        self.outcomes = []      # type: List[TestOutcome]
+        self._start_time = 0
+        self._outcome = None   # type: str
+        self._details = ""
+
+    def startTest(self, test):
+        """Start timing a test."""
+        super().startTest(test)
+        self._outcome = OUTCOME_SUCCESS
+        self._details = ""
+        self._start_time = time.perf_counter()
+
+    def stopTest(self, test):
+        """Record outcome and duration of a test."""
+        duration = time.perf_counter() - self._start_time
+        self.outcomes.append(TestOutcome(test.id(), self._outcome, duration, self._details))
+        self._outcome = None
+        super().stopTest(test)
+
+    def addError(self, test, err):
+        """Record error."""
+        super().addError(test, err)
+        self._set_outcome(test, OUTCOME_ERROR, self.errors[-1][1])
+
+    def addFailure(self, test, err):
+        """Record failure."""
+        super().addFailure(test, err)
+        self._set_outcome(test, OUTCOME_FAILURE, self.failures[-1][1])
+
+    def addSubTest(self, test, subtest, err):
+        """Record failing subtests."""
+        super().addSubTest(test, subtest, err)
+        if err is not None:
+            if issubclass(err[0], test.failureException):
+                self._set_outcome(test, OUTCOME_FAILURE, self.failures[-1][1])
+            else:
+                self._set_outcome(test, OUTCOME_ERROR, self.errors[-1][1])
+
+    def addSkip(self, test, reason):
+        """Record skip."""
+        super().addSkip(test, reason)
+        self._set_outcome(test, OUTCOME_SKIP, reason)
+
+    def addExpectedFailure(self, test, err):
+        """Record expected failure."""
+        super().addExpectedFailure(test, err)
+        self._set_outcome(test, OUTCOME_EXPECTED_FAILURE, "")
+
+    def addUnexpectedSuccess(self, test):
+        """Record unexpected success."""
+        super().addUnexpectedSuccess(test)
+        self._set_outcome(test, OUTCOME_UNEXPECTED_SUCCESS, "")
+
+    def _set_outcome(self, test, outcome, details):
+        if self._outcome is None:
+            # errors in setUpClass or tearDownClass are reported outside of a test
+            self.outcomes.append(TestOutcome(test.id(), outcome, 0, details))
+            return
+        if self._outcome in (OUTCOME_FAILURE, OUTCOME_ERROR):
+            return
+        self._outcome = outcome
+        self._details = details
+
+
+def _init_worker(base_dir):
+    """Give this worker its own temp dir for config and show caches."""
+    worker_temp_dir = tempfile.mkdtemp(prefix="worker-", dir=base_dir)
+    os.environ["TMPDIR"] = worker_temp_dir
+    tempfile.tempdir = worker_temp_dir
+
+
+def _build_suite(unit) -> unittest.TestSuite:
+    kind, value = unit
+    if kind == UNIT_NAMES:
+        return unittest.defaultTestLoader.loadTestsFromNames(value)
+    elif kind == UNIT_TEXT_TEST:
+        # pylint: disable-msg=import-outside-toplevel
+        from mpf.tests.MpfDocTestCase import MpfDocTestCase
+        with open(value) as f:
+            test_string = f.read()
+        test = MpfDocTestCase(config_string=test_string)
+        test.id = lambda: value
+        return unittest.TestSuite([test])
+
+    raise AssertionError("Unknown unit kind {}".format(kind))
+
+
+def run_unit(unit) -> "List[TestOutcome]":
+    """Run one shard of tests and return their outcomes."""
+    result = TimingTestResult()
+    try:
+        suite = _build_suite(unit)
+        suite.run(result)
+    except Exception:   # pylint: disable-msg=broad-except
+        result.outcomes.append(TestOutcome(str(unit[1]), OUTCOME_ERROR, 0, traceback.format_exc()))
+
+    return result.outcomes
+
+
+def _run_indexed_unit(indexed_unit):
+    index, unit = indexed_unit
+    return index, run_unit(unit)
+
+
+def _iterate_tests(suite):
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iterate_tests(test)
+        else:
+            yield test
+
+
+def shard_suite(suite: unittest.TestSuite) -> "List[Tuple[str, List[str]]]":
+    """Group all tests in a suite into one unit per test case class."""
+    classes = OrderedDict()     # type: Dict[str, List[str]]
+    for test in _iterate_tests(suite):
+        test_id = test.id()
+        class_name = test_id.rsplit(".", 1)[0]
+        classes.setdefault(class_name, []).append(test_id)
+
+    return [(UNIT_NAMES, names) for names in classes.values()]
+
+
+class ParallelTestRunner(object):
+
+    """Run units of tests in a pool of worker processes."""
+
+    def __init__(self, jobs: int = None, stream=None, verbose=False, slowest=10) -> None:
+        """Initialise runner."""
+        self.jobs = jobs or multiprocessing.cpu_count()
+        self.stream = stream or sys.stderr
+        self.verbose = verbose
+        self.slowest = slowest
+        self.outcomes = []      # type: List[TestOutcome]
+
+    def run(self, units: "Iterable[Tuple[str, object]]") -> "List[TestOutcome]":
+        """Run all units and print a summary."""
+        units = list(units)
+        start_time = time.perf_counter()
+        results = [None] * len(units)
+
+        if self.jobs <= 1:
+            for index, unit in enumerate(units):
+                results[index] = run_unit(unit)
+                self._print_progress(results[index])
+        else:
+            base_dir = tempfile.mkdtemp(prefix="mpf-test-")
+            pool = multiprocessing.Pool(self.jobs, initializer=_init_worker, initargs=(base_dir, ))
+            try:
+                for index, outcomes in pool.imap_unordered(_run_indexed_unit, enumerate(units)):
+                    results[index] = outcomes
+                    self._print_progress(outcomes)
+            finally:
+                pool.terminate()
+                pool.join()
+                shutil.rmtree(base_dir, ignore_errors=True)
+
+        self.outcomes = [outcome for outcomes in results for outcome in outcomes]
+        self._print_summary(time.perf_counter() - start_time)
+        return self.outcomes
+
+    def _print_progress(self, outcomes):
+        for outcome in outcomes:
+            if self.verbose:
+                self.stream.write("{} ... {} ({:.3f}s)\n".format(outcome.test_id, outcome.outcome, outcome.duration))
+            else:
+                self.stream.write({OUTCOME_SUCCESS: ".", OUTCOME_FAILURE: "F", OUTCOME_ERROR: "E",
+                                   OUTCOME_SKIP: "s", OUTCOME_EXPECTED_FAILURE: "x",
+                                   OUTCOME_UNEXPECTED_SUCCESS: "u"}[outcome.outcome])
+        self.stream.flush()
+
+    def _print_summary(self, duration):
+        self.stream.write("\n")
+        for outcome in self.outcomes:
+            if outcome.outcome in (OUTCOME_FAILURE, OUTCOME_ERROR):
+                self.stream.write("=" * 70 + "\n")
+                self.stream.write("{}: {}\n".format(outcome.outcome, outcome.test_id))
+                self.stream.write("-" * 70 + "\n")
+                self.stream.write(outcome.details + "\n")
+
+        if self.slowest:
+            self.stream.write("Slowest tests:\n")
+            for outcome in sorted(self.outcomes, key=lambda x: x.duration, reverse=True)[:self.slowest]:
+                self.stream.write("{:8.3f}s {}\n".format(outcome.duration, outcome.test_id))
+
+        self.stream.write("-" * 70 + "\n")
+        self.stream.write("Ran {} tests in {:.3f}s using {} workers\n\n".format(
+            len(self.outcomes), duration, self.jobs))
+
+        failures = sum(1 for outcome in self.outcomes if outcome.outcome == OUTCOME_FAILURE)
+        errors = sum(1 for outcome in self.outcomes if outcome.outcome == OUTCOME_ERROR)
+        skipped = sum(1 for outcome in self.outcomes if outcome.outcome == OUTCOME_SKIP)
+        if failures or errors:
+            self.stream.write("FAILED (failures={}, errors={})\n".format(failures, errors))
+        else:
+            self.stream.write("OK{}\n".format(" (skipped={})".format(skipped) if skipped else ""))
+
+    def was_successful(self) -> bool:
+        """Return true if all tests passed."""
+        return not any(outcome.outcome in (OUTCOME_FAILURE, OUTCOME_ERROR, OUTCOME_UNEXPECTED_SUCCESS)
+                       for outcome in self.outcomes)
+
+
+def main(args=None):
+    """Discover and run the MPF test suite in parallel."""
+    parser = argparse.ArgumentParser(description='Run MPF tests in parallel')
+    parser.add_argument("-j", type=int, default=None, dest="jobs",
+                        help="Number of worker processes (default: number of CPUs)")
+    parser.add_argument("-s", default=os.path.dirname(os.path.abspath(__file__)), dest="start_dir",
+                        help="Directory to discover tests in")
+    parser.add_argument("-p", default="test*.py", dest="pattern",
+                        help="Pattern to match test files")
+    parser.add_argument("--slowest", type=int, default=10,
+                        help="Number of slowest tests to report")
+    parser.add_argument("-v", default=False, action="store_true", dest="verbose",
+                        help="Verbose output")
+    parser.add_argument("tests", nargs="*",
+                        help="Test names to run (default: discover all tests)")
+    args = parser.parse_args(args)
+
+    if args.tests:
+        suite = unittest.defaultTestLoader.loadTestsFromNames(args.tests)
+    else:
+        top_level_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        suite = unittest.defaultTestLoader.discover(args.start_dir, args.pattern, top_level_dir)
+
+    runner = ParallelTestRunner(args.jobs, verbose=args.verbose, slowest=args.slowest)
+    runner.run(shard_suite(suite))
+    return 0 if runner.was_successful() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,11 @@
 """Test assets."""
+import asyncio
+import threading
 import time
+import unittest
+from unittest.mock import MagicMock
+
+from mpf.core.assets import AssetLoader
 from mpf.tests.MpfTestCase import MpfTestCase
 
 
@@ -23,6 +29,33 @@ class TestAssets(MpfTestCase):
         self._test_conditional_random_asset_group()
         self._test_conditional_sequence_asset_group()
 
+    def test_load_priority_and_cancel(self):
+        self.mock_event("loading_assets")
+        asset_manager = self.machine.asset_manager
+
+        # mode assets load with the priority of the mode
+        self.machine.modes['mode1'].start()
+        self.advance_time_and_run()
+        self.assertTrue(self.machine.shows['show9'].loaded)
+        self.assertEqual(300, self.machine.shows['show9'].priority)
+        self.assertIn("per_second", self._last_event_kwargs["loading_assets"])
+
+        # unloading an asset before it loaded cancels the load
+        self.machine.shows['show5'].load()
+        self.machine.shows['show10'].load()
+        self.machine.shows['show5'].unload()
+        self.advance_time_and_run()
+        self.assertFalse(self.machine.shows['show5'].loaded)
+        self.assertFalse(self.machine.shows['show5'].loading)
+        self.assertTrue(self.machine.shows['show10'].loaded)
+        self.assertEqual(asset_manager.num_assets_to_load, asset_manager.num_assets_loaded)
+        self.assertEqual(0, len(asset_manager.loader))
+
+        # it can be loaded again later
+        self.machine.shows['show5'].load()
+        self.advance_time_and_run()
+        self.assertTrue(self.machine.shows['show5'].loaded)
+
     def _test_machine_wide_asset_loading(self):
 
         # test that the shows asset class gets built correctly
@@ -392,3 +425,75 @@ class TestAssets(MpfTestCase):
         self.assertIs(self.machine.shows['group8'].show, self.machine.shows['show2'])
         self.assertIs(self.machine.shows['group8'].show, self.machine.shows['show3'])
                         
+
+
+class FakeAsset(object):
+
+    def __init__(self, name, priority=0):
+        self.name = name
+        self.priority = priority
+
+    def __repr__(self):
+        return self.name
+
+
+class TestAssetLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.machine = MagicMock()
+        self.machine.clock.loop = self.loop
+        self.loaded = []
+        self.cancelled = []
+
+    def _run_until(self, condition):
+        start = time.time()
+        while not condition() and time.time() < start + 5:
+            self.loop.run_until_complete(asyncio.sleep(.001, loop=self.loop))
+
+    def test_priority_in_loop(self):
+        loads = []
+        loader = AssetLoader(self.machine, 0, loads.append, lambda asset, result: self.loaded.append(asset),
+                             self.cancelled.append)
+        a, b, c, d, e = FakeAsset("a"), FakeAsset("b", 10), FakeAsset("c", 5), FakeAsset("d", 10), FakeAsset("e")
+
+        # a starts right away. the others load by priority and in order of requests
+        for asset in (a, b, c, d, e):
+            loader.add(asset)
+        self.assertEqual(4, len(loader))
+
+        self.assertTrue(loader.cancel(c))
+        self.assertFalse(loader.cancel(c))
+
+        self._run_until(lambda: len(self.loaded) == 4)
+        self.assertEqual([a, b, d, e], loads)
+        self.assertEqual([a, b, d, e], self.loaded)
+        self.assertEqual([], self.cancelled)
+
+    def test_worker_threads(self):
+        release = threading.Event()
+        threads = set()
+
+        def _load(asset):
+            threads.add(threading.get_ident())
+            if asset.name == "a":
+                release.wait(5)
+            return True
+
+        loader = AssetLoader(self.machine, 1, _load, lambda asset, result: self.loaded.append(asset),
+                             self.cancelled.append)
+        self.addCleanup(loader.stop)
+        a, b, c = FakeAsset("a"), FakeAsset("b", 1), FakeAsset("c", 5)
+        loader.add(a)
+        loader.add(b)
+        loader.add(c)
+
+        # a is loading. cancel it
+        self.assertTrue(loader.cancel(a))
+        release.set()
+
+        self._run_until(lambda: len(self.loaded) == 2)
+        self.assertEqual([c, b], self.loaded)
+        self.assertEqual([a], self.cancelled)
+        self.assertNotIn(threading.get_ident(), threads)
@@ -1,4 +1,13 @@
-from mpf.plugins.auditor import Auditor
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from mpf.commands.audits import Command as AuditsCommand, flatten_audits, load_audits
+from mpf.core.file_manager import FileManager
+from mpf.plugins.auditor import Auditor, AuditCounters
 from mpf.tests.MpfTestCase import MpfTestCase
 
 
@@ -86,3 +95,93 @@ class TestAuditor(MpfTestCase):
         self.advance_time_and_run(1)
 
         self.assertEqual(2, auditor.current_audits['switches']['s_test'])
+
+    def test_flush(self):
+        auditor = self.machine.plugins[0]
+        auditor.enable()
+        self.advance_time_and_run(1)
+
+        # counters are published as machine vars once per flush_interval
+        self.machine.switch_controller.process_switch("s_test", 1)
+        self.machine.switch_controller.process_switch("s_test", 0)
+        self.advance_time_and_run(.01)
+        self.machine.switch_controller.process_switch("s_test", 1)
+        self.machine.switch_controller.process_switch("s_test", 0)
+        self.advance_time_and_run(.01)
+        self.assertEqual(2, auditor.counters.get('switches', 's_test'))
+        self.assertEqual(2, auditor.current_audits['switches']['s_test'])
+        self.assertMachineVarEqual(0, "audits_switches_s_test")
+
+        self.advance_time_and_run(1)
+        self.assertMachineVarEqual(2, "audits_switches_s_test")
+
+        auditor.audit('shots', 'test_shot')
+        self.advance_time_and_run(1)
+        self.assertMachineVarEqual(1, "audits_shots_test_shot")
+
+        # audits are saved on shutdown
+        auditor.data_manager.save_all = MagicMock()
+        self.machine.events.post("shutdown")
+        self.advance_time_and_run()
+        data = auditor.data_manager.save_all.call_args[1]["data"]
+        self.assertEqual(2, data['switches']['s_test'])
+        self.assertEqual(1, data['shots']['test_shot'])
+
+
+class TestAuditCounters(unittest.TestCase):
+
+    def test_counters(self):
+        counters = AuditCounters()
+        self.assertEqual(0, counters.add('switches', 's1'))
+        self.assertEqual(1, counters.add('switches', 's2', 5))
+        self.assertEqual(0, counters.add('switches', 's1'))
+
+        counts = counters.get_counts('switches')
+        counts[0] += 1
+        self.assertEqual(6, counters.increment('switches', 's2'))
+        self.assertEqual(1, counters.increment('events', 'e1'))
+        self.assertEqual(1, counters.get('switches', 's1'))
+
+        self.assertEqual([('switches', 's1', 1), ('switches', 's2', 6), ('events', 'e1', 1)],
+                         counters.get_changes())
+        self.assertEqual([], counters.get_changes())
+        self.assertEqual({'switches': {'s1': 1, 's2': 6}, 'events': {'e1': 1}}, counters.to_dict())
+
+
+class TestAuditsCommand(unittest.TestCase):
+
+    def test_export(self):
+        audits = {
+            'events': {},
+            'player': {'score': {'average': 75.5, 'top': [100, 50], 'total': 2}},
+            'shots': {'x:y': 1},
+            'switches': {'s_test': 3, 'a b': 2, '1': 4},
+        }
+        expected = {
+            'events': {},
+            'player': {'score.average': 75.5, 'score.total': 2},
+            'shots': {'x:y': 1},
+            'switches': {'s_test': 3, 'a b': 2, '1': 4},
+        }
+        with tempfile.TemporaryDirectory() as path:
+            filename = os.path.join(path, "audits.yaml")
+            FileManager.save(filename, audits)
+            self.assertEqual(expected, load_audits(filename))
+
+            # falls back to the yaml parser for flow style
+            with open(filename, "w") as f:
+                f.write("switches: {s_test: 3}\n")
+            self.assertEqual({'switches': {'s_test': 3}}, load_audits(filename))
+
+        self.assertEqual(sorted(flatten_audits(audits)),
+                         sorted((category, name, value) for category, values in expected.items()
+                                for name, value in (values.items() or [(None, None)])))
+
+        stream = io.StringIO()
+        AuditsCommand.write(expected, "csv", stream)
+        self.assertEqual("category,name,value\r\nplayer,score.average,75.5\r\nplayer,score.total,2\r\n"
+                         "shots,x:y,1\r\nswitches,1,4\r\nswitches,a b,2\r\nswitches,s_test,3\r\n",
+                         stream.getvalue())
+        stream = io.StringIO()
+        AuditsCommand.write(expected, "json", stream)
+        self.assertEqual(expected, json.loads(stream.getvalue()))
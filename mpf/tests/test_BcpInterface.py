@@ -75,6 +75,72 @@ class TestBcpInterface(MpfBcpTestCase):
         queue = self._bcp_external_client.reset_and_return_queue()
         self.assertFalse(queue)
 
+    def _get_monitored_events(self):
+        return [kwargs["event_name"] for cmd, kwargs in self._bcp_external_client.reset_and_return_queue()
+                if cmd == "monitored_event"]
+
+    def test_monitor_events_filters(self):
+        self._bcp_external_client.send('monitor_start', {'category': 'events', 'match': 'ball_*, Mode_*',
+                                                         'regex': 'tilt$'})
+        self.advance_time_and_run()
+        self._bcp_external_client.reset_and_return_queue()
+
+        for event in ("ball_started", "mode_base_started", "slam_tilt", "tilt_warning", "test1"):
+            self.machine.events.post(event)
+        self.advance_time_and_run()
+        self.assertEqual(["ball_started", "mode_base_started", "slam_tilt"], self._get_monitored_events())
+
+        # sample every third event
+        self._bcp_external_client.send('monitor_start', {'category': 'events', 'sample': '0.34', 'match': 'test*'})
+        self.advance_time_and_run()
+        self._bcp_external_client.reset_and_return_queue()
+        for i in range(6):
+            self.machine.events.post("test{}".format(i))
+        self.advance_time_and_run()
+        self.assertEqual(["test0", "test3"], self._get_monitored_events())
+
+        # at most two events per second
+        self._bcp_external_client.send('monitor_start', {'category': 'events', 'rate': 2, 'match': 'test*'})
+        self.advance_time_and_run()
+        self._bcp_external_client.reset_and_return_queue()
+        for i in range(5):
+            self.machine.events.post("test{}".format(i))
+        self.advance_time_and_run(1)
+        self.assertEqual(["test0", "test1"], self._get_monitored_events())
+        self.machine.events.post("test5")
+        self.advance_time_and_run()
+        self.assertEqual(["test5"], self._get_monitored_events())
+
+        # a new subscription without filters gets all events
+        self._bcp_external_client.send('monitor_start', {'category': 'events'})
+        self.advance_time_and_run()
+        self._bcp_external_client.reset_and_return_queue()
+        self.machine.events.post("other_event")
+        self.assertEqual(["other_event"], self._get_monitored_events())
+
+    def test_monitor_filters_removed_on_disconnect(self):
+        client = self.machine.bcp.transport.get_named_client("local_display")
+        self._bcp_external_client.send('monitor_start', {'category': 'events', 'match': 'ball_*'})
+        self.advance_time_and_run()
+        self.assertIn(client, self.machine.bcp.interface._monitor_filters["_monitor_events"])
+
+        client.exit_on_close = False
+        self.machine.bcp.transport.unregister_transport(client)
+        self.assertNotIn(client, self.machine.bcp.interface._monitor_filters["_monitor_events"])
+
+    def test_monitor_invalid_filters(self):
+        client = self.machine.bcp.transport.get_named_client("local_display")
+        with mock.patch.object(self.machine.bcp.transport, "send_to_client") as send_to_client:
+            for kwargs in ({'category': 'events', 'regex': '('},
+                           {'category': 'events', 'sample': '2'},
+                           {'category': 'core_events', 'match': 'test*'}):
+                self.loop.run_until_complete(
+                    self.machine.bcp.interface._bcp_receive_monitor_start(client=client, **kwargs))
+
+        self.assertEqual(["error"] * 3, [call[0][1] for call in send_to_client.call_args_list])
+        self.assertFalse(self.machine.bcp.transport.get_transports_for_handler("_monitor_events"))
+        self.assertFalse(self.machine.bcp.transport.get_transports_for_handler("_core_events"))
+
     def test_device_monitor(self):
         self.hit_switch_and_run("s_test", .1)
         self.release_switch_and_run("s_test2", .1)
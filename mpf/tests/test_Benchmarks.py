@@ -0,0 +1,63 @@
+"""Test the benchmark suite."""
+import io
+import unittest
+
+from mpf.benchmarks.suite import Benchmark, get_benchmarks, run_benchmark, run_suite, compare_results
+from mpf.commands.benchmark import Command
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def test_get_benchmarks(self):
+        names = [bench.name for bench in get_benchmarks()]
+        self.assertIn("events.post_dispatch", names)
+        self.assertIn("boot.auditor", names)
+        self.assertIn("game.simulated", names)
+
+        self.assertEqual(["bcp.encode", "bcp.decode"], [bench.name for bench in get_benchmarks(["bcp.*"])])
+        macro = get_benchmarks(["macro"])
+        self.assertTrue(macro)
+        self.assertTrue(all(bench.group == "macro" for bench in macro))
+        self.assertEqual([], get_benchmarks(["does_not_exist"]))
+
+    def test_run_benchmark(self):
+        counts = []
+
+        def _bench(count):
+            counts.append(count)
+            return .5 if len(counts) == 1 else .25
+
+        result = run_benchmark(Benchmark("test", _bench, 100, "micro", ""), repeat=3, scale=.5)
+        self.assertEqual([50, 50, 50], counts)
+        self.assertEqual(.25, result["best"])
+        self.assertEqual(.25, result["median"])
+        self.assertEqual(200, result["ops_per_sec"])
+
+        # benchmarks may report their number of operations
+        result = run_benchmark(Benchmark("test", lambda count: (2.0, 1000), 100, "micro", ""), repeat=1)
+        self.assertEqual(1000, result["count"])
+        self.assertEqual(500, result["ops_per_sec"])
+
+    def test_run_suite(self):
+        results = run_suite(get_benchmarks(["bcp.*", "lights.stack", "boot.light"]), repeat=1, scale=.01)
+        self.assertEqual({"bcp.encode", "bcp.decode", "lights.stack", "boot.light"}, set(results["results"]))
+        self.assertIn("mpf_version", results["metadata"])
+        for result in results["results"].values():
+            self.assertGreater(result["ops_per_sec"], 0)
+
+    def test_compare_results(self):
+        baseline = {"results": {"a": {"ops_per_sec": 1000}, "b": {"ops_per_sec": 1000},
+                                "c": {"ops_per_sec": 1000}}}
+        results = {"results": {"a": {"ops_per_sec": 950}, "b": {"ops_per_sec": 800},
+                               "new": {"ops_per_sec": 10}}}
+        comparisons = compare_results(results, baseline, threshold=.1)
+        self.assertEqual(["a", "b"], [comparison.name for comparison in comparisons])
+        self.assertAlmostEqual(-.05, comparisons[0].change)
+        self.assertFalse(comparisons[0].regression)
+        self.assertAlmostEqual(-.2, comparisons[1].change)
+        self.assertTrue(comparisons[1].regression)
+
+        stream = io.StringIO()
+        self.assertFalse(Command.print_comparison(comparisons, stream))
+        self.assertIn("1 regression(s): b", stream.getvalue())
+        self.assertTrue(Command.print_comparison(comparisons[:1], io.StringIO()))
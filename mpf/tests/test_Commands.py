@@ -1,8 +1,12 @@
+import json
+import os
+import shutil
+import tempfile
 from unittest import TestCase
 from unittest.mock import patch
 
 
-from mpf.commands import game, migrate, both
+from mpf.commands import game, migrate, both, diagnosis
 
 
 class TestCommands(TestCase):
@@ -25,3 +29,23 @@ class TestCommands(TestCase):
                 with patch("mpf.commands.migrate.Migrator") as cmd:
                     migrate.Command("test", "machine", "")
                     cmd.assert_called_with("test", "machine")
+
+    def test_diagnosis_templates(self):
+        machine_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, machine_path)
+        os.makedirs(os.path.join(machine_path, "logs"))
+        with open(os.path.join(machine_path, "logs", "template_stats.json"), "w") as f:
+            json.dump({"cache": {"hits": 5, "misses": 2, "size": 2},
+                       "templates": [{"type": "BoolTemplate", "source": "current_player.score > 100",
+                                      "count": 10, "time": 0.002},
+                                     {"type": "IntTemplate", "source": "machine.a + 1", "count": 1, "time": 0.001}]},
+                      f)
+
+        with patch("mpf.commands.diagnosis.sys") as sys:
+            diagnosis.Command("test", machine_path, ["-t", "1"])
+            output = "".join(call[0][0] for call in sys.stdout.write.call_args_list)
+            sys.exit.assert_called_once_with()
+
+        self.assertIn("2 templates, 5 hits, 2 misses", output)
+        self.assertIn("bool   current_player.score > 100", output)
+        self.assertNotIn("machine.a + 1", output)
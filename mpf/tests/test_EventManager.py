@@ -3,7 +3,9 @@ from mpf.core.delays import DelayManager
 from mpf.core.settings_controller import SettingEntry
 from mpf.tests.MpfFakeGameTestCase import MpfFakeGameTestCase
 from mpf.tests.MpfTestCase import MpfTestCase
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
+
+from mpf.core.events import HandlerSpec
 
 
 class TestEventManager(MpfFakeGameTestCase, MpfTestCase):
@@ -341,6 +343,79 @@ class TestEventManager(MpfFakeGameTestCase, MpfTestCase):
         self.assertEqual(tuple(), self._handler2_args)
         self.assertEqual(dict(), self._handler2_kwargs)
 
+    def test_add_handlers(self):
+        handler_a = MagicMock()
+        handler_b = MagicMock()
+        handler_c = MagicMock()
+        handler_d = MagicMock()
+        self.machine.events.add_handler('test_bundle', handler_a, priority=2)
+        self.machine.events.add_handler('test_bundle', handler_b, priority=1)
+
+        keys = self.machine.events.add_handlers([
+            HandlerSpec('test_bundle', handler_c, 1, None, {"a": 1}),
+            HandlerSpec('test_bundle', handler_d, 3, None, {}),
+            HandlerSpec('test_bundle2', handler_c, 1, None, {}),
+        ])
+        self.assertEqual(["test_bundle", "test_bundle", "test_bundle2"], [key.event for key in keys])
+
+        # same order as adding them one by one
+        self.assertEqual([handler_d, handler_a, handler_b, handler_c],
+                         [handler.callback for handler in self.machine.events.registered_handlers['test_bundle']])
+        self.assertEqual({"a": 1}, self.machine.events.registered_handlers['test_bundle'][3].kwargs)
+
+        self.machine.events.remove_handlers_by_keys(keys)
+        self.assertEqual([handler_a, handler_b],
+                         [handler.callback for handler in self.machine.events.registered_handlers['test_bundle']])
+        self.assertFalse(self.machine.events.does_event_exist('test_bundle2'))
+
+    def test_handler_indexes(self):
+        events = self.machine.events
+        handlers = [MagicMock() for _ in range(6)]
+        keys = []
+        for i, handler in enumerate(handlers):
+            keys.append(events.add_handler('test_index', handler, priority=i % 3))
+        keys.append(events.add_handler('test_index2', handlers[0]))
+
+        # same order as a stable sort by priority
+        self.assertEqual([handlers[2], handlers[5], handlers[1], handlers[4], handlers[0], handlers[3]],
+                         [handler.callback for handler in events.registered_handlers['test_index']])
+
+        # remove by callback only touches events of this callback
+        events.remove_handler(handlers[0])
+        self.assertFalse(events.does_event_exist('test_index2'))
+        self.assertEqual(5, len(events.registered_handlers['test_index']))
+
+        events.remove_handler_by_event('test_index', handlers[5])
+        events.remove_handler_by_key(keys[1])
+        # removing twice does nothing
+        events.remove_handler_by_key(keys[1])
+        self.assertEqual([handlers[2], handlers[4], handlers[3]],
+                         [handler.callback for handler in events.registered_handlers['test_index']])
+
+        events.replace_handler('test_index', handlers[4], priority=5)
+        self.assertEqual([handlers[4], handlers[2], handlers[3]],
+                         [handler.callback for handler in events.registered_handlers['test_index']])
+
+        events.remove_handlers_by_keys(keys)
+        events.remove_handler(handlers[4])
+        self.assertFalse(events.does_event_exist('test_index'))
+
+    def test_unhashable_handler(self):
+        class UnhashableHandler(object):
+            __hash__ = None
+
+            def __call__(self, **kwargs):
+                pass
+
+        handler = UnhashableHandler()
+        self.machine.events.add_handler('test_unhashable', handler)
+        self.machine.events.add_handler('test_unhashable2', handler)
+        self.machine.events.remove_handler_by_event('test_unhashable2', handler)
+        self.assertTrue(self.machine.events.does_event_exist('test_unhashable'))
+        self.assertFalse(self.machine.events.does_event_exist('test_unhashable2'))
+        self.machine.events.remove_handler(handler)
+        self.assertFalse(self.machine.events.does_event_exist('test_unhashable'))
+
     def test_does_event_exist(self):
         self.machine.events.add_handler('test_event', self.event_handler1)
 
@@ -478,6 +553,32 @@ class TestEventManager(MpfFakeGameTestCase, MpfTestCase):
         self.assertEqual(self._handlers_called.count(self.queue_callback), 1)
         self.assertEqual(True, self._queue.is_empty())
 
+    def test_queue_event_fast_path(self):
+        # handlers run synchronously until one waits. only then a task is created
+        self.machine.events.add_handler('test_event', self.event_handler1, priority=3)
+        self.machine.events.add_handler('test_event', self.event_handler_add_queue, priority=2)
+        self.machine.events.add_handler('test_event', self.event_handler2, priority=1)
+        self.machine.events.add_handler('test_event2', self.event_handler1)
+
+        self.machine.events.post_queue('test_event2', callback=self.queue_callback)
+        self.machine.events.process_event_queue()
+        self.assertEqual([], self._handlers_called)
+        self.advance_time_and_run(.1)
+        self.assertEqual([self.event_handler1, self.queue_callback], self._handlers_called)
+        self.assertFalse(self.machine.events._queue_tasks)
+
+        self._handlers_called = []
+        self.machine.events.post_queue('test_event', callback=self.queue_callback)
+        self.advance_time_and_run(.1)
+        self.assertEqual([self.event_handler1, self.event_handler_add_queue], self._handlers_called)
+        self.assertEqual(1, len(self.machine.events._queue_tasks))
+
+        self.event_handler_clear_queue()
+        self.advance_time_and_run(.1)
+        self.assertEqual([self.event_handler1, self.event_handler_add_queue, self.event_handler_clear_queue,
+                          self.event_handler2, self.queue_callback], self._handlers_called)
+        self.assertFalse(self.machine.events._queue_tasks)
+
     def test_queue_event_with_no_queue(self):
         # tests that a queue event works and the callback is called right away
         # if no handlers request a wait
@@ -832,6 +933,25 @@ class TestEventManager(MpfFakeGameTestCase, MpfTestCase):
         self.post_event_with_params("test", param=3, a=True)
         self.assertEqual(1, self._called)
 
+    def test_event_ids(self):
+        self._called = 0
+        event_id = self.machine.events.get_event_id("Test_ID")
+        self.assertEqual("test_id", event_id)
+        self.assertIs(event_id, self.machine.events.get_event_id("Test_ID"))
+
+        ids = self.machine.events.get_event_ids("prefix_", "_suffix")
+        self.assertIs(ids, self.machine.events.get_event_ids("prefix_", "_suffix"))
+        self.assertEqual("prefix_name_suffix", ids["Name"])
+
+        self.machine.events.add_handler("test_id", self._handler)
+        self.machine.events.post_by_id(event_id)
+        self.advance_time_and_run()
+        self.assertEqual(1, self._called)
+
+        # conditions are parsed once
+        self.assertIs(self.machine.events.get_event_and_condition_from_string("test_id{param > 1}"),
+                      self.machine.events.get_event_and_condition_from_string("test_id{param > 1}"))
+
     def test_handler_with_settings_condition_invalid_setting(self):
         self._called = 0
         self.machine.events.add_handler("test{settings.test == True}", self._handler)
@@ -0,0 +1,91 @@
+"""Test logging."""
+import logging
+import unittest
+from queue import Queue
+
+from mpf.core.logging import BoundedQueueHandler, create_queue_logging, LogMixin
+
+
+class ListHandler(logging.Handler):
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+
+
+class TestLogging(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = logging.getLogger("TestLogging")
+        self.logger.propagate = False
+        self.logger.setLevel(1)
+
+    def tearDown(self):
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+
+    def test_drop_when_full(self):
+        handler = BoundedQueueHandler(Queue(maxsize=2))
+        self.logger.addHandler(handler)
+
+        self.logger.info("Test %s", 1)
+        self.logger.info("Test %s", 2)
+        self.logger.info("Test %s", 3)
+        self.logger.warning("Test %s", 4)
+
+        self.assertEqual(2, handler.queue.qsize())
+        self.assertEqual(2, handler.dropped_records)
+        self.assertEqual({"INFO": 1, "WARNING": 1}, dict(handler.dropped_records_by_level))
+
+        record = handler.queue.get_nowait()
+        self.assertEqual("Test 1", record.msg)
+        self.assertIsNone(record.args)
+
+    def test_background_logging(self):
+        target = ListHandler()
+        target.setLevel(20)
+        queue_handler, listener = create_queue_logging(target, 10)
+        self.logger.addHandler(queue_handler)
+
+        self.logger.log(21, "Console %s", "message")
+        self.logger.log(11, "File only %s", "message")
+        try:
+            raise ValueError("Test")
+        except ValueError:
+            self.logger.exception("Exception")
+        listener.stop()
+
+        self.assertEqual("Console message", target.messages[0])
+        self.assertTrue(target.messages[1].startswith("Exception\nTraceback"))
+        self.assertEqual(2, len(target.messages))
+
+    def test_log_mixin_without_output(self):
+        mixin = LogMixin()
+        mixin.unit_test = False
+        mixin.configure_logging("TestLogging", "none", "none")
+        handler = BoundedQueueHandler(Queue())
+        self.logger.addHandler(handler)
+
+        mixin.info_log("Test %s", 1)
+        mixin.debug_log("Test %s", 2)
+        self.assertEqual(0, handler.queue.qsize())
+
+        mixin.configure_logging("TestLogging", "basic", "none")
+        mixin.info_log("Test %s", 3)
+        self.assertEqual(1, handler.queue.qsize())
+
+    def test_arguments_are_merged_when_queued(self):
+        handler = BoundedQueueHandler(Queue())
+        self.logger.addHandler(handler)
+
+        value = [1]
+        self.logger.info("Value %s", value)
+        value.append(2)
+
+        record = handler.queue.get_nowait()
+        self.assertEqual("Value [1]", record.msg)
+        self.assertIsNone(record.args)
+        self.assertEqual("Value [1]", record.getMessage())
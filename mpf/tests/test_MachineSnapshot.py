@@ -0,0 +1,59 @@
+"""Test forked machine snapshots in MpfTestCase."""
+import os
+import unittest
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "Machine snapshots need os.fork")
+class TestMachineSnapshot(MpfTestCase):
+
+    use_machine_snapshot = True
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/trace_recorder/'
+
+    def _check_isolation(self):
+        # all tests start with the same machine state
+        self.assertSwitchState("s_test", 0)
+        self.assertEqual(None, self.machine.get_machine_var("snapshot_test"))
+        self.hit_switch_and_run("s_test", 1)
+        self.machine.set_machine_var("snapshot_test", self._testMethodName)
+        self.assertSwitchState("s_test", 1)
+
+    def test_isolation1(self):
+        self._check_isolation()
+
+    def test_isolation2(self):
+        self._check_isolation()
+
+    def test_failure_is_reported(self):
+        class FailingSnapshotTest(TestMachineSnapshot):
+
+            def test_fail(self):
+                self.fail("Snapshot failure")
+
+        result = unittest.TestResult()
+        test = FailingSnapshotTest("test_fail")
+        test.run(result)
+        test.tearDownClass()
+        self.assertEqual(1, result.testsRun)
+        self.assertEqual(1, len(result.failures))
+        self.assertIn("Snapshot failure", result.failures[0][1])
+
+    def test_dying_child_is_reported(self):
+        class DyingSnapshotTest(TestMachineSnapshot):
+
+            def test_die(self):
+                os._exit(3)
+
+        result = unittest.TestResult()
+        test = DyingSnapshotTest("test_die")
+        test.run(result)
+        test.tearDownClass()
+        self.assertEqual(1, result.testsRun)
+        self.assertEqual(1, len(result.errors))
+        self.assertIn("died without reporting a result", result.errors[0][1])
@@ -117,6 +117,19 @@ class TestModes(MpfFakeGameTestCase):
         self.assertEqual(self.machine.modes.attract,
                          self.machine.mode_controller.active_modes[1])
 
+    def test_mode_handlers_are_removed_on_stop(self):
+        handlers_before = {event: list(handlers) for event, handlers in
+                           self.machine.events.registered_handlers.items()}
+
+        self.machine.modes.mode1.start()
+        self.advance_time_and_run()
+        self.assertTrue(self.machine.modes.mode1.event_handlers)
+
+        self.machine.modes.mode1.stop()
+        self.advance_time_and_run()
+        self.assertFalse(self.machine.modes.mode1.event_handlers)
+        self.assertEqual(handlers_before, self.machine.events.registered_handlers)
+
     def test_mode_start_with_callback(self):
         self.mode_start_callback = MagicMock()
 
@@ -0,0 +1,89 @@
+"""Test the parallel test runner."""
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from io import StringIO
+
+from mpf.tests.parallel import ParallelTestRunner, shard_suite, TimingTestResult, UNIT_TEXT_TEST, UNIT_NAMES, \
+    OUTCOME_SUCCESS, OUTCOME_FAILURE, OUTCOME_ERROR, OUTCOME_SKIP
+
+
+EXAMPLE_TESTS = """
+import os
+import tempfile
+import unittest
+
+
+class ExampleTests(unittest.TestCase):
+
+    def test_pass(self):
+        pass
+
+    def test_fail(self):
+        self.fail("Example failure")
+
+    @unittest.skip("Example skip")
+    def test_skip(self):
+        pass
+
+    def test_temp_dir(self):
+        # every worker has its own temp dir
+        self.assertEqual(os.environ["TMPDIR"], tempfile.gettempdir())
+"""
+
+
+class TestParallelRunner(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.tmp_dir, "mpf_parallel_example.py"), "w") as f:
+            f.write(EXAMPLE_TESTS)
+        sys.path.insert(0, self.tmp_dir)
+
+    def tearDown(self):
+        sys.path.remove(self.tmp_dir)
+        sys.modules.pop("mpf_parallel_example", None)
+        shutil.rmtree(self.tmp_dir)
+
+    def test_timing_result(self):
+        result = TimingTestResult()
+        unittest.defaultTestLoader.loadTestsFromNames(
+            ["mpf_parallel_example.ExampleTests.test_pass",
+             "mpf_parallel_example.ExampleTests.test_fail",
+             "mpf_parallel_example.ExampleTests.test_skip"]).run(result)
+
+        self.assertEqual([OUTCOME_SUCCESS, OUTCOME_FAILURE, OUTCOME_SKIP], [x.outcome for x in result.outcomes])
+        self.assertIn("Example failure", result.outcomes[1].details)
+        self.assertTrue(all(x.duration >= 0 for x in result.outcomes))
+
+    def test_shard_suite(self):
+        suite = unittest.defaultTestLoader.loadTestsFromName("mpf_parallel_example")
+        units = shard_suite(suite)
+        self.assertEqual(1, len(units))
+        self.assertEqual(UNIT_NAMES, units[0][0])
+        self.assertEqual(4, len(units[0][1]))
+
+    def test_run_parallel(self):
+        if multiprocessing.current_process().daemon:
+            # pool workers cannot start another pool
+            self.skipTest("Runs in a worker of the parallel runner")
+        units = shard_suite(unittest.defaultTestLoader.loadTestsFromNames(
+            ["mpf_parallel_example.ExampleTests.test_pass",
+             "mpf_parallel_example.ExampleTests.test_temp_dir"]))
+        units.append((UNIT_NAMES, ["mpf_parallel_example.ExampleTests.test_fail"]))
+        # errors while loading a unit are reported for that unit
+        units.append((UNIT_TEXT_TEST, os.path.join(self.tmp_dir, "missing.txt")))
+
+        stream = StringIO()
+        runner = ParallelTestRunner(2, stream=stream, slowest=2)
+        outcomes = runner.run(units)
+
+        self.assertEqual([OUTCOME_SUCCESS, OUTCOME_SUCCESS, OUTCOME_FAILURE, OUTCOME_ERROR],
+                         [x.outcome for x in outcomes])
+        self.assertEqual(os.path.join(self.tmp_dir, "missing.txt"), outcomes[3].test_id)
+        self.assertFalse(runner.was_successful())
+        self.assertIn("Slowest tests:", stream.getvalue())
+        self.assertIn("FAILED (failures=1, errors=1)", stream.getvalue())
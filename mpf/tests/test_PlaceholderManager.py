@@ -103,3 +103,81 @@ class TestPlaceholderManagerWithMachine(MpfFakeGameTestCase):
 
         self.machine.game.player.b = 8
         self.advance_time_and_run()
+
+    def test_subscribe_template(self):
+        self.start_game()
+        template = self.machine.placeholder_manager.build_int_template(
+            "machine.a + current_player.b", 0)
+        values = []
+        subscription = self.machine.placeholder_manager.subscribe_template(template, [], values.append)
+        self.assertEqual([0], values)
+        self.assertTrue(self.machine.placeholder_manager.dependencies.has_listeners(("machine_var", "a")))
+        self.assertTrue(self.machine.placeholder_manager.dependencies.has_listeners(("player", "b")))
+
+        # unrelated changes do not evaluate the template
+        self.machine.set_machine_var("c", 3)
+        self.machine.game.player.a = 7
+        self.advance_time_and_run()
+        self.assertEqual([0], values)
+
+        self.machine.set_machine_var("a", 3)
+        self.advance_time_and_run()
+        self.assertEqual([0, 3], values)
+
+        # multiple changes in one loop iteration cause only one evaluation
+        self.machine.set_machine_var("a", 4)
+        self.machine.game.player.b = 7
+        self.advance_time_and_run()
+        self.assertEqual([0, 3, 11], values)
+
+        # handlers are removed with the last listener
+        subscription.cancel()
+        self.assertFalse(self.machine.placeholder_manager.dependencies.has_listeners(("machine_var", "a")))
+        self.assertFalse(self.machine.events.does_event_exist("machine_var_a"))
+        self.machine.set_machine_var("a", 5)
+        self.advance_time_and_run()
+        self.assertEqual([0, 3, 11], values)
+
+    def test_subscribe_device_attribute(self):
+        template = self.machine.placeholder_manager.build_int_template(
+            "device.playfields.playfield.available_balls", 0)
+        values = []
+        self.machine.placeholder_manager.subscribe_template(template, [], values.append)
+        self.assertEqual([0], values)
+
+        value, future = template.evaluate_and_subscribe([])
+        self.assertEqual(0, value)
+        self.assertFalse(future.done())
+
+        self.machine.playfield.available_balls = 2
+        self.advance_time_and_run()
+        self.assertEqual([0, 2], values)
+        self.assertTrue(future.done())
+
+    def test_template_cache(self):
+        manager = self.machine.placeholder_manager
+        hits = manager.template_cache_hits
+        misses = manager.template_cache_misses
+        template1 = manager.build_bool_template("machine.test_cache_a > 2")
+        template2 = manager.build_bool_template("machine.test_cache_a > 2")
+        # same source but different type or default value
+        template3 = manager.build_int_template("machine.test_cache_a > 2")
+        template4 = manager.build_bool_template("machine.test_cache_a > 2", True)
+        self.assertIs(template1, template2)
+        self.assertIsNot(template1, template3)
+        self.assertIsNot(template1, template4)
+        self.assertEqual(hits + 1, manager.template_cache_hits)
+        self.assertEqual(misses + 3, manager.template_cache_misses)
+
+        manager.enable_template_stats()
+        self.machine.set_machine_var("test_cache_a", 3)
+        self.assertTrue(template1.evaluate([]))
+        self.assertTrue(template2.evaluate([]))
+        self.assertEqual(1, template3.evaluate_with_dependencies([])[0])
+
+        stats = manager.get_template_stats()
+        self.assertEqual(manager.template_cache_hits, stats["cache"]["hits"])
+        self.assertEqual({"type": "BoolTemplate", "source": "machine.test_cache_a > 2", "count": 2},
+                         {k: v for k, v in stats["templates"][0].items() if k != "time"})
+        self.assertEqual("IntTemplate", stats["templates"][1]["type"])
+        self.assertEqual(1, stats["templates"][1]["count"])
@@ -33,3 +33,77 @@ class TestPlayerVars(MpfGameTestCase):
 
         self.assertEqual(4, self.machine.get_machine_var("test1"))
         self.assertEqual('5', self.machine.get_machine_var("test2"))
+
+    def test_batch(self):
+        self.fill_troughs()
+        self.start_game()
+        player = self.machine.game.player
+        self.mock_event("player_score")
+        self.mock_event("player_counter")
+
+        with player.batch():
+            player.score += 100
+            player.score += 200
+            player.counter = 1
+            with player.batch():
+                player.counter += 1
+            self.advance_time_and_run(.1)
+            self.assertEventNotCalled("player_score")
+            self.assertEqual(300, player.score)
+
+        self.advance_time_and_run(.1)
+        self.assertEventCalled("player_score", 1)
+        self.assertEventCalledWith("player_score", value=300, prev_value=0, change=300, player_num=1)
+        self.assertEventCalledWith("player_counter", value=2, prev_value=0, change=2, player_num=1)
+
+        # no event when the net change is zero
+        self.mock_event("player_score")
+        with player.batch():
+            player.score += 100
+            player.score -= 100
+        self.advance_time_and_run(.1)
+        self.assertEventNotCalled("player_score")
+
+    def test_fast_vars(self):
+        self.fill_troughs()
+        self.start_game()
+        player = self.machine.game.player
+        self.mock_event("player_test_fast")
+
+        self.assertNotIn("test_fast", player.fast_vars)
+        self.assertEqual(5, player.fast_vars.get("test_fast", 5))
+        # reading does not create the var
+        self.assertFalse(player.is_player_var("test_fast"))
+
+        player.fast_vars.add("test_fast", 3)
+        player.fast_vars.add("test_fast", 4)
+        self.assertEqual(7, player.test_fast)
+        self.advance_time_and_run(.1)
+        self.assertEventCalled("player_test_fast", 2)
+        self.assertEventCalledWith("player_test_fast", value=7, prev_value=3, change=4, player_num=1)
+
+
+class TestPlayerVarsCoalesce(MpfGameTestCase):
+
+    def getConfigFile(self):
+        return 'player_vars.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/player_vars/'
+
+    def setUp(self):
+        self.machine_config_patches['mpf']['coalesce_player_var_events'] = True
+        super().setUp()
+
+    def test_coalesce_until_end_of_loop_iteration(self):
+        self.fill_troughs()
+        self.start_game()
+        player = self.machine.game.player
+        self.mock_event("player_score")
+
+        player.score += 100
+        player.score += 200
+        self.assertEventNotCalled("player_score")
+        self.advance_time_and_run(.1)
+        self.assertEventCalled("player_score", 1)
+        self.assertEventCalledWith("player_score", value=300, prev_value=0, change=300, player_num=1)
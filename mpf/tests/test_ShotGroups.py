@@ -48,9 +48,27 @@ class TestShotGroups(MpfFakeGameTestCase):
 
         self.assertEventCalled("test_group_hit")
         self.assertEventCalledWith("test_group_complete", state="lit")
+        self.assertEqual({"lit": 4}, self.machine.shot_groups.test_group._state_counts)
+
+        self.machine.shots.shot_1.reset()
+        self.assertEqual({"lit": 3, "unlit": 1}, self.machine.shot_groups.test_group._state_counts)
 
         self.stop_game()
 
+    def test_complete_after_player_var_change(self):
+        self.mock_event("test_group_complete")
+        self.start_game()
+        self.mock_event("test_group_complete")
+
+        # states are changed by writing the player vars directly
+        for shot in ("shot_1", "shot_2", "shot_3"):
+            self.machine.game.player["shot_" + shot] = 1
+        self.advance_time_and_run()
+        self.assertEqual({"lit": 3, "unlit": 1}, self.machine.shot_groups.test_group._state_counts)
+
+        self.hit_and_release_switch("switch_4")
+        self.assertEventCalledWith("test_group_complete", state="lit")
+
     def test_rotate(self):
         self.start_game()
 
@@ -108,6 +126,9 @@ class TestShotGroups(MpfFakeGameTestCase):
         self.assertEqual("lit", self.machine.shots.shot_3.state_name)
         self.assertEqual("lit", self.machine.shots.shot_4.state_name)
 
+        # state counts are maintained on every transition
+        self.assertEqual({"unlit": 2, "lit": 2}, self.machine.shot_groups.test_group._state_counts)
+
     def test_profile_from_shot(self):
         self.start_game()
         self.advance_time_and_run()
@@ -345,6 +345,9 @@ class TestShots(MpfTestCase):
         self.advance_time_and_run(5)
         self.assertLightColor("led_3", "red")
 
+        # the running show is moved to the next step instead of restarted
+        running_show = self.machine.shots.show_in_profile_root.running_show
+
         self.hit_and_release_switch("switch_9")
         self.advance_time_and_run()
         self.assertLightColor("led_3", "orange")
@@ -356,6 +359,14 @@ class TestShots(MpfTestCase):
         self.hit_and_release_switch("switch_9")
         self.advance_time_and_run()
         self.assertLightColor("led_3", "green")
+        self.assertIs(running_show, self.machine.shots.show_in_profile_root.running_show)
+
+        # jumping back reuses it as well
+        self.machine.shots.show_in_profile_root.jump(1)
+        self.advance_time_and_run()
+        self.assertLightColor("led_3", "orange")
+        self.assertIs(running_show, self.machine.shots.show_in_profile_root.running_show)
+        self.machine.shots.show_in_profile_root.jump(3)
 
         # make sure it stays on green
         self.advance_time_and_run(5)
@@ -0,0 +1,119 @@
+"""Test the show cache."""
+import os
+import shutil
+import tempfile
+import unittest
+
+from mpf.core.show_cache import ShowCache
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class TestShowCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmp_dir, "cache")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _create_show_file(self, name, content="x"):
+        filename = os.path.join(self.tmp_dir, name)
+        with open(filename, "w") as f:
+            f.write(content)
+        return filename
+
+    def test_parsed_shows(self):
+        show1 = self._create_show_file("show1.yaml")
+        cache = ShowCache(self.cache_dir)
+        self.assertIsNone(cache.get_parsed(show1))
+
+        cache.put_parsed(show1, [{"duration": 1}])
+        self.assertEqual([{"duration": 1}], cache.get_parsed(show1))
+
+        # a new instance uses the index on disk
+        cache2 = ShowCache(self.cache_dir)
+        self.assertEqual([{"duration": 1}], cache2.get_parsed(show1))
+
+        # the entry is invalidated when the file changes
+        os.utime(show1, (0, 0))
+        self.assertIsNone(cache2.get_parsed(show1))
+        self.assertEqual(0, cache2.size)
+
+    def test_lru_eviction(self):
+        show1 = self._create_show_file("show1.yaml")
+        show2 = self._create_show_file("show2.yaml")
+        show3 = self._create_show_file("show3.yaml")
+        data = ["a" * 1000]
+
+        cache = ShowCache(self.cache_dir, max_size=2500)
+        cache.put_parsed(show1, data)
+        cache.put_parsed(show2, data)
+        # use show1 so that show2 is the least recently used show
+        self.assertEqual(data, cache.get_parsed(show1))
+        cache.put_parsed(show3, data)
+
+        self.assertEqual(data, cache.get_parsed(show1))
+        self.assertIsNone(cache.get_parsed(show2))
+        self.assertEqual(data, cache.get_parsed(show3))
+        # two data files, the index and the lock file
+        self.assertEqual(4, len(os.listdir(self.cache_dir)))
+
+    def test_shared_cache_dir(self):
+        show1 = self._create_show_file("show1.yaml")
+        show2 = self._create_show_file("show2.yaml")
+        data = ["a" * 1000]
+
+        # two processes use the same cache dir
+        cache1 = ShowCache(self.cache_dir, max_size=2500)
+        cache2 = ShowCache(self.cache_dir, max_size=2500)
+        self.assertIsNone(cache1.get_parsed(show1))
+        self.assertIsNone(cache2.get_parsed(show2))
+        cache1.put_parsed(show1, data)
+        cache2.put_parsed(show2, data)
+        cache1.flush()
+
+        # entries of both are in the index
+        cache3 = ShowCache(self.cache_dir, max_size=2500)
+        self.assertEqual(data, cache3.get_parsed(show1))
+        self.assertEqual(data, cache3.get_parsed(show2))
+
+        # data files which are not in the index are removed
+        with open(os.path.join(self.cache_dir, "orphan.mpf_cache"), "wb") as f:
+            f.write(b"x")
+        cache3.flush()
+        self.assertNotIn("orphan.mpf_cache", os.listdir(self.cache_dir))
+        self.assertEqual(4, len(os.listdir(self.cache_dir)))
+
+    def test_validated_steps(self):
+        show1 = self._create_show_file("show1.yaml")
+        show2 = self._create_show_file("show2.yaml")
+        cache = ShowCache(self.cache_dir, max_shows=1)
+        steps = [{"duration": 1}]
+
+        cache.put_steps(show1, steps)
+        self.assertIs(steps, cache.get_steps(show1))
+
+        cache.put_steps(show2, steps)
+        self.assertIsNone(cache.get_steps(show1))
+        self.assertIs(steps, cache.get_steps(show2))
+
+
+class TestShowCacheMachine(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'test_shows.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/shows/'
+
+    def test_reload_uses_validated_steps(self):
+        show = self.machine.shows['test_show1']
+        self.assertTrue(show.loaded)
+        steps = show.show_steps
+
+        show.unload()
+        self.assertFalse(show.loaded)
+        show.do_load()
+        self.assertIs(steps, show.show_steps)
+        self.assertEqual(len(steps), show.total_steps)
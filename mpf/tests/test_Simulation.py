@@ -0,0 +1,93 @@
+"""Test the headless machine simulator."""
+import os
+import unittest
+
+import mpf.core
+from mpf.core.simulation import SimulationMachineController, LatencyHistogram
+from mpf.tests.TestDataManager import TestDataManager
+
+
+class TestSimulationMachineController(SimulationMachineController):
+
+    def create_data_manager(self, config_name):
+        return TestDataManager({})
+
+
+class TestSimulation(unittest.TestCase):
+
+    def _create_machine(self, machine_path, config_file, simulator_config):
+        mpf_path = os.path.abspath(os.path.join(mpf.core.__path__[0], os.pardir))
+        options = {
+            'force_platform': 'smart_virtual',
+            'mpfconfigfile': os.path.join(mpf_path, "mpfconfig.yaml"),
+            'configfile': [config_file],
+            'no_load_cache': False,
+            'create_config_cache': True,
+            'bcp': False,
+            'text_ui': False,
+            'production': False,
+        }
+        return TestSimulationMachineController(mpf_path, os.path.join(mpf_path, machine_path), options,
+                                               simulator_config)
+
+    def _run_simulation(self, **simulator_config):
+        machine = self._create_machine("tests/machine_files/auditor/", "config.yaml", simulator_config)
+        machine.run()
+        return machine
+
+    def test_random_games(self):
+        machine = self._run_simulation(duration=600, seed=1)
+        report = machine.simulator.get_report()
+
+        self.assertAlmostEqual(600, report["virtual_time"], delta=1)
+        self.assertGreater(report["games"], 0)
+        self.assertEqual(report["games"] * 3600 / report["virtual_time"], report["games_per_hour"])
+        self.assertGreater(report["events"], 0)
+        self.assertGreater(report["switch_changes"], 0)
+        self.assertGreater(report["loop_iterations"], 0)
+        self.assertLessEqual(report["latency_p50"], report["latency_max"])
+
+    def test_scripted(self):
+        steps = [
+            {"time": "1s", "switch": "s_start", "action": "hit"},
+            {"time": "2s", "switch": "s_test", "action": "activate"},
+            {"time": "1s", "switch": "s_test", "action": "deactivate"},
+            {"time": "10s", "switch": "s_ball", "action": "activate"},
+        ]
+        machine = self._run_simulation(duration=30, steps=steps)
+        report = machine.simulator.get_report()
+
+        self.assertAlmostEqual(30, report["virtual_time"], delta=1)
+        self.assertEqual(1, report["games"])
+        self.assertEqual(5, report["switch_changes"])
+
+    def test_file_shows(self):
+        machine = self._create_machine("tests/machine_files/shows/", "test_shows.yaml",
+                                       {"duration": 30, "steps": []})
+        machine.initialise_mpf()
+
+        # shows are loaded in the loop. virtual time does not jump ahead while loading
+        self.assertIsNone(machine.asset_manager.loader._executor)
+        self.assertTrue(machine.shows["test_show1"].loaded)
+        self.assertLess(machine.clock.get_time(), 1)
+
+        machine.run_simulation()
+        self.assertAlmostEqual(30, machine.simulator.get_report()["virtual_time"], delta=1)
+
+    def test_invalid_script(self):
+        with self.assertRaises(AssertionError):
+            self._run_simulation(steps=[{"time": "1s", "switch": "s_start", "action": "push"}])
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        self.assertEqual(0, histogram.percentile(50))
+        for i in range(100):
+            histogram.add((i + 1) / 1000000.0)
+
+        self.assertEqual(100, histogram.count)
+        self.assertAlmostEqual(.00005, histogram.percentile(50), delta=.000002)
+        self.assertAlmostEqual(.00009, histogram.percentile(90), delta=.000002)
+        self.assertAlmostEqual(.0001, histogram.percentile(100), delta=.000002)
@@ -50,6 +50,33 @@ class TestSwitchController(MpfTestCase):
         self.hit_switch_and_run("s_test", 1)
         monitor.assert_not_called()
 
+    def test_batched_monitor(self):
+        monitor = MagicMock()
+        self.machine.switch_controller.add_batched_monitor(monitor)
+
+        # all changes in one loop iteration are passed in one call
+        self.machine.switch_controller.process_switch("s_test", 1, True)
+        self.machine.switch_controller.process_switch("s_test", 0, True)
+        self.machine.switch_controller.process_switch("s_test", 1, True)
+        monitor.assert_not_called()
+        self.advance_time_and_run(.1)
+        monitor.assert_called_once_with([
+            MonitoredSwitchChange(name='s_test', label='%', platform=self.machine.default_platform, num='1', state=1),
+            MonitoredSwitchChange(name='s_test', label='%', platform=self.machine.default_platform, num='1', state=0),
+            MonitoredSwitchChange(name='s_test', label='%', platform=self.machine.default_platform, num='1', state=1)])
+        monitor.reset_mock()
+
+        self.release_switch_and_run("s_test", 1)
+        monitor.assert_called_once_with([
+            MonitoredSwitchChange(name='s_test', label='%', platform=self.machine.default_platform, num='1', state=0)])
+        monitor.reset_mock()
+
+        # no more calls after removal. also not for pending changes
+        self.machine.switch_controller.process_switch("s_test", 1, True)
+        self.machine.switch_controller.remove_batched_monitor(monitor)
+        self.advance_time_and_run(.1)
+        monitor.assert_not_called()
+
     def test_wait_futures(self):
         self.hit_switch_and_run("s_test", 1)
         future = self.machine.switch_controller.wait_for_switch("s_test")
@@ -63,7 +90,32 @@ class TestSwitchController(MpfTestCase):
         self.assertTrue(future.done())
 
     def test_verify_switches(self):
-        self.assertTrue(self.machine.switch_controller.verify_switches())
+        switch_controller = self.machine.switch_controller
+        self.assertTrue(switch_controller.verify_switches())
+
+        hw_states = self.loop.run_until_complete(switch_controller.read_hw_switch_states())
+        self.assertEqual(switch_controller.snapshot(), hw_states)
+        self.assertTrue(switch_controller.verify_switches(hw_states))
+
+        # hardware reports a switch active which MPF thinks is inactive
+        s_test_bit = 1 << switch_controller.switches.get_id("s_test")
+        self.assertFalse(switch_controller.verify_switches(hw_states | s_test_bit))
+
+    def test_snapshot(self):
+        switch_controller = self.machine.switch_controller
+        snapshot = switch_controller.snapshot()
+        self.assertEqual([], switch_controller.get_changed_switches(snapshot))
+
+        self.hit_switch_and_run("s_test", 1)
+        self.assertEqual(["s_test"], switch_controller.get_changed_switches(snapshot))
+        self.assertEqual(1, switch_controller.switches["s_test"].state)
+        self.assertEqual(self.machine.clock.get_time() - 1, switch_controller.switches["s_test"].time)
+        snapshot2 = switch_controller.snapshot()
+
+        # switch changed back. the first snapshot matches again
+        self.release_switch_and_run("s_test", 1)
+        self.assertEqual([], switch_controller.get_changed_switches(snapshot))
+        self.assertEqual(["s_test"], switch_controller.get_changed_switches(snapshot2))
 
     def test_is_active_timing(self):
         self.isActive = None
@@ -130,6 +182,28 @@ class TestSwitchController(MpfTestCase):
         self.advance_time_and_run(.1)
         cb.assert_called_with()
 
+    def test_remove_switch_handlers_by_keys(self):
+        cb_active = MagicMock()
+        cb_timed = MagicMock()
+        cb_other = MagicMock()
+        keys = [self.machine.switch_controller.add_switch_handler("s_test", cb_active),
+                self.machine.switch_controller.add_switch_handler("s_test", cb_timed, state=0, ms=250)]
+        self.machine.switch_controller.add_switch_handler("s_test", cb_other)
+
+        self.hit_and_release_switch("s_test")
+        self.advance_time_and_run(.1)
+        # remove the timed handler while it is pending
+        self.machine.switch_controller.remove_switch_handlers_by_keys(keys)
+        self.advance_time_and_run(1)
+        cb_active.assert_called_once_with()
+        cb_timed.assert_not_called()
+
+        self.hit_and_release_switch("s_test")
+        self.advance_time_and_run(1)
+        self.assertEqual(1, cb_active.call_count)
+        self.assertEqual(2, cb_other.call_count)
+        cb_timed.assert_not_called()
+
     def test_activation_and_deactivation_events(self):
         self.mock_event("test_active")
         self.mock_event("test_active2")
@@ -0,0 +1,68 @@
+"""Test the settle tracker of the switch counter."""
+import unittest
+
+from mpf.devices.ball_device.switch_counter import SwitchSettleTracker
+
+
+class TestSwitchSettleTracker(unittest.TestCase):
+
+    def setUp(self):
+        self.tracker = SwitchSettleTracker(["s1", "s2", "s3"], entrance_delay=.5, exit_delay=.2)
+        for switch in ("s1", "s2", "s3"):
+            self.tracker.set_state(switch, 0, -100000)
+        self.tracker.set_state("s3", 1, -100000)
+        self.assertTrue(self.tracker.settle(0))
+
+    def test_settle(self):
+        self.assertTrue(self.tracker.is_stable)
+        self.assertEqual(1, self.tracker.count)
+        self.assertIsNone(self.tracker.next_deadline)
+
+        # a ball enters
+        self.assertEqual(10.5, self.tracker.set_state("s1", 1, 10))
+        self.assertFalse(self.tracker.is_stable)
+        self.assertEqual(["s1"], self.tracker.get_unstable_switches())
+        self.assertFalse(self.tracker.settle(10.4))
+        self.assertEqual(10.5, self.tracker.next_deadline)
+
+        self.assertTrue(self.tracker.settle(10.5))
+        self.assertTrue(self.tracker.is_stable)
+        self.assertEqual(2, self.tracker.count)
+        self.assertEqual(["s1", "s3"], self.tracker.get_active_switches())
+
+        # a ball leaves
+        self.tracker.set_state("s3", 0, 11)
+        self.assertEqual(1, self.tracker.count)
+        self.assertTrue(self.tracker.settle(11.2))
+        self.assertEqual(["s1"], self.tracker.get_active_switches())
+
+    def test_bounce(self):
+        # the switch bounces. only the last change counts
+        self.tracker.set_state("s2", 1, 10)
+        self.tracker.set_state("s2", 0, 10.1)
+        self.tracker.set_state("s2", 1, 10.2)
+        self.assertAlmostEqual(10.7, self.tracker.next_deadline)
+
+        # the deadlines of the earlier changes passed but the switch did not settle yet
+        self.assertFalse(self.tracker.settle(10.6))
+        self.assertFalse(self.tracker.is_stable)
+        self.assertAlmostEqual(10.7, self.tracker.next_deadline)
+
+        self.assertTrue(self.tracker.settle(10.7))
+        self.assertTrue(self.tracker.is_stable)
+        self.assertEqual(["s2", "s3"], self.tracker.get_active_switches())
+
+    def test_multiple_switches(self):
+        self.tracker.set_state("s1", 1, 10)
+        self.tracker.set_state("s3", 0, 10.1)
+        self.assertAlmostEqual(10.3, self.tracker.next_deadline)
+
+        # one switch settled. the other one did not
+        self.assertTrue(self.tracker.settle(10.3))
+        self.assertFalse(self.tracker.is_stable)
+        self.assertEqual(0, self.tracker.count)
+        self.assertEqual(10.5, self.tracker.next_deadline)
+
+        self.assertTrue(self.tracker.settle(10.5))
+        self.assertTrue(self.tracker.is_stable)
+        self.assertEqual(["s1"], self.tracker.get_active_switches())
@@ -0,0 +1,53 @@
+"""Test the bitset backed switch state table."""
+import unittest
+
+from mpf.core.switch_state_table import SwitchStateTable, SwitchState, POWER_ON_TIME, iter_bits
+
+
+class TestSwitchStateTable(unittest.TestCase):
+
+    def setUp(self):
+        self.table = SwitchStateTable()
+        for name in ("s1", "s2", "s3"):
+            self.table.add(name)
+
+    def test_ids(self):
+        self.assertEqual(1, self.table.get_id("s2"))
+        self.assertEqual(1, self.table.add("s2"))
+        self.assertEqual("s3", self.table.get_name(2))
+        self.assertEqual(["s1", "s2", "s3"], list(self.table))
+        self.assertEqual(3, len(self.table))
+        self.assertIn("s1", self.table)
+        self.assertNotIn("s4", self.table)
+
+    def test_states(self):
+        self.assertEqual(SwitchState(0, POWER_ON_TIME), self.table["s1"])
+        self.table.set_state("s3", 1, 10.5)
+        self.assertEqual(SwitchState(1, 10.5), self.table["s3"])
+        self.assertEqual(1, self.table.get_state("s3"))
+        self.assertEqual(10.5, self.table.get_time("s3"))
+        self.assertEqual(0b100, self.table.snapshot())
+
+        self.table.set_state("s3", 0, 11)
+        self.assertEqual(0, self.table.get_state("s3"))
+        self.assertEqual([POWER_ON_TIME, POWER_ON_TIME, 11], list(self.table.get_times()))
+
+        # unknown switches are added
+        self.table.set_state("s4", 1, 12)
+        self.assertEqual(3, self.table.get_id("s4"))
+        self.assertEqual(0b1000, self.table.snapshot())
+
+    def test_diff(self):
+        snapshot = self.table.snapshot()
+        self.table.set_state("s1", 1, 1)
+        self.table.set_state("s3", 1, 1)
+        self.assertEqual(0b101, self.table.diff(snapshot))
+        self.assertEqual(["s1", "s3"], self.table.get_changed_switches(snapshot))
+        self.assertEqual(["s2"], self.table.get_names(self.table.diff(0b111, 0b101)))
+
+        # snapshots do not change
+        self.assertEqual(0, snapshot)
+
+    def test_iter_bits(self):
+        self.assertEqual([], list(iter_bits(0)))
+        self.assertEqual([0, 3, 70], list(iter_bits(1 | 1 << 3 | 1 << 70)))
@@ -0,0 +1,165 @@
+"""Test the text ui."""
+import threading
+from unittest.mock import MagicMock, patch
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+def _patch_screen(test):
+    """Patch the asciimatics screen with a mock and return the mock.
+
+    The threads which open the screen are recorded in ``test.screen_open_threads``.
+    """
+    screen = MagicMock()
+    screen.width = 120
+    screen.height = 40
+    screen.dimensions = (40, 120)
+    screen.has_resized.return_value = False
+    patcher = patch("mpf.core.text_ui.Screen")
+    screen_class = patcher.start()
+    test.addCleanup(patcher.stop)
+    test.screen_open_threads = []
+
+    def _open():
+        test.screen_open_threads.append(threading.current_thread())
+        return screen
+
+    screen_class.open.side_effect = _open
+    return screen
+
+
+class TestTextUi(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/text_ui/'
+
+    def getOptions(self):
+        options = super().getOptions()
+        options['text_ui'] = True
+        return options
+
+    def setUp(self):
+        self.screen = _patch_screen(self)
+        super().setUp()
+
+    def _printed(self, text):
+        return [args for args, _ in self.screen.print_at.call_args_list if args[0] == text]
+
+    def test_render(self):
+        self.advance_time_and_run(1)
+        self.assertTrue(self._printed("s_test2"))
+        self.assertTrue(self._printed("NO GAME IN PROGRESS"))
+
+        # nothing changed. no rows are written
+        self.screen.print_at.reset_mock()
+        self.screen.refresh.reset_mock()
+        self.machine.text_ui._mark_dirty("switches", "modes", "player")
+        self.advance_time_and_run(.5)
+        self.screen.print_at.assert_not_called()
+        self.screen.refresh.assert_not_called()
+
+        # only the row of the changed switch is redrawn (s_test2 and s_test4 are in the next row)
+        self.hit_switch_and_run("s_test", .5)
+        self.assertEqual(1, len(self._printed("s_test")))
+        self.assertTrue(self._printed("s_test3"))
+        self.assertFalse(self._printed("s_test2"))
+        self.assertFalse(self._printed("s_test4"))
+        x, y = self._printed("s_test")[0][1:3]
+        self.screen.print_at.assert_any_call("s_test", x, y, colour=0, bg=2)
+
+        # switch released in another row
+        self.screen.print_at.reset_mock()
+        self.release_switch_and_run("s_test", .5)
+        self.screen.print_at.assert_any_call("s_test", x, y, colour=7, bg=0)
+
+    def test_frame_rate(self):
+        self.advance_time_and_run(1)
+        text_ui = self.machine.text_ui
+        frames = text_ui.frames
+
+        # many changes within one frame end up in a single frame
+        for _ in range(5):
+            self.hit_and_release_switch("s_test")
+            self.hit_switch_and_run("s_test2", .01)
+            self.release_switch_and_run("s_test2", .01)
+        self.hit_switch_and_run("s_test", .001)
+        self.advance_time_and_run(.1)
+        self.assertLessEqual(text_ui.frames - frames, 2)
+
+        # never more than fps frames per second
+        frames = text_ui.frames
+        for _ in range(100):
+            self.hit_switch_and_run("s_test2", .01)
+            self.release_switch_and_run("s_test2", .01)
+        self.assertLessEqual(text_ui.frames - frames, 21)
+
+    def test_resize(self):
+        self.advance_time_and_run(1)
+        self.screen.print_at.reset_mock()
+        self.screen.dimensions = (30, 80)
+        self.screen.width = 80
+        self.screen.height = 30
+        self.screen.has_resized.return_value = True
+        self.advance_time_and_run(1)
+        self.screen.has_resized.return_value = False
+        self.advance_time_and_run(1)
+
+        # everything is drawn again on the new screen
+        self.assertTrue(self._printed("s_test2"))
+        self.assertIn(("<CTRL+C> TO EXIT", 64, 0), [args[:3] for args in self._printed("<CTRL+C> TO EXIT")])
+
+
+class TestThreadedTextUi(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/text_ui/'
+
+    def getOptions(self):
+        options = super().getOptions()
+        options['text_ui'] = True
+        return options
+
+    def setUp(self):
+        self.screen = _patch_screen(self)
+        self.machine_config_patches['text_ui'] = {'fps': 10, 'threaded': True}
+        super().setUp()
+
+    def test_resize(self):
+        text_ui = self.machine.text_ui
+        self.advance_time_and_run(1)
+        self.screen.has_resized.return_value = True
+        self.advance_time_and_run(1)
+        # the worker thread notices the resize
+        text_ui._executor.submit(lambda: None).result(5)
+        self.screen.has_resized.return_value = False
+        self.advance_time_and_run(1)
+
+        # the screen was opened again. always in the main thread because it installs signal handlers
+        self.assertGreaterEqual(len(self.screen_open_threads), 2)
+        for thread in self.screen_open_threads:
+            self.assertIs(threading.main_thread(), thread)
+
+    def test_stop(self):
+        text_ui = self.machine.text_ui
+        self.advance_time_and_run(1)
+        # wait until the worker thread wrote all pending rows
+        text_ui._executor.submit(lambda: None).result(5)
+        self.assertIn("s_test2", [args[0] for args, _ in self.screen.print_at.call_args_list])
+
+        text_ui.stop()
+        self.screen.close.assert_called_once_with(True)
+        self.assertIsNone(text_ui.screen)
+
+        # changes and late resize callbacks after stop do not touch the screen or the executor
+        self.screen.print_at.reset_mock()
+        self.hit_switch_and_run("s_test", 1)
+        text_ui._resized()
+        self.advance_time_and_run(1)
+        self.screen.print_at.assert_not_called()
+        self.screen.close.assert_called_once_with(True)
@@ -353,4 +353,33 @@ class TestTimer(MpfFakeGameTestCase):
         self.advance_time_and_run(0.6)
 
         self.assertEventCalled("timer_timer_player_var_complete")
-        self.machine.events.post('stop_mode_with_timers')
\ No newline at end of file
+        self.machine.events.post('stop_mode_with_timers')
+
+    def test_sync_ticks(self):
+        self.machine.events.post('start_mode_with_timers')
+        self.advance_time_and_run(.1)
+        self.mock_event("timer_timer_sync1_tick")
+        self.mock_event("timer_timer_sync2_tick")
+
+        self.post_event("start_timer_sync1")
+        self.advance_time_and_run(.3)
+        self.post_event("start_timer_sync2")
+        sync1 = self.machine.timers.timer_sync1
+        sync2 = self.machine.timers.timer_sync2
+        # both timers share one group and tick at the same time
+        self.assertEqual(sync1.timer.get_next_call_time(), sync2.timer.get_next_call_time())
+        self.assertEqual(1, self._events["timer_timer_sync1_tick"])
+        self.assertEqual(1, self._events["timer_timer_sync2_tick"])
+
+        # timer_sync2 gets its first tick .7s after it started
+        self.advance_time_and_run(.69)
+        self.assertEqual(1, self._events["timer_timer_sync2_tick"])
+        self.advance_time_and_run(.02)
+        self.assertEqual(2, self._events["timer_timer_sync1_tick"])
+        self.assertEqual(2, self._events["timer_timer_sync2_tick"])
+
+        self.advance_time_and_run(3)
+        self.assertEqual(5, self._events["timer_timer_sync1_tick"])
+        self.assertEqual(5, self._events["timer_timer_sync2_tick"])
+        self.assertEqual(4, sync1.ticks)
+        self.assertEqual(4, sync2.ticks)
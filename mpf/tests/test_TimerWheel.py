@@ -0,0 +1,183 @@
+"""Test the timer wheel."""
+import asyncio
+import unittest
+
+from mpf.core.clock import TimerWheel, TickScheduler
+from mpf.tests.loop import TimeTravelLoop
+
+
+class TestTimerWheel(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = TimeTravelLoop()
+        self.loop.set_time(1000)
+        self.wheel = TimerWheel(self.loop)
+        self.calls = []
+
+    def tearDown(self):
+        self.loop.close()
+
+    def _callback(self, name):
+        self.calls.append((name, self.loop.time()))
+
+    def _run_until(self, time):
+        self.loop.run_until_complete(self._sleep(time - self.loop.time()))
+
+    def _sleep(self, delay):
+        future = asyncio.Future(loop=self.loop)
+        self.loop.call_later(delay, future.set_result, None)
+        return future
+
+    def test_exact_deadlines(self):
+        for delay in (.0005, .0015, .1, 3.2, 70, 300, 20000, 50000):
+            self.wheel.add(delay, self._callback, delay)
+
+        self._run_until(1000 + 60000)
+        self.assertEqual(8, len(self.calls))
+        for name, time in self.calls:
+            self.assertAlmostEqual(1000 + name, time, delta=1e-6)
+        self.assertEqual(0, len(self.wheel))
+
+    def test_order(self):
+        self.wheel.add(.5, self._callback, "b")
+        self.wheel.add(.2, self._callback, "a")
+        self.wheel.add(.5, self._callback, "c")
+        self._run_until(1001)
+        self.assertEqual(["a", "b", "c"], [x[0] for x in self.calls])
+
+    def test_cancel(self):
+        handle1 = self.wheel.add(.1, self._callback, "a")
+        handle2 = self.wheel.add(100, self._callback, "b")
+        self.wheel.add(.2, self._callback, "c")
+        self.assertTrue(self.wheel.cancel(handle1))
+        self.assertTrue(self.wheel.cancel(handle2))
+        self.assertFalse(self.wheel.cancel(handle2))
+        self._run_until(1200)
+        self.assertEqual(["c"], [x[0] for x in self.calls])
+
+    def test_callback_changes_timers(self):
+        handles = {}
+
+        def _first():
+            self._callback("first")
+            # cancel a timer which is due in the same batch
+            self.wheel.cancel(handles["second"])
+            self.wheel.add(0, self._callback, "now")
+            self.wheel.add(.01, self._callback, "later")
+
+        handles["first"] = self.wheel.add(.1, _first)
+        handles["second"] = self.wheel.add(.1, self._callback, "second")
+        self.wheel.add(.105, self._callback, "third")
+        self._run_until(1001)
+
+        self.assertEqual(["first", "now", "third", "later"], [x[0] for x in self.calls])
+        self.assertAlmostEqual(1000.1, self.calls[1][1])
+        self.assertAlmostEqual(1000.11, self.calls[3][1])
+
+    def test_pop(self):
+        handle = self.wheel.add(.1, self._callback, "a")
+        self.assertAlmostEqual(1000.1, self.wheel.get_deadline(handle))
+        self.assertEqual((self._callback, ("a", )), self.wheel.pop(handle))
+        self.assertIsNone(self.wheel.pop(handle))
+        self.assertIsNone(self.wheel.get_deadline(handle))
+
+    def test_periodic_task(self):
+        task = TickScheduler(self.wheel).schedule(lambda: self._callback("tick"), .25)
+        self._run_until(1001.1)
+        self.assertEqual([1000.25, 1000.5, 1000.75, 1001.0], [x[1] for x in self.calls])
+        task.cancel()
+        self._run_until(1002)
+        self.assertEqual(4, len(self.calls))
+        self.assertEqual(0, len(self.wheel))
+
+
+class TestTickScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = TimeTravelLoop()
+        self.loop.set_time(1000)
+        self.wheel = TimerWheel(self.loop)
+        self.scheduler = TickScheduler(self.wheel)
+        self.calls = []
+
+    def tearDown(self):
+        self.loop.close()
+
+    def _run_until(self, time):
+        future = asyncio.Future(loop=self.loop)
+        self.loop.call_at(time, future.set_result, None)
+        self.loop.run_until_complete(future)
+
+    def _task(self, name):
+        return lambda: self.calls.append((name, self.loop.time()))
+
+    def test_shared_wakeup(self):
+        self.scheduler.schedule(self._task("a"), 1)
+        self.scheduler.schedule(self._task("b"), 1)
+        self.scheduler.schedule(self._task("c"), .5)
+        # tasks with the same interval share one timer
+        self.assertEqual(2, len(self.wheel))
+        self.assertEqual(2, len(self.scheduler))
+
+        self._run_until(1001)
+        self.assertEqual([("c", 1000.5), ("a", 1001), ("b", 1001), ("c", 1001)], self.calls)
+
+    def test_phase_locked(self):
+        task1 = self.scheduler.schedule(self._task("a"), 1, phase_locked=True)
+        self._run_until(1000.25)
+        task2 = self.scheduler.schedule(self._task("b"), 1, phase_locked=True)
+        # not phase locked tasks keep their own phase
+        task3 = self.scheduler.schedule(self._task("c"), 1)
+        self.assertEqual(1001, task2.get_next_call_time())
+        self.assertEqual(1001.25, task3.get_next_call_time())
+
+        self._run_until(1002)
+        self.assertEqual([("a", 1001), ("b", 1001), ("c", 1001.25), ("a", 1002), ("b", 1002)], self.calls)
+
+        # the group keeps its phase as long as it has tasks
+        task1.cancel()
+        self._run_until(1002.5)
+        self.scheduler.schedule(self._task("d"), 1, phase_locked=True)
+        self.assertEqual(1003, task2.get_next_call_time())
+
+        # and starts over when the last task is gone
+        task2.cancel()
+        task3.cancel()
+        self.calls = []
+        self.scheduler.schedule(self._task("e"), 1, phase_locked=True)
+        self._run_until(1003.6)
+        self.assertEqual([("d", 1003), ("e", 1003)], self.calls)
+
+    def test_no_drift(self):
+        self.scheduler.schedule(self._task("a"), .1)
+        self._run_until(1100)
+        self.assertEqual(1000, len(self.calls))
+        # tick times are computed from the start and do not accumulate errors
+        self.assertEqual(1000 + 1000 * .1, self.calls[-1][1])
+
+    def test_catch_up(self):
+        self.scheduler.schedule(self._task("a"), .1)
+        self._run_until(1000.15)
+        self.assertEqual(1, len(self.calls))
+
+        # the loop is blocked for a second. all missed ticks run back to back.
+        self.loop.advance_time(1)
+        self._run_until(1001.15)
+        self.assertEqual(11, len(self.calls))
+
+        # afterwards the task is back on its original phase
+        self._run_until(1001.25)
+        self.assertEqual(12, len(self.calls))
+        self.assertAlmostEqual(1001.2, self.calls[-1][1])
+
+    def test_cancel_in_tick(self):
+        tasks = []
+
+        def _cancel_other():
+            self.calls.append(("a", self.loop.time()))
+            tasks[1].cancel()
+
+        tasks.append(self.scheduler.schedule(_cancel_other, 1))
+        tasks.append(self.scheduler.schedule(self._task("b"), 1))
+        self._run_until(1002)
+        self.assertEqual([("a", 1001), ("a", 1002)], self.calls)
@@ -0,0 +1,67 @@
+"""Test trace recorder plugin."""
+import os
+import tempfile
+
+from mpf.plugins.trace_recorder import TraceRecorder, read_trace, RECORD_EVENT, RECORD_SWITCH, RECORD_DRIVER
+from mpf.tests.MpfTraceReplayTestCase import MpfTraceReplayTestCase
+
+
+class TestTraceRecorder(MpfTraceReplayTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/trace_recorder/'
+
+    def setUp(self):
+        self.machine_config_patches['mpf']['plugins'] = ['mpf.plugins.trace_recorder.TraceRecorder']
+        super().setUp()
+        self.recorder = self.machine.plugins[0]
+        self.assertIsInstance(self.recorder, TraceRecorder)
+        self.trace_file = os.path.join(tempfile.mkdtemp(), "test.mpftrace")
+
+    def tearDown(self):
+        if os.path.isfile(self.trace_file):
+            os.remove(self.trace_file)
+        super().tearDown()
+
+    def test_record_and_replay(self):
+        self.recorder.buffer.clear()
+        self.hit_switch_and_run("s_test", .5)
+        self.release_switch_and_run("s_test", .2)
+        self.hit_and_release_switch("s_test2")
+        self.advance_time_and_run()
+
+        self.recorder.dump(self.trace_file)
+        records = list(read_trace(self.trace_file))
+
+        switches = [(r.name, r.data) for r in records if r.type == RECORD_SWITCH]
+        self.assertEqual([("s_test", 1), ("s_test", 0), ("s_test2", 1), ("s_test2", 0)], switches)
+        switch_records = [r for r in records if r.type == RECORD_SWITCH]
+        self.assertAlmostEqual(.5, switch_records[1].time - switch_records[0].time, delta=.01)
+
+        events = [r.name for r in records if r.type == RECORD_EVENT]
+        self.assertIn("s_test_active", events)
+        self.assertIn("test_event", events)
+
+        drivers = [r for r in records if r.type == RECORD_DRIVER]
+        self.assertEqual(1, len(drivers))
+        self.assertEqual("c_test", drivers[0].name)
+        self.assertEqual("pulse", drivers[0].data["action"])
+
+        # replay the trace and compare the posted events
+        replayed_events = self.replay_trace(self.trace_file)
+        self.assertEqual(events, replayed_events)
+
+    def test_ring_buffer(self):
+        for _ in range(600):
+            self.hit_and_release_switch("s_test2")
+
+        self.assertEqual(1000, len(self.recorder.buffer))
+
+    def test_dump_event(self):
+        self.recorder.config['file'] = self.trace_file
+        self.post_event("trace_recorder_dump")
+        self.assertTrue(os.path.isfile(self.trace_file))
+        self.assertTrue(list(read_trace(self.trace_file)))
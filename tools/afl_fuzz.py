@@ -1,9 +1,33 @@
 #!/usr/bin/python3
-"""AFL fuzzer."""
+"""Persistent mode fuzzer for AFL and in-process fuzzers.
+
+The machine is initialised once. Every input is translated into switch toggles,
+time advances and (optional) events. Afterwards, the machine is reset to the
+snapshot taken after setup. Switches, balls in devices, the game state and the
+active modes are restored. If the reset does not reach the snapshot, the machine
+is rebuilt from scratch. Machine vars, player vars and the state of other devices
+are not compared. Inputs may leave them changed for the next input.
+
+Input bytes (without events):
+    0b0sssssss: toggle switch s (sorted by name)
+    0b1ttttttt: advance time by t*t ms
+
+Input bytes (with -e):
+    0b0sssssss: toggle switch s (sorted by name)
+    0b10tttttt: advance time by 4*t*t ms
+    0b11eeeeee: post event e (from the list passed to -e)
+
+Runs as AFL persistent mode target by default. Use --atheris to run with an
+atheris-style in-process fuzzer or --python-loop for a simple mutation loop
+without any fuzzer installed. Both report exec/s.
+"""
 import argparse
 import asyncio
 import os
+import random
 import sys
+import time
+import traceback
 
 import logging
 
@@ -18,7 +42,7 @@ class AflRunner(object):
 
     """AFL fuzzer."""
 
-    def __init__(self, use_virtual):
+    def __init__(self, use_virtual, find_logic_bugs=False, events=None):
         """Initialize fuzzer."""
         self.loop = None
         self.clock = None
@@ -27,11 +51,21 @@ class AflRunner(object):
         self.machine_config_patches['mpf'] = dict()
         self.machine_config_patches['mpf']['default_platform_hz'] = 1
         self.machine_config_patches['bcp'] = []
+        # the time travel loop cannot wait for threads. load assets in the loop
+        self.machine_config_patches['asset_manager'] = {'num_workers': 0}
         self.machine_config_defaults = {}
         self.switch_list = []
         self.use_virtual = use_virtual
+        self.find_logic_bugs = find_logic_bugs
+        self.events = events or []
         self._invalid_input = False
+        self._running = False
         self._exception = None
+        self._machine_path = None
+        self._setup_steps = (False, False, 0)
+        self._snapshot = None
+        self.resets = 0
+        self.rebuilds = 0
 
     def _exception_handler(self, loop, context):
         try:
@@ -83,6 +117,8 @@ class AflRunner(object):
 
     def setUp(self, machine_path):
         """Set up fuzzer."""
+        self._machine_path = machine_path
+        self._exception = None
         self.loop = TimeTravelLoop()
         self.loop.set_exception_handler(self._exception_handler)
         self.clock = TestClock(self.loop)
@@ -115,6 +151,136 @@ class AflRunner(object):
         for switch in self.machine.switches:
             self.machine.switch_controller.process_switch_obj(switch, 0, True)
 
+        if self.find_logic_bugs:
+            self.machine.events.add_handler("balldevice_ball_missing", self._abort)
+            self.machine.events.add_handler("found_new_ball", self._abort)
+            self.machine.events.add_handler("mode_game_stopped", self._abort)
+
+    def prepare(self, add_balls, start_game, wait):
+        """Run setup steps once and take the snapshot which every input starts from."""
+        self._setup_steps = (add_balls, start_game, wait)
+        if add_balls:
+            self.add_balls()
+
+        if start_game:
+            if not add_balls:
+                raise AssertionError("Cannot start game without balls. Use -b")
+            self.start_game()
+
+        if wait > 0:
+            self.advance_time_and_run(wait)
+
+        if start_game and not self.machine.game:
+            raise AssertionError("Failed to start a game.")
+
+        self._snapshot = self._get_state()
+
+    def _get_state(self):
+        """Return switch states, balls in devices, game state and active modes.
+
+        Machine vars are not part of the state because games change some of
+        them (e.g. the score of the last game) on every input.
+        """
+        return (
+            tuple(self.machine.switches[name].hw_state for name in self.switch_list),
+            tuple((device.name, device.balls) for device in self.machine.ball_devices),
+            tuple((playfield.name, playfield.balls) for playfield in self.machine.playfields),
+            bool(self.machine.game),
+            tuple(sorted(mode.name for mode in self.machine.mode_controller.active_modes)),
+        )
+
+    def reset(self):
+        """Reset machine to the snapshot after an input.
+
+        Ends a running game, restores all switches, lets balls settle and
+        starts a new game if the snapshot had one. Rebuilds the machine if the
+        snapshot cannot be reached that way.
+        """
+        self._invalid_input = False
+        if self._exception is None:
+            try:
+                if self._reset_machine():
+                    self.resets += 1
+                    return
+            # pylint: disable-msg=broad-except
+            except Exception:
+                pass
+
+        self.rebuild()
+
+    def _reset_machine(self) -> bool:
+        switch_states, _, _, game_running, _ = self._snapshot
+        if self.machine.game:
+            self.machine.game.end_game()
+        # wait for balls in flight to arrive
+        self.advance_time_and_run(10)
+
+        device_switches = self._drain_playfields()
+
+        for name, state in zip(self.switch_list, switch_states):
+            switch = self.machine.switches[name]
+            if switch.hw_state != state and name not in device_switches:
+                self.machine.switch_controller.process_switch_obj(switch, state, True)
+
+        # let balls settle
+        self.advance_time_and_run(10)
+
+        if game_running and not self.machine.game:
+            self.start_game()
+            self.advance_time_and_run(self._setup_steps[2])
+
+        return self._get_state() == self._snapshot
+
+    def _drain_playfields(self):
+        """Put all balls on playfields back into the troughs and return the names of all trough switches."""
+        device_switches = set()
+        free_switches = []
+        for device in self.machine.ball_devices:
+            if "trough" in device.tags:
+                device_switches.update(switch.name for switch in device.config['ball_switches'])
+                free_switches.extend(switch for switch in device.config['ball_switches'] if not switch.hw_state)
+
+        for playfield in self.machine.playfields:
+            for _ in range(playfield.balls):
+                if free_switches:
+                    self.machine.switch_controller.process_switch_obj(free_switches.pop(), 1, True)
+
+        return device_switches
+
+    def rebuild(self):
+        """Throw away the machine and its loop and set up a new one."""
+        self._cancel_tasks()
+        try:
+            self.machine.shutdown()
+        # pylint: disable-msg=broad-except
+        except Exception:
+            pass
+        if not self.loop.is_closed():
+            # shutdown failed before closing the loop
+            self.loop.close()
+        self.setUp(self._machine_path)
+        self.prepare(*self._setup_steps)
+        self.rebuilds += 1
+
+    def _cancel_tasks(self):
+        """Cancel all pending tasks of the loop and wait until they are done.
+
+        This has to happen before the loop is closed because cancelling
+        schedules callbacks in the loop.
+        """
+        if self.loop.is_closed():
+            return
+        tasks = [task for task in asyncio.Task.all_tasks(loop=self.loop) if not task.done()]
+        for task in tasks:
+            task.cancel()
+        if not tasks:
+            return
+        try:
+            self.loop.run_until_complete(asyncio.gather(*tasks, loop=self.loop, return_exceptions=True))
+        # pylint: disable-msg=broad-except
+        except Exception:
+            pass
+
     def add_balls(self):
         """Add balls."""
         for device in self.machine.ball_devices:
@@ -137,35 +303,54 @@ class AflRunner(object):
     def _abort(self, **kwargs):
         """Abort fuzzer run."""
         del kwargs
-        self._invalid_input = True
+        if self._running:
+            self._invalid_input = True
+
+    def _decode(self, action):
+        """Return (kind, value) of an input byte."""
+        if not action & 0b10000000:
+            return "switch", int(action & 0b01111111)
 
-    def run(self, actions, find_logic_bugs):
+        if not self.events:
+            ms = int(action & 0b01111111)
+            return "time", ms * ms
+
+        if action & 0b01000000:
+            return "event", int(action & 0b00111111)
+
+        ms = int(action & 0b00111111)
+        return "time", ms * ms * 4
+
+    def run(self, actions):
         """Run fuzzer."""
-        if find_logic_bugs:
-            self.machine.events.add_handler("balldevice_ball_missing", self._abort)
-            self.machine.events.add_handler("found_new_ball", self._abort)
-            self.machine.events.add_handler("mode_game_stopped", self._abort)
+        self._running = True
+        try:
+            self._run_actions(actions)
+        finally:
+            self._running = False
 
+    def _run_actions(self, actions):
         for action in actions:
             if self._invalid_input:
                 # bail out if we hit an invalid input. afl will notice this
                 return
 
-            if action & 0b10000000:
-                ms = int(action & 0b01111111)
-                ms *= ms
-                self.advance_time_and_run(ms / 1000.0)
+            kind, value = self._decode(action)
+            if kind == "time":
+                self.advance_time_and_run(value / 1000.0)
+            elif kind == "event":
+                if value < len(self.events):
+                    self.machine.events.post(self.events[value])
+                    self.machine.events.process_event_queue()
             else:
-                switch = int(action & 0b01111111)
-                if switch >= len(self.switch_list):
+                if value >= len(self.switch_list):
                     continue
-                switch_obj = self.machine.switches[self.switch_list[switch]]
+                switch_obj = self.machine.switches[self.switch_list[value]]
                 state = switch_obj.hw_state ^ 1
-                # print(switch_list[switch], state, switch_obj.hw_state)
                 self.machine.switch_controller.process_switch_by_num(switch_obj.hw_switch.number, state,
                                                                      self.machine.default_platform)
 
-        if find_logic_bugs:
+        if self.find_logic_bugs:
             self.advance_time_and_run(60)
             if self._invalid_input:
                 # might happen late
@@ -175,7 +360,7 @@ class AflRunner(object):
             for playfield in self.machine.playfields:
                 balls += playfield.balls
 
-            if balls != self.machine.game.balls_in_play:
+            if self.machine.game and balls != self.machine.game.balls_in_play:
                 print("Balls in play:", self.machine.game.balls_in_play)
                 print("Playfields:")
                 for playfield in self.machine.playfields:
@@ -205,21 +390,133 @@ class AflRunner(object):
             print("Advance time {}s".format(wait))
 
         for action in actions:
-            if action & 0b10000000:
-                ms = int(action & 0b01111111)
-                ms *= ms
-                print("Advance time by {} ms".format(ms))
+            kind, value = self._decode(action)
+            if kind == "time":
+                print("Advance time by {} ms".format(value))
+            elif kind == "event":
+                if value < len(self.events):
+                    print("Post event {}".format(self.events[value]))
+                    self.machine.events.post(self.events[value])
+                    self.machine.events.process_event_queue()
             else:
-                switch = int(action & 0b01111111)
-                if switch >= len(self.switch_list):
+                if value >= len(self.switch_list):
                     continue
-                switch_obj = self.machine.switches[self.switch_list[switch]]
+                switch_obj = self.machine.switches[self.switch_list[value]]
                 state = switch_obj.hw_state ^ 1
-                # print(switch_list[switch], state, switch_obj.hw_state)
                 print("Toggle switch {}. New state: {}".format(switch_obj.name, state))
                 self.machine.switch_controller.process_switch_by_num(switch_obj.hw_switch.number, state,
                                                                      self.machine.default_platform)
 
+
+class ExecReporter(object):
+
+    """Count executions and print exec/s."""
+
+    def __init__(self, runner, interval=5.0):
+        """Initialise reporter."""
+        self.runner = runner
+        self.interval = interval
+        self.execs = 0
+        self.crashes = 0
+        self._start = time.perf_counter()
+        self._last_report = self._start
+
+    def executed(self):
+        """Count one execution and report if the interval passed."""
+        self.execs += 1
+        now = time.perf_counter()
+        if now - self._last_report >= self.interval:
+            self._last_report = now
+            self.report()
+
+    def report(self):
+        """Print stats to stderr."""
+        duration = max(time.perf_counter() - self._start, 1e-9)
+        print("execs: {} exec/s: {:.1f} resets: {} rebuilds: {} crashes: {}".format(
+            self.execs, self.execs / duration, self.runner.resets, self.runner.rebuilds, self.crashes),
+            file=sys.stderr, flush=True)
+
+
+def run_afl(runner, iterations):
+    """Run inputs from AFL in persistent mode."""
+    import afl  # NOQA
+    while afl.loop(iterations):
+        try:
+            sys.stdin.buffer.seek(0)
+        except OSError:
+            pass
+        runner.run(sys.stdin.buffer.read(-1))
+        runner.reset()
+
+    os._exit(0)  # NOQA
+
+
+def run_atheris(runner):
+    """Run inputs from atheris. Exceptions are reported as crashes by atheris."""
+    import atheris  # NOQA
+    reporter = ExecReporter(runner)
+
+    def _test_one_input(data):
+        runner.run(data)
+        runner.reset()
+        reporter.executed()
+
+    atheris.Setup(sys.argv[:1], _test_one_input)
+    atheris.Fuzz()
+
+
+def _mutate(rand, data, corpus):
+    """Return a mutated copy of data."""
+    data = bytearray(data)
+    for _ in range(rand.randint(1, 4)):
+        mutation = rand.randrange(5)
+        if mutation == 0 and data:
+            data[rand.randrange(len(data))] ^= 1 << rand.randrange(8)
+        elif mutation == 1:
+            data.insert(rand.randint(0, len(data)), rand.randrange(256))
+        elif mutation == 2 and data:
+            del data[rand.randrange(len(data))]
+        elif mutation == 3:
+            data.extend(rand.randrange(256) for _ in range(rand.randint(1, 8)))
+        elif corpus:
+            other = rand.choice(corpus)
+            data = data[:rand.randint(0, len(data))] + other[rand.randint(0, len(other)):]
+    return bytes(data[:1024])
+
+
+def run_python_loop(runner, iterations, seed, corpus_dir, crash_dir):
+    """Fuzz with random mutations of a corpus without any fuzzer installed."""
+    rand = random.Random(seed)
+    corpus = []
+    if corpus_dir:
+        for file_name in sorted(os.listdir(corpus_dir)):
+            with open(os.path.join(corpus_dir, file_name), "rb") as f:
+                corpus.append(f.read())
+    if not corpus:
+        corpus.append(b"")
+
+    reporter = ExecReporter(runner)
+    while not iterations or reporter.execs < iterations:
+        data = _mutate(rand, rand.choice(corpus), corpus)
+        try:
+            runner.run(data)
+        # pylint: disable-msg=broad-except
+        except Exception:
+            reporter.crashes += 1
+            traceback.print_exc()
+            if crash_dir:
+                os.makedirs(crash_dir, exist_ok=True)
+                with open(os.path.join(crash_dir, "crash-{}".format(reporter.execs)), "wb") as f:
+                    f.write(data)
+            runner.rebuild()
+        else:
+            runner.reset()
+        reporter.executed()
+
+    reporter.report()
+    return reporter.crashes
+
+
 parser = argparse.ArgumentParser(
     description='Fuzz MPF using AFL')
 
@@ -241,7 +538,7 @@ parser.add_argument("-b",
 
 parser.add_argument("-w",
                     action="store", dest="wait", default=0,
-                    help="Run machine for x seconds before forking")
+                    help="Run machine for x seconds before taking the snapshot")
 
 parser.add_argument("-G",
                     action="store_true", dest="start_game",
@@ -255,6 +552,34 @@ parser.add_argument("-v",
                     action="store_true", dest="use_virtual",
                     help="Use virtual instead of smart_virtual for low-level fuzzing")
 
+parser.add_argument("-e",
+                    action="store", dest="events", default=None,
+                    help="Comma-separated list of events which inputs may post")
+
+parser.add_argument("-n",
+                    action="store", dest="iterations", type=int, default=1000,
+                    help="Inputs per AFL persistent loop or total inputs of --python-loop (0 = forever)")
+
+parser.add_argument("--atheris",
+                    action="store_true", dest="atheris",
+                    help="Run in-process with atheris instead of AFL")
+
+parser.add_argument("--python-loop",
+                    action="store_true", dest="python_loop",
+                    help="Run a random mutation loop without AFL or atheris")
+
+parser.add_argument("-i",
+                    action="store", dest="corpus", default=None,
+                    help="Folder with seed inputs for --python-loop")
+
+parser.add_argument("-o",
+                    action="store", dest="crashes", default=None,
+                    help="Folder to store crashing inputs of --python-loop")
+
+parser.add_argument("--seed",
+                    action="store", dest="seed", type=int, default=None,
+                    help="Seed for --python-loop")
+
 parser.add_argument("machine_path", help="Path of the machine folder",
                     default=None, nargs='?')
 
@@ -269,7 +594,8 @@ else:
 if args.unit_test:
     LogMixin.unit_test = True
 
-runner = AflRunner(use_virtual=args.use_virtual)
+runner = AflRunner(use_virtual=args.use_virtual, find_logic_bugs=args.find_logic_bugs,
+                   events=Util.string_to_list(args.events) if args.events else None)
 runner.setUp(args.machine_path)
 
 if args.dump:
@@ -277,31 +603,15 @@ if args.dump:
     runner.dump(int(args.wait), args.add_balls, args.start_game, action_str)
     os._exit(-1)    # NOQA
 
-if args.add_balls:
-    runner.add_balls()
+# everything until here executes only once. every input starts from this snapshot
+runner.prepare(args.add_balls, args.start_game, int(args.wait))
 
-if args.start_game:
-    if not args.add_balls:
-        raise AssertionError("Cannot start game without balls. Use -b")
-    runner.start_game()
-
-if int(args.wait) > 0:
-    runner.advance_time_and_run(int(args.wait))
-
-if args.start_game and not runner.machine.game:
-    raise AssertionError("Failed to start a game.")
-
-# keep effort minimal after those two lines. everything before this will execute only once.
-# everything after this on every run
-
-import afl  # NOQA
-afl.init()
-
-action_str = sys.stdin.buffer.read(-1)
-
-runner.run(action_str, args.find_logic_bugs)
-
-if args.debug:
+if args.atheris:
+    run_atheris(runner)
+elif args.python_loop:
+    sys.exit(1 if run_python_loop(runner, args.iterations, args.seed, args.corpus, args.crashes) else 0)
+elif args.debug:
+    runner.run(sys.stdin.buffer.read(-1))
     runner.advance_time_and_run(10)
 else:
-    os._exit(0)  # NOQA
+    run_afl(runner, args.iterations)